@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
-import argparse
+import gzip
+import hashlib
+import http.client
+import io
 import json
 import os
+import re
 import sys
 import time
 import urllib.error
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+
+try:  # orjson is optional: the workflow runs this script on the runner's bare python3
+    import orjson
+
+    def json_dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+    json_loads = orjson.loads
+except ImportError:
+
+    def json_dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
 
 SYSTEM_PROMPT = """You are a futures analyst grounded in Kent Beck's "Tidy First" philosophy.
 You evaluate code changes through the lens of software design options:
@@ -40,6 +59,102 @@ MAX_CHUNK_DIFF_CHARS = 8_000  # per diff chunk sent to LLM
 MAX_CHUNKS = 5  # cap on total API calls; excess diff is marked omitted
 FILE_TRUNCATION_MARKER = "\n... (file diff truncated)\n"
 DIFF_OMISSION_MARKER = "\n... (remaining diff omitted to keep chunk and API-call caps)\n"
+DIFF_PATH = "/tmp/pr.diff"
+# Changed paths that never need an LLM assessment (override with TIDY_PILOT_SKIP_PATHS).
+DEFAULT_SKIP_PATHS = r"\.(md|rst|txt|lock)$"
+COMMENT_PREFIXES = ("#", "//")
+VERDICT_ICONS = {"expand": "\U0001f7e2", "narrow": "\U0001f534", "neutral": "⚪"}
+
+# Kept-alive HTTPS connections, one per host, reused across all requests in a run.
+_CONNECTIONS: dict[str, http.client.HTTPSConnection] = {}
+
+
+def _send(method: str, url: str, headers: dict[str, str], body: bytes | None) -> http.client.HTTPResponse:
+    """Send a request over the cached connection for the URL's host, reopening it once if stale."""
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    for attempt in range(2):
+        conn = _CONNECTIONS.get(parts.netloc)
+        if conn is None:
+            conn = _CONNECTIONS[parts.netloc] = http.client.HTTPSConnection(parts.netloc)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            return conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            del _CONNECTIONS[parts.netloc]
+            if attempt:
+                raise
+    raise AssertionError("unreachable")
+
+
+def http_request(method: str, url: str, *, headers: dict[str, str], body: bytes | None = None) -> tuple[int, bytes]:
+    """Send a request over a cached keep-alive connection and return (status, body).
+
+    The LLM chunk calls and the sticky-comment GET/POST each hit the same host
+    several times per run, so the TCP + TLS handshake is paid once per host.
+    A connection the server has already closed is reopened once. Responses with
+    status >= 400 raise urllib.error.HTTPError, matching urlopen semantics.
+    """
+    resp = _send(method, url, {**headers, "Accept-Encoding": "gzip"}, body)
+    data = resp.read()
+    if resp.headers.get("Content-Encoding") == "gzip":
+        data = gzip.decompress(data)
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(data))
+    return resp.status, data
+
+
+def http_stream_lines(method: str, url: str, *, headers: dict[str, str], body: bytes | None = None) -> Iterator[bytes]:
+    """Like http_request, but yield the response body line by line as it arrives."""
+    resp = _send(method, url, headers, body)
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(resp.read()))
+    try:
+        while line := resp.readline():
+            yield line
+    finally:
+        resp.read()  # drain any remainder so the keep-alive connection stays reusable
+
+
+def read_sse_content(lines: Iterable[bytes]) -> str:
+    """Join the ``delta.content`` pieces of a streamed chat-completion (server-sent events) response."""
+    parts: list[str] = []
+    for line in lines:
+        line = line.strip()
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        choices = json_loads(data).get("choices") or []
+        if choices:
+            parts.append(choices[0].get("delta", {}).get("content") or "")
+    return "".join(parts)
+
+
+def _llm_cache_path(backend: str, model: str, system: str, user: str) -> Path | None:
+    """Return the response-cache file for this exact request, or None when caching is off.
+
+    The cache lives in TIDY_PILOT_CACHE_DIR (or $RUNNER_TEMP/tidy-pilot-cache on
+    Actions runners), keyed by a hash of backend, model and both prompts, so a
+    re-run over an unchanged diff chunk reuses the earlier verdict instead of
+    paying another LLM round trip.
+    """
+    cache_dir = os.environ.get("TIDY_PILOT_CACHE_DIR")
+    if not cache_dir and os.environ.get("RUNNER_TEMP"):
+        cache_dir = os.path.join(os.environ["RUNNER_TEMP"], "tidy-pilot-cache")
+    if not cache_dir:
+        return None
+    key = hashlib.sha256("\0".join((backend, model, system, user)).encode()).hexdigest()
+    return Path(cache_dir) / f"{key}.json"
+
+
+def _write_llm_cache(path: Path, result: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(json_dumps(result))
+    os.replace(tmp, path)
 
 
 def call_llm(system: str, user: str, *, max_retries: int = 3) -> dict:
@@ -52,9 +167,18 @@ def call_llm(system: str, user: str, *, max_retries: int = 3) -> dict:
         api_key = os.environ.get("OPENAI_API_KEY", "")
         base_url = "https://api.openai.com/v1/chat/completions"
         model = os.environ.get("TIDY_PILOT_MODEL", "gpt-4o-mini")
+    cache_path = _llm_cache_path(backend, model, system, user)
+    if cache_path is not None and cache_path.exists():
+        try:
+            cached = json_loads(cache_path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            cached = None
+        if isinstance(cached, dict):
+            print("  cache hit — reusing previous assessment")
+            return cached
     if not api_key:
         raise RuntimeError(f"API key not set for backend '{backend}'")
-    payload = json.dumps(
+    payload = json_dumps(
         {
             "model": model,
             "messages": [
@@ -62,21 +186,18 @@ def call_llm(system: str, user: str, *, max_retries: int = 3) -> dict:
                 {"role": "user", "content": user},
             ],
             "temperature": 0.3,
+            "stream": True,
         }
-    ).encode()
+    )
 
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
     for attempt in range(max_retries + 1):
-        req = Request(
-            base_url,
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            },
-        )
         try:
-            with urlopen(req) as resp:
-                data = json.loads(resp.read())
+            # Streamed so a slow tail surfaces as it happens instead of after one blocking read.
+            content = read_sse_content(http_stream_lines("POST", base_url, headers=headers, body=payload))
             break
         except urllib.error.HTTPError as e:
             if e.code == 429 and attempt < max_retries:
@@ -86,28 +207,36 @@ def call_llm(system: str, user: str, *, max_retries: int = 3) -> dict:
             else:
                 raise
 
-    content = data["choices"][0]["message"]["content"]
     # Strip markdown fences if present
     if content.startswith("```"):
         content = content.split("\n", 1)[1] if "\n" in content else content
         if content.endswith("```"):
             content = content[:-3]
         content = content.strip()
-    return json.loads(content)
+    result = json_loads(content)
+    if cache_path is not None:
+        _write_llm_cache(cache_path, result)
+    return result
+
 
+def iter_file_sections(lines: Iterable[str], max_chars: int) -> Iterator[str]:
+    """Yield per-file diff sections split on 'diff --git' boundaries, each capped at max_chars.
 
-def split_diff_by_file(diff: str) -> list[str]:
-    """Split a unified diff into per-file sections on 'diff --git' boundaries."""
-    sections: list[str] = []
+    Lines past a section's cap are skipped instead of buffered, so a huge file
+    diff streamed from disk costs O(max_chars) memory rather than its full size.
+    """
     current: list[str] = []
-    for line in diff.splitlines(keepends=True):
+    size = 0
+    for line in lines:
         if line.startswith("diff --git") and current:
-            sections.append("".join(current))
+            yield truncate_with_marker("".join(current), max_chars, FILE_TRUNCATION_MARKER)
             current = []
-        current.append(line)
+            size = 0
+        if size <= max_chars:
+            current.append(line)
+            size += len(line)
     if current:
-        sections.append("".join(current))
-    return sections
+        yield truncate_with_marker("".join(current), max_chars, FILE_TRUNCATION_MARKER)
 
 
 def truncate_with_marker(text: str, max_chars: int, marker: str) -> str:
@@ -119,39 +248,59 @@ def truncate_with_marker(text: str, max_chars: int, marker: str) -> str:
     return text[: max_chars - len(marker)] + marker
 
 
-def chunk_diff(diff: str, max_chars: int, *, max_chunks: int = MAX_CHUNKS) -> list[str]:
-    """Group per-file diff sections without exceeding max_chars per chunk.
+def chunk_diff_lines(lines: Iterable[str], max_chars: int, *, max_chunks: int = MAX_CHUNKS) -> list[str]:
+    """Group per-file diff sections from an iterable of lines without exceeding max_chars per chunk.
 
     Individual file diffs are truncated to max_chars, then packed greedily.
     If the full diff still needs more than max_chunks API calls, remaining
-    diff content is explicitly omitted in the final capped chunk.
+    diff content is explicitly omitted in the final capped chunk and the
+    rest of ``lines`` is never consumed.
     """
     if max_chars <= 0:
         raise ValueError("max_chars must be positive")
     if max_chunks <= 0:
         raise ValueError("max_chunks must be positive")
 
-    file_sections = split_diff_by_file(diff)
-    if not file_sections:
-        return [""]
-
     chunks: list[str] = []
     current = ""
-    for section in file_sections:
-        section = truncate_with_marker(section, max_chars, FILE_TRUNCATION_MARKER)
+    overflow = False
+    for section in iter_file_sections(lines, max_chars):
         if current and len(current) + len(section) > max_chars:
+            if len(chunks) == max_chunks:
+                overflow = True
+                break
             chunks.append(current)
             current = ""
         current += section
-    if current:
-        chunks.append(current)
+    if current and not overflow:
+        if len(chunks) == max_chunks:
+            overflow = True
+        else:
+            chunks.append(current)
+    if not chunks:
+        return [""]
 
-    if len(chunks) > max_chunks:
-        chunks = chunks[:max_chunks]
+    if overflow:
         chunks[-1] = truncate_with_marker(chunks[-1] + DIFF_OMISSION_MARKER, max_chars, DIFF_OMISSION_MARKER)
     return chunks
 
 
+def chunk_diff(diff: str, max_chars: int, *, max_chunks: int = MAX_CHUNKS) -> list[str]:
+    """Group per-file sections of an in-memory diff; see chunk_diff_lines."""
+    return chunk_diff_lines(diff.splitlines(keepends=True), max_chars, max_chunks=max_chunks)
+
+
+def read_text_capped(path: str | Path, max_chars: int) -> tuple[str, bool]:
+    """Read at most max_chars characters of a UTF-8 file; return (text, truncated).
+
+    Only the head of the file is read and decoded, so an oversized context file
+    cannot balloon memory or the prompt.
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read(max_chars + 1)
+    return text[:max_chars], len(text) > max_chars
+
+
 def merge_results(results: list[dict]) -> dict:
     """Merge per-chunk LLM results into a single final assessment.
 
@@ -186,42 +335,45 @@ def build_user_prompt(
     chunk_index: int,
     total_chunks: int,
 ) -> str:
-    header = f"## PR #{pr_number}: {pr_title}\n\n"
-    if total_chunks > 1:
-        header += f"_(Diff chunk {chunk_index + 1} of {total_chunks})_\n\n"
-    prompt = header
+    # Stable project context goes first and the per-PR header + diff last, so
+    # consecutive requests share the longest possible prompt prefix (provider
+    # prefix caching) and differ only in the tail.
+    prompt = ""
     if roadmap:
         prompt += f"### ROADMAP\n```markdown\n{roadmap}\n```\n\n"
     if lessons:
         prompt += f"### LESSONS LEARNED\n```markdown\n{lessons}\n```\n\n"
     if claude_md:
         prompt += f"### PROJECT CONVENTIONS (CLAUDE.md)\n```markdown\n{claude_md}\n```\n\n"
+    prompt += f"## PR #{pr_number}: {pr_title}\n\n"
+    if total_chunks > 1:
+        prompt += f"_(Diff chunk {chunk_index + 1} of {total_chunks})_\n\n"
     prompt += f"### DIFF\n```diff\n{diff_chunk}\n```"
     return prompt
 
 
-def github_api_request(url: str, token: str, *, method: str = "GET", payload: dict | None = None):
-    data = None if payload is None else json.dumps(payload).encode()
-    req = Request(
+def github_api_request(url: str, token: str, *, method: str = "GET", payload: dict | None = None) -> tuple[int, bytes]:
+    data = None if payload is None else json_dumps(payload)
+    return http_request(
+        method,
         url,
-        data=data,
         headers={
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}",
+            "User-Agent": "tidy-pilot",
         },
-        method=method,
+        body=data,
     )
-    return urlopen(req)
 
 
 def find_existing_comment_id(repo: str, pr_number: int, token: str) -> int | None:
     page = 1
     while True:
-        with github_api_request(
+        _, body = github_api_request(
             f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments?per_page=100&page={page}",
             token,
-        ) as resp:
-            comments = json.loads(resp.read())
+        )
+        comments = json_loads(body)
         if not comments:
             return None
         for comment in comments:
@@ -240,42 +392,102 @@ def comment_on_pr(repo: str, pr_number: int, body: str) -> None:
     else:
         url = f"https://api.github.com/repos/{repo}/issues/comments/{comment_id}"
         method = "PATCH"
-    with github_api_request(url, token, method=method, payload=payload) as resp:
-        if resp.status >= 300:
-            print(f"GitHub API error: {resp.status}", file=sys.stderr)
-            sys.exit(1)
+    status, _ = github_api_request(url, token, method=method, payload=payload)
+    if status >= 300:
+        print(f"GitHub API error: {status}", file=sys.stderr)
+        sys.exit(1)
+
+
+def classify_trivial_diff(lines: Iterable[str], skip_paths: str = DEFAULT_SKIP_PATHS) -> str | None:
+    """Return why a diff needs no LLM assessment, or None as soon as a substantive change is seen.
+
+    A diff is trivial when it has no changed lines, when every changed file
+    matches ``skip_paths``, or when every changed line is blank or a comment.
+    """
+    skip_re = re.compile(skip_paths)
+    skipped_file = True
+    file_has_lines = True
+    changed_paths = 0
+    changed_lines = 0
+    for line in lines:
+        if line.startswith("diff --git "):
+            # A non-skip file with no +/- lines (binary, rename, mode change)
+            # cannot be judged from its text, so it needs assessment.
+            if not skipped_file and not file_has_lines:
+                return None
+            path = line.rstrip("\n").rsplit(" b/", 1)[-1]
+            skipped_file = bool(skip_re.search(path))
+            file_has_lines = False
+            changed_paths += 1
+            continue
+        if line.startswith(("+++ ", "--- ")) or not line.startswith(("+", "-")) or skipped_file:
+            continue
+        file_has_lines = True
+        text = line[1:].strip()
+        if text and not text.startswith(COMMENT_PREFIXES):
+            return None
+        changed_lines += 1
+    if not skipped_file and not file_has_lines:
+        return None
+    if changed_lines:
+        return "comment or whitespace-only change"
+    if changed_paths:
+        return "only files matching skip paths changed"
+    return "empty diff"
+
+
+def parse_args(argv: list[str]) -> tuple[int, str, str]:
+    """Parse ``--pr-number N --repo owner/name [--pr-title T]`` into (pr_number, pr_title, repo)."""
+    usage = "usage: assess_pr.py --pr-number N --repo OWNER/NAME [--pr-title TITLE]"
+    if len(argv) % 2:
+        sys.exit(f"{usage}\nerror: every option needs a value")
+    opts = dict(zip(argv[::2], argv[1::2]))
+    unknown = set(opts) - {"--pr-number", "--pr-title", "--repo"}
+    if unknown:
+        sys.exit(f"{usage}\nerror: unrecognized arguments: {' '.join(sorted(unknown))}")
+    missing = [key for key in ("--pr-number", "--repo") if key not in opts]
+    if missing:
+        sys.exit(f"{usage}\nerror: the following arguments are required: {', '.join(missing)}")
+    try:
+        pr_number = int(opts["--pr-number"])
+    except ValueError:
+        sys.exit(f"{usage}\nerror: --pr-number must be an integer")
+    return pr_number, opts.get("--pr-title", ""), opts["--repo"]
 
 
 def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--pr-number", type=int, required=True)
-    parser.add_argument("--pr-title", type=str, default="")
-    parser.add_argument("--repo", type=str, required=True)
-    args = parser.parse_args()
+    pr_number, pr_title, repo = parse_args(sys.argv[1:])
+
+    if os.environ.get("TIDY_PILOT_FORCE", "false") != "true":
+        with open(DIFF_PATH, encoding="utf-8", errors="replace") as diff_file:
+            reason = classify_trivial_diff(diff_file, os.environ.get("TIDY_PILOT_SKIP_PATHS") or DEFAULT_SKIP_PATHS)
+        if reason is not None:
+            print(f"Skipping LLM assessment for PR #{pr_number}: {reason} (set TIDY_PILOT_FORCE=true to override).")
+            return
 
-    diff = Path("/tmp/pr.diff").read_text(encoding="utf-8", errors="replace")
+    # Stream the diff so only the sections that fit the chunk caps are kept in memory.
+    with open(DIFF_PATH, encoding="utf-8", errors="replace") as diff_file:
+        chunks = chunk_diff_lines(diff_file, MAX_CHUNK_DIFF_CHARS)
 
     def _read_truncated(path: str) -> str:
-        p = Path(path)
-        if not p.exists():
+        if not Path(path).exists():
             return ""
-        text = p.read_text(encoding="utf-8")
-        if len(text) > MAX_CONTEXT_CHARS:
-            text = text[:MAX_CONTEXT_CHARS] + "\n\n... (truncated)"
+        text, truncated = read_text_capped(path, MAX_CONTEXT_CHARS)
+        if truncated:
+            text += "\n\n... (truncated)"
         return text
 
     roadmap = _read_truncated("ROADMAP.md")
     lessons = _read_truncated("LESSONS.md")
     claude_md = _read_truncated("CLAUDE.md")
 
-    chunks = chunk_diff(diff, MAX_CHUNK_DIFF_CHARS)
-    print(f"Analyzing PR #{args.pr_number}: {args.pr_title} ({len(chunks)} diff chunk(s))")
+    print(f"Analyzing PR #{pr_number}: {pr_title} ({len(chunks)} diff chunk(s))")
 
     results: list[dict] = []
     for i, chunk in enumerate(chunks):
         user_prompt = build_user_prompt(
-            args.pr_number,
-            args.pr_title,
+            pr_number,
+            pr_title,
             chunk,
             roadmap,
             lessons,
@@ -290,8 +502,7 @@ def main():
     result = merge_results(results)
 
     verdict = result.get("verdict", "neutral")
-    verdict_icons = {"expand": "\U0001f7e2", "narrow": "\U0001f534", "neutral": "⚪"}
-    icon = verdict_icons.get(verdict, "")
+    icon = VERDICT_ICONS.get(verdict, "")
 
     if verdict == "neutral" and os.environ.get("COMMENT_ON_NEUTRAL", "false") != "true":
         print("Verdict: neutral — skipping comment.")
@@ -312,7 +523,7 @@ def main():
 ---
 <sub>Powered by Tidy Pilot — analyzing futures, not just features</sub>"""
 
-    comment_on_pr(args.repo, args.pr_number, comment)
+    comment_on_pr(repo, pr_number, comment)
     print(f"Comment posted: {icon} {verdict}")
 
 
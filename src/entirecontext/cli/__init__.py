@@ -2,59 +2,78 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperGroup
 
-app = typer.Typer(name="ec", help="EntireContext — searchable agent memory anchored to git")
-
-from . import archaeology_cmds  # noqa: E402
-from . import ast_cmds  # noqa: E402
-from . import blame_cmds  # noqa: E402
-from . import checkpoint_cmds  # noqa: E402
-from . import context_cmds  # noqa: E402
-from . import decisions_cmds  # noqa: E402
-from . import dashboard_cmds  # noqa: E402
-from . import event_cmds  # noqa: E402
-from . import futures_cmds  # noqa: E402
-from . import graph_cmds  # noqa: E402
-from . import hook_cmds  # noqa: E402
-from . import import_cmds  # noqa: E402
-from . import index_cmds  # noqa: E402
-from . import mcp_cmds  # noqa: E402
-from . import project_cmds  # noqa: E402
-from . import purge_cmds  # noqa: E402
-from . import repo_cmds  # noqa: E402
-from . import rewind_cmds  # noqa: E402
-from . import search_cmds  # noqa: E402
-from . import session_cmds  # noqa: E402
-from . import sync_cmds  # noqa: E402
-from . import compact_cmds  # noqa: E402
-
-_MODULES = (
-    archaeology_cmds,
-    project_cmds,
-    search_cmds,
-    session_cmds,
-    hook_cmds,
-    checkpoint_cmds,
-    sync_cmds,
-    rewind_cmds,
-    repo_cmds,
-    event_cmds,
-    blame_cmds,
-    index_cmds,
-    mcp_cmds,
-    import_cmds,
-    futures_cmds,
-    purge_cmds,
-    graph_cmds,
-    ast_cmds,
-    dashboard_cmds,
-    context_cmds,
-    decisions_cmds,
-    compact_cmds,
-)
+# Top-level command name -> module whose ``register(app)`` defines it, in help
+# display order. Modules are imported on first dispatch, so ``ec <cmd>`` only
+# pays the import cost of the command tree it actually runs.
+_COMMAND_MODULES = {
+    "archaeologize": "archaeology_cmds",
+    "init": "project_cmds",
+    "enable": "project_cmds",
+    "disable": "project_cmds",
+    "status": "project_cmds",
+    "config": "project_cmds",
+    "doctor": "project_cmds",
+    "search": "search_cmds",
+    "sync": "sync_cmds",
+    "pull": "sync_cmds",
+    "rewind": "rewind_cmds",
+    "blame": "blame_cmds",
+    "index": "index_cmds",
+    "import": "import_cmds",
+    "graph": "graph_cmds",
+    "ast-search": "ast_cmds",
+    "dashboard": "dashboard_cmds",
+    "compact": "compact_cmds",
+    "session": "session_cmds",
+    "hook": "hook_cmds",
+    "checkpoint": "checkpoint_cmds",
+    "repo": "repo_cmds",
+    "event": "event_cmds",
+    "mcp": "mcp_cmds",
+    "futures": "futures_cmds",
+    "purge": "purge_cmds",
+    "context": "context_cmds",
+    "decision": "decisions_cmds",
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Root group that imports a command module only when one of its commands is requested."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return list(_COMMAND_MODULES)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name not in self.commands:
+            if cmd_name in _COMMAND_MODULES:
+                self._load_module(_COMMAND_MODULES[cmd_name])
+            else:
+                # Unknown name: load everything so typo suggestions can see every command.
+                for module_name in dict.fromkeys(_COMMAND_MODULES.values()):
+                    self._load_module(module_name)
+        return self.commands.get(cmd_name)
 
-for module in _MODULES:
-    register = getattr(module, "register", None)
-    if callable(register):
-        register(app)
+    def _load_module(self, module_name: str) -> None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        module_app = typer.Typer()
+        module.register(module_app)
+        for name, command in typer.main.get_group(module_app).commands.items():
+            self.add_command(command, name)
+
+
+def _root() -> None:
+    pass
+
+
+app = typer.Typer(
+    name="ec",
+    help="EntireContext — searchable agent memory anchored to git",
+    cls=LazyCommandGroup,
+    callback=_root,
+)
@@ -3,10 +3,8 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .helpers import console
 
 
 def ast_search_cmd(
@@ -49,6 +47,8 @@ def ast_search_cmd(
         console.print("[dim]No matching symbols found.[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(title=f"AST Symbol Search: {query!r} ({len(results)} results)")
     table.add_column("Type", style="cyan", max_width=10)
     table.add_column("Qualified Name", style="bold", max_width=40)
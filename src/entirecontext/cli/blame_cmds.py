@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .helpers import console
+
+# "10", "10,20", "10-20" or "10:20"
+_LINE_RANGE_RE = re.compile(r"^(\d+)(?:[,:\-](\d+))?$")
 
 
 def blame_cmd(
     file: str = typer.Argument(..., help="File path to show attribution for"),
     summary: bool = typer.Option(False, "--summary", "-s", help="Show aggregated stats only"),
-    lines: Optional[str] = typer.Option(None, "-L", help="Line range (e.g. 10,20)"),
+    lines: Optional[str] = typer.Option(None, "-L", help="Line range: N, N,M, N-M or N:M (e.g. 10,20)"),
     decisions: bool = typer.Option(False, "--decisions", help="Annotate with decision history"),
 ):
     """Show per-line human/agent attribution for a file."""
@@ -25,6 +27,16 @@ def blame_cmd(
         console.print("[red]--summary and --decisions are mutually exclusive.[/red]")
         raise typer.Exit(1)
 
+    start_line = None
+    end_line = None
+    if lines:
+        match = _LINE_RANGE_RE.match(lines.strip())
+        if not match:
+            console.print(f"[red]Invalid line range:[/red] {lines} (expected N, N,M, N-M or N:M)")
+            raise typer.Exit(1)
+        start_line = int(match.group(1))
+        end_line = int(match.group(2) or match.group(1))
+
     repo_path = find_git_root()
     if not repo_path:
         console.print("[red]Not in a git repository.[/red]")
@@ -35,17 +47,6 @@ def blame_cmd(
         if decisions:
             check_and_migrate(conn)
 
-        start_line = None
-        end_line = None
-        if lines:
-            parts = lines.split(",")
-            if len(parts) == 2:
-                start_line = int(parts[0])
-                end_line = int(parts[1])
-            elif len(parts) == 1:
-                start_line = int(parts[0])
-                end_line = int(parts[0])
-
         if summary:
             from ..core.attribution import get_file_attribution_summary
 
@@ -86,6 +87,8 @@ def blame_cmd(
     if not attributions:
         console.print(f"[dim]No attribution data for {file}[/dim]")
     else:
+        from rich.table import Table
+
         table = Table(title=f"Attribution: {file}")
         table.add_column("Lines", style="dim")
         table.add_column("Type")
@@ -135,8 +138,7 @@ def _render_decision_annotations(file: str, decision_result: dict) -> None:
 
     for s, e in unlinked_ranges:
         console.print(
-            f"  lines {s}-{e}: no recorded decision "
-            "(absence of links, not evidence that no decisions were made)"
+            f"  lines {s}-{e}: no recorded decision (absence of links, not evidence that no decisions were made)"
         )
 
     for s, e in uncommitted_ranges:
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import heapq
 from typing import List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .helpers import console
+
 checkpoint_app = typer.Typer(help="Checkpoint management")
 
+_SNAPSHOT_PREVIEW = 50
+
+
+def _print_files_snapshot(snapshot: dict | list) -> None:
+    """Print the first files of a snapshot in path order."""
+    if not isinstance(snapshot, (dict, list)):
+        return
+    console.print(f"\n[bold]Files Snapshot ({len(snapshot)} files):[/bold]")
+    # nsmallest avoids sorting every path of a large snapshot just to show a few.
+    for path in heapq.nsmallest(_SNAPSHOT_PREVIEW, snapshot):
+        console.print(f"  {path}")
+    if len(snapshot) > _SNAPSHOT_PREVIEW:
+        console.print(f"  ... and {len(snapshot) - _SNAPSHOT_PREVIEW} more")
+
 
 @checkpoint_app.command("create")
 def checkpoint_create(
@@ -55,7 +69,7 @@ def checkpoint_create(
 
         diff_summary = message
         if not diff_summary:
-            prev_checkpoints = list_checkpoints(conn, session_id=session_id, limit=1)
+            prev_checkpoints = list_checkpoints(conn, session_id=session_id, limit=1, include_snapshot=False)
             from_commit = prev_checkpoints[0]["git_commit_hash"] if prev_checkpoints else None
             diff_summary = get_diff_stat(repo_path, from_commit=from_commit)
 
@@ -105,13 +119,15 @@ def checkpoint_list(
         from ..core.cross_repo import cross_repo_checkpoints
 
         checkpoints, warnings = cross_repo_checkpoints(
-            repos=repo, session_id=session, limit=limit, include_warnings=True
+            repos=repo, session_id=session, limit=limit, include_warnings=True, include_snapshot=False
         )
 
         if not checkpoints:
             console.print("[dim]No checkpoints found.[/dim]")
             return
 
+        from rich.table import Table
+
         table = Table(title=f"Checkpoints ({len(checkpoints)})")
         table.add_column("Repo", style="cyan", max_width=15)
         table.add_column("ID", style="dim", max_width=12)
@@ -146,7 +162,7 @@ def checkpoint_list(
 
     conn = get_db(repo_path)
     try:
-        checkpoints = list_checkpoints(conn, session_id=session, limit=limit)
+        checkpoints = list_checkpoints(conn, session_id=session, limit=limit, include_snapshot=False)
     finally:
         conn.close()
 
@@ -154,6 +170,8 @@ def checkpoint_list(
         console.print("[dim]No checkpoints found.[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(title=f"Checkpoints ({len(checkpoints)})")
     table.add_column("ID", style="dim", max_width=12)
     table.add_column("Commit", style="cyan", max_width=10)
@@ -203,19 +221,7 @@ def checkpoint_show(
             console.print(f"  Parent: {cp['parent_checkpoint_id'][:12]}")
 
         if cp.get("files_snapshot"):
-            snapshot = cp["files_snapshot"]
-            if isinstance(snapshot, dict):
-                console.print(f"\n[bold]Files Snapshot ({len(snapshot)} files):[/bold]")
-                for path in sorted(snapshot.keys())[:50]:
-                    console.print(f"  {path}")
-                if len(snapshot) > 50:
-                    console.print(f"  ... and {len(snapshot) - 50} more")
-            elif isinstance(snapshot, list):
-                console.print(f"\n[bold]Files Snapshot ({len(snapshot)} files):[/bold]")
-                for path in sorted(snapshot)[:50]:
-                    console.print(f"  {path}")
-                if len(snapshot) > 50:
-                    console.print(f"  ... and {len(snapshot) - 50} more")
+            _print_files_snapshot(cp["files_snapshot"])
 
         for w in warnings:
             console.print(f"[dim]{w}[/dim]")
@@ -259,19 +265,7 @@ def checkpoint_show(
             console.print(f"  Title: {session['session_title']}")
 
     if cp.get("files_snapshot"):
-        snapshot = cp["files_snapshot"]
-        if isinstance(snapshot, dict):
-            console.print(f"\n[bold]Files Snapshot ({len(snapshot)} files):[/bold]")
-            for path in sorted(snapshot.keys())[:50]:
-                console.print(f"  {path}")
-            if len(snapshot) > 50:
-                console.print(f"  ... and {len(snapshot) - 50} more")
-        elif isinstance(snapshot, list):
-            console.print(f"\n[bold]Files Snapshot ({len(snapshot)} files):[/bold]")
-            for path in sorted(snapshot)[:50]:
-                console.print(f"  {path}")
-            if len(snapshot) > 50:
-                console.print(f"  ... and {len(snapshot) - 50} more")
+        _print_files_snapshot(cp["files_snapshot"])
 
 
 @checkpoint_app.command("diff")
@@ -358,6 +352,8 @@ def assess_accuracy():
         console.print("  Agreement rate: [dim]no data[/dim]")
 
     if result["per_verdict"]:
+        from rich.table import Table
+
         table = Table(title="Per-Verdict Breakdown")
         table.add_column("Verdict")
         table.add_column("Agree", justify="right")
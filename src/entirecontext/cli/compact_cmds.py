@@ -7,9 +7,7 @@ from typing import Any, Optional
 
 import typer
 
-from rich.console import Console
-
-console = Console()
+from .helpers import console
 
 
 def _format_bytes(n: int) -> str:
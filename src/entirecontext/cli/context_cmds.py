@@ -5,9 +5,9 @@ from __future__ import annotations
 import sqlite3
 
 import typer
-from rich.console import Console
 
-console = Console()
+from .helpers import console
+
 context_app = typer.Typer(help="Context telemetry")
 
 
@@ -5,10 +5,12 @@ from __future__ import annotations
 import sqlite3
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .helpers import console
+
+VERDICT_COLORS = {"expand": "green", "narrow": "red", "neutral": "yellow"}
+# Pre-formatted Rich markup per known verdict; unknown verdicts fall back to white.
+VERDICT_MARKUP = {v: f"[{c}]{v}[/{c}]" for v, c in VERDICT_COLORS.items()}
 
 
 def dashboard_cmd(
@@ -40,8 +42,15 @@ def dashboard_cmd(
 
 def _render_dashboard(stats: dict) -> None:
     """Render the dashboard stats using Rich tables."""
+    from rich.console import Group
+    from rich.table import Table
+
+    # Collect every section and print once, so Rich measures and writes the
+    # whole dashboard in a single render pass.
+    out: list = []
+
     since_label = f"  [dim]since {stats['since']}[/dim]" if stats["since"] else ""
-    console.print(
+    out.append(
         f"\n[bold]Dogfooding Maturity[/bold] — {stats['maturity_score']}/100  [cyan]{stats['maturity_grade']}[/cyan]"
     )
 
@@ -50,15 +59,13 @@ def _render_dashboard(stats: dict) -> None:
     maturity.add_column("Score", justify="right", max_width=8)
     for key in ("capture", "distill", "retrieve", "intervene"):
         maturity.add_row(key, str(stats["maturity_breakdown"][key]))
-    console.print(maturity)
+    out.append(maturity)
 
     # ------------------------------------------------------------------
     # Sessions
     # ------------------------------------------------------------------
     s = stats["sessions"]
-    console.print(
-        f"\n[bold]Sessions[/bold] — {s['total']} total  active: {s['active']}  ended: {s['ended']}{since_label}"
-    )
+    out.append(f"\n[bold]Sessions[/bold] — {s['total']} total  active: {s['active']}  ended: {s['ended']}{since_label}")
 
     if s["recent"]:
         tbl = Table(show_header=True, header_style="bold", box=None, pad_edge=False)
@@ -77,15 +84,15 @@ def _render_dashboard(stats: dict) -> None:
                 (row.get("last_activity_at") or "")[:19],
                 status,
             )
-        console.print(tbl)
+        out.append(tbl)
     else:
-        console.print("[dim]  No sessions.[/dim]")
+        out.append("[dim]  No sessions.[/dim]")
 
     # ------------------------------------------------------------------
     # Checkpoints
     # ------------------------------------------------------------------
     c = stats["checkpoints"]
-    console.print(f"\n[bold]Checkpoints[/bold] — {c['total']} total{since_label}")
+    out.append(f"\n[bold]Checkpoints[/bold] — {c['total']} total{since_label}")
 
     if c["recent"]:
         tbl = Table(show_header=True, header_style="bold", box=None, pad_edge=False)
@@ -103,9 +110,9 @@ def _render_dashboard(stats: dict) -> None:
                 (row.get("git_commit_hash") or "")[:8],
                 (row.get("created_at") or "")[:19],
             )
-        console.print(tbl)
+        out.append(tbl)
     else:
-        console.print("[dim]  No checkpoints.[/dim]")
+        out.append("[dim]  No checkpoints.[/dim]")
 
     # ------------------------------------------------------------------
     # Assessments
@@ -115,7 +122,7 @@ def _render_dashboard(stats: dict) -> None:
     total = a["total"]
     feedback_pct = f"{a['feedback_rate'] * 100:.0f}%" if total > 0 else "0%"
 
-    console.print(
+    out.append(
         f"\n[bold]Assessments[/bold] — {total} total  feedback: {a['with_feedback']} ({feedback_pct}){since_label}"
     )
 
@@ -124,14 +131,12 @@ def _render_dashboard(stats: dict) -> None:
     verdict_table.add_column("Count", justify="right", max_width=8)
     verdict_table.add_column("Pct", justify="right", max_width=6)
 
-    verdict_colors = {"expand": "green", "narrow": "red", "neutral": "yellow"}
-    for v in ("expand", "narrow", "neutral"):
+    for v, markup in VERDICT_MARKUP.items():
         count = bv.get(v, 0)
         pct = f"{round(100 * count / total)}%" if total else "0%"
-        color = verdict_colors[v]
-        verdict_table.add_row(f"[{color}]{v}[/{color}]", str(count), pct)
+        verdict_table.add_row(markup, str(count), pct)
 
-    console.print(verdict_table)
+    out.append(verdict_table)
 
     if a["recent"]:
         tbl = Table(show_header=True, header_style="bold", box=None, pad_edge=False)
@@ -143,21 +148,20 @@ def _render_dashboard(stats: dict) -> None:
 
         for row in a["recent"]:
             v = row.get("verdict", "")
-            color = verdict_colors.get(v, "white")
             tbl.add_row(
                 (row.get("id") or "")[:14],
-                f"[{color}]{v}[/{color}]",
+                VERDICT_MARKUP.get(v) or f"[white]{v}[/white]",
                 (row.get("impact_summary") or "")[:50],
                 row.get("feedback") or "",
                 (row.get("created_at") or "")[:19],
             )
-        console.print(tbl)
+        out.append(tbl)
     else:
-        console.print("[dim]  No recent assessments.[/dim]")
+        out.append("[dim]  No recent assessments.[/dim]")
 
     telemetry = stats["telemetry"]
     rates = telemetry["rates"]
-    console.print(f"\n[bold]Telemetry[/bold]{since_label}")
+    out.append(f"\n[bold]Telemetry[/bold]{since_label}")
     telemetry_table = Table(show_header=True, header_style="bold", box=None, pad_edge=False)
     telemetry_table.add_column("Metric", max_width=32)
     telemetry_table.add_column("Value", justify="right", max_width=14)
@@ -173,7 +177,8 @@ def _render_dashboard(stats: dict) -> None:
     telemetry_table.add_row(
         "checkpoint-anchored assessment rate", f"{rates['checkpoint_anchored_assessment_rate'] * 100:.0f}%"
     )
-    console.print(telemetry_table)
+    out.append(telemetry_table)
+    console.print(Group(*out))
 
 
 def register(app: typer.Typer) -> None:
@@ -5,12 +5,10 @@ from __future__ import annotations
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.table import Table
 
-from .helpers import get_repo_connection
+from .helpers import console, get_repo_connection
 
-console = Console()
 decision_app = typer.Typer(help="Decision memory management")
 
 
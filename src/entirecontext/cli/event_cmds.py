@@ -5,12 +5,17 @@ from __future__ import annotations
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 from rich.table import Table
+from rich.text import Text
+
+from .helpers import console, get_repo_connection, print_next_cursor
 
-console = Console()
 event_app = typer.Typer(help="Event management")
 
+# Shared styled cell for the common case, so rows skip markup parsing. A span
+# (not a base style) keeps cell padding unstyled, exactly like the old markup.
+_STATUS_ACTIVE = Text.assemble(("active", "green"))
+
 
 @event_app.command("list")
 def event_list(
@@ -19,6 +24,12 @@ def event_list(
     limit: int = typer.Option(20, "--limit", "-n"),
     global_search: bool = typer.Option(False, "--global", "-g", help="List events across all registered repos"),
     repo: Optional[List[str]] = typer.Option(None, "--repo", "-r", help="Filter by repo name (repeatable)"),
+    before: Optional[str] = typer.Option(
+        None, "--before", help="Only events created before this timestamp (the cursor printed by the previous page)"
+    ),
+    before_id: Optional[str] = typer.Option(
+        None, "--before-id", help="Tiebreaker for --before: the event ID printed with the cursor"
+    ),
 ):
     """List events."""
     is_cross_repo = global_search or repo
@@ -27,7 +38,13 @@ def event_list(
         from ..core.cross_repo import cross_repo_events
 
         events, warnings = cross_repo_events(
-            repos=repo, status=status, event_type=event_type, limit=limit, include_warnings=True
+            repos=repo,
+            status=status,
+            event_type=event_type,
+            limit=limit,
+            include_warnings=True,
+            before=before,
+            before_id=before_id,
         )
 
         if not events:
@@ -43,7 +60,7 @@ def event_list(
         table.add_column("Created")
 
         for e in events:
-            status_str = "[green]active[/green]" if e["status"] == "active" else e["status"]
+            status_str = _STATUS_ACTIVE if e["status"] == "active" else e["status"]
             table.add_row(
                 e.get("repo_name", ""),
                 e["id"][:12],
@@ -54,77 +71,64 @@ def event_list(
             )
 
         console.print(table)
+        print_next_cursor(len(events), limit, events[-1].get("created_at"), events[-1].get("id"))
         for w in warnings:
             console.print(f"[dim]{w}[/dim]")
         return
 
-    from ..core.event import list_events
-    from ..core.project import find_git_root
-    from ..db import get_db
-
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
-
-    conn = get_db(repo_path)
-    try:
-        events = list_events(conn, status=status, event_type=event_type, limit=limit)
-    finally:
-        conn.close()
-
-    if not events:
-        console.print("[dim]No events found.[/dim]")
-        return
+    from ..core.event import EVENT_SUMMARY_COLUMNS, iter_events
 
-    table = Table(title=f"Events ({len(events)})")
+    # Rows go from the cursor straight into the table; no intermediate list of dicts.
+    table = Table()
     table.add_column("ID", style="dim", max_width=12)
     table.add_column("Title")
     table.add_column("Type")
     table.add_column("Status")
     table.add_column("Created")
 
-    for e in events:
-        status_str = "[green]active[/green]" if e["status"] == "active" else e["status"]
-        table.add_row(
-            e["id"][:12],
-            e.get("title", ""),
-            e.get("event_type", ""),
-            status_str,
-            e.get("created_at", ""),
+    conn, _ = get_repo_connection(migrate=False)
+    try:
+        last_created = last_id = None
+        rows = iter_events(
+            conn,
+            status=status,
+            event_type=event_type,
+            limit=limit,
+            before=before,
+            before_id=before_id,
+            columns=EVENT_SUMMARY_COLUMNS,
         )
+        for e in rows:
+            status_str = _STATUS_ACTIVE if e["status"] == "active" else e["status"]
+            table.add_row(e["id"][:12], e["title"], e["event_type"], status_str, e["created_at"])
+            last_created, last_id = e["created_at"], e["id"]
+    finally:
+        conn.close()
 
+    if not table.row_count:
+        console.print("[dim]No events found.[/dim]")
+        return
+
+    table.title = f"Events ({table.row_count})"
     console.print(table)
+    print_next_cursor(table.row_count, limit, last_created, last_id)
 
 
 @event_app.command("show")
 def event_show(event_id: str = typer.Argument(..., help="Event ID")):
     """Show event details and linked sessions."""
-    from ..core.event import get_event, get_event_sessions
-    from ..core.project import find_git_root
-    from ..db import get_db
-
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
+    from ..core.event import get_event_with_sessions
 
-    conn = get_db(repo_path)
+    conn, _ = get_repo_connection(migrate=False)
     try:
-        event = get_event(conn, event_id)
-        if not event:
-            row = conn.execute("SELECT * FROM events WHERE id LIKE ?", (f"{event_id}%",)).fetchone()
-            if row:
-                event = dict(row)
-
-        if not event:
-            console.print(f"[red]Event not found:[/red] {event_id}")
-            raise typer.Exit(1)
-
-        sessions = get_event_sessions(conn, event["id"])
+        event, sessions = get_event_with_sessions(conn, event_id)
     finally:
         conn.close()
 
+    if not event:
+        console.print(f"[red]Event not found:[/red] {event_id}")
+        raise typer.Exit(1)
+
     console.print(f"\n[bold]Event:[/bold] {event['id']}")
     console.print(f"  Title: {event.get('title', '')}")
     console.print(f"  Type: {event.get('event_type', '')}")
@@ -148,15 +152,8 @@ def event_create(
 ):
     """Create a new event."""
     from ..core.event import create_event
-    from ..core.project import find_git_root
-    from ..db import get_db
 
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
-
-    conn = get_db(repo_path)
+    conn, _ = get_repo_connection(migrate=False)
     try:
         event = create_event(conn, title, event_type=event_type, description=description)
     except ValueError as e:
@@ -171,36 +168,31 @@ def event_create(
 @event_app.command("link")
 def event_link(
     event_id: str = typer.Argument(..., help="Event ID"),
-    session_id: str = typer.Argument(..., help="Session ID"),
+    session_ids: List[str] = typer.Argument(..., help="Session ID(s)"),
 ):
-    """Link a session to an event."""
-    from ..core.event import get_event, link_event_session
-    from ..core.project import find_git_root
-    from ..core.session import get_session
-    from ..db import get_db
-
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
+    """Link one or more sessions to an event."""
+    from ..core.event import get_event, link_event_sessions
+    from ..core.session import missing_session_ids
 
-    conn = get_db(repo_path)
+    session_ids = list(dict.fromkeys(session_ids))
+    conn, _ = get_repo_connection(migrate=False)
     try:
         event = get_event(conn, event_id)
         if not event:
             console.print(f"[red]Event not found:[/red] {event_id}")
             raise typer.Exit(1)
 
-        session = get_session(conn, session_id)
-        if not session:
-            console.print(f"[red]Session not found:[/red] {session_id}")
+        missing = missing_session_ids(conn, session_ids)
+        if missing:
+            console.print(f"[red]Session not found:[/red] {', '.join(missing)}")
             raise typer.Exit(1)
 
-        link_event_session(conn, event_id, session_id)
+        link_event_sessions(conn, event_id, session_ids)
     finally:
         conn.close()
 
-    console.print(f"[green]Linked session {session_id[:12]} to event {event_id[:12]}[/green]")
+    for session_id in session_ids:
+        console.print(f"[green]Linked session {session_id[:12]} to event {event_id[:12]}[/green]")
 
 
 def register(app: typer.Typer) -> None:
@@ -2,39 +2,122 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-console = Console()
+from .helpers import console, get_repo_connection, print_next_cursor
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
 futures_app = typer.Typer(help="Futures assessment (Tidy First)")
 
 
 from ..core.futures import ASSESS_SYSTEM_PROMPT as SYSTEM_PROMPT  # noqa: E402
 
+_MAX_DIFF_CHARS = 8000
+
+# Context windows (tokens) of models commonly passed to ``--model``; unknown
+# models keep the conservative ``_MAX_DIFF_CHARS`` budget.
+_MODEL_CONTEXT_TOKENS = {
+    "gpt-4o-mini": 128_000,
+    "gpt-4o": 128_000,
+    "gpt-4.1-mini": 1_000_000,
+    "gpt-4.1": 1_000_000,
+    "gpt-3.5-turbo": 16_000,
+    "llama3": 8_000,
+}
+_PROMPT_CONTEXT_SHARE = 0.6
+_CHARS_PER_TOKEN = 4
+
+# Generated files dropped from an over-budget staged diff before truncating.
+_GENERATED_PATHSPECS = (
+    ":(top,exclude,glob)**/*.lock",
+    ":(top,exclude,glob)**/package-lock.json",
+    ":(top,exclude,glob)**/pnpm-lock.yaml",
+    ":(top,exclude,glob)**/*.min.js",
+    ":(top,exclude,glob)**/*.min.css",
+)
+
+VERDICT_COLORS = {"expand": "green", "narrow": "red", "neutral": "yellow"}
+VERDICT_ICONS = {"expand": "\U0001f7e2", "narrow": "\U0001f534", "neutral": "\U0001f7e1"}
+RELATIONSHIP_COLORS = {"causes": "red", "fixes": "green", "contradicts": "yellow"}
+RELATIONSHIP_ICONS = {"causes": "→", "fixes": "✓", "contradicts": "≠"}
+
+
+@functools.cache
+def _verdict_cell(verdict: str) -> Text:
+    """Styled table cell for a verdict, built once and shared by every row."""
+    from rich.text import Text
+
+    # A span (not a base style) so cell padding stays unstyled, as with markup.
+    return Text.assemble((verdict, VERDICT_COLORS.get(verdict, "white")))
+
+
+def _diff_budget(model: str, reserved: int = 0) -> int:
+    """Characters of diff that fit the model's prompt share after ``reserved`` chars."""
+    name = model.rsplit("/", 1)[-1].split(":", 1)[0]
+    tokens = _MODEL_CONTEXT_TOKENS.get(name)
+    if tokens is None:
+        return _MAX_DIFF_CHARS
+    budget = int(tokens * _PROMPT_CONTEXT_SHARE * _CHARS_PER_TOKEN) - reserved
+    return max(budget, _MAX_DIFF_CHARS)
+
+
+def _get_staged_diff(max_chars: int = _MAX_DIFF_CHARS) -> str:
+    """Get the first ``max_chars`` characters of the current staged diff.
+
+    If the diff does not fit, lockfiles and minified assets are excluded
+    and the rest is read again, so hand-written changes get the budget.
+    """
+    diff = _read_staged_diff(max_chars + 1)
+    if len(diff) <= max_chars:
+        return diff
+    return _read_staged_diff(max_chars, _GENERATED_PATHSPECS) or diff[:max_chars]
+
 
-def _get_staged_diff() -> str:
-    """Get the current staged diff."""
-    result = subprocess.run(
-        ["git", "diff", "--staged"],
-        capture_output=True,
+def _read_staged_diff(max_chars: int, pathspecs: tuple[str, ...] = ()) -> str:
+    """Read at most ``max_chars`` of ``git diff --staged``, stopping git early.
+
+    Only the head of the diff reaches the prompt, so git's output is read
+    from the pipe up to that cap and git is stopped instead of buffering
+    the whole diff of a large commit. ``GIT_OPTIONAL_LOCKS=0`` keeps this
+    read-only call from taking index.lock, so it never contends with a
+    concurrent git command in the same repo.
+    """
+    proc = subprocess.Popen(
+        ["git", "--no-pager", "diff", "--staged", "--no-color", *(["--", *pathspecs] if pathspecs else [])],
+        env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
+        errors="replace",
     )
-    return result.stdout
+    assert proc.stdout is not None
+    try:
+        return proc.stdout.read(max_chars)
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
 
 
-def _get_checkpoint_diff(conn, checkpoint_id: str) -> str | None:
-    """Get diff summary from a checkpoint."""
+def _get_checkpoint_diff(conn, checkpoint_id: str) -> tuple[str, str | None] | None:
+    """Resolve a full or prefix checkpoint ID to ``(id, diff_summary)`` in one query."""
+    from ..core.resolve import prefix_range
+
     row = conn.execute(
-        "SELECT diff_summary FROM checkpoints WHERE id = ? OR id LIKE ?", (checkpoint_id, f"{checkpoint_id}%")
+        "SELECT id, diff_summary FROM checkpoints WHERE id >= ? AND id < ? ORDER BY id LIMIT 1",
+        prefix_range(checkpoint_id),
     ).fetchone()
-    return row["diff_summary"] if row else None
+    return (row["id"], row["diff_summary"]) if row else None
 
 
 def _call_llm(backend_name: str, model: str, system: str, user: str) -> dict:
@@ -48,11 +131,11 @@ def _call_llm(backend_name: str, model: str, system: str, user: str) -> dict:
 
 def _render_assessment(assessment: dict) -> None:
     """Render assessment with Rich."""
+    from rich.panel import Panel
+
     verdict = assessment.get("verdict", "neutral")
-    verdict_colors = {"expand": "green", "narrow": "red", "neutral": "yellow"}
-    color = verdict_colors.get(verdict, "white")
-    verdict_icons = {"expand": "\U0001f7e2", "narrow": "\U0001f534", "neutral": "\U0001f7e1"}
-    icon = verdict_icons.get(verdict, "")
+    color = VERDICT_COLORS.get(verdict, "white")
+    icon = VERDICT_ICONS.get(verdict, "")
 
     console.print(
         Panel(
@@ -74,58 +157,50 @@ def futures_assess(
     backend: str = typer.Option("openai", "--backend", "-b", help="LLM backend (openai|codex|claude|ollama)"),
 ):
     """Assess current staged diff or a checkpoint against project roadmap."""
-    from ..core.futures import create_assessment
-    from ..core.project import find_git_root
+    from ..core.futures import create_assessment, read_roadmap
     from ..db import get_db
 
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
-
-    conn = get_db(repo_path)
+    conn, repo_path = get_repo_connection(migrate=False)
     try:
         # Get diff
         checkpoint_id = None
         if checkpoint:
-            diff = _get_checkpoint_diff(conn, checkpoint)
+            checkpoint_id, diff = _get_checkpoint_diff(conn, checkpoint) or (None, None)
             if not diff:
                 console.print(f"[red]Checkpoint not found or has no diff: {checkpoint}[/red]")
                 raise typer.Exit(1)
-            # Resolve full checkpoint ID
-            row = conn.execute(
-                "SELECT id FROM checkpoints WHERE id = ? OR id LIKE ?", (checkpoint, f"{checkpoint}%")
-            ).fetchone()
-            checkpoint_id = row["id"] if row else None
         else:
-            diff = _get_staged_diff()
+            diff = _get_staged_diff(_diff_budget(model))
             if not diff.strip():
                 console.print("[yellow]No staged changes found. Stage changes with `git add` first.[/yellow]")
                 raise typer.Exit(1)
 
         # Read roadmap
-        roadmap_text = ""
-        roadmap_path = Path(roadmap)
-        if roadmap_path.exists():
-            roadmap_text = roadmap_path.read_text(encoding="utf-8")
-        else:
+        roadmap_text = read_roadmap(roadmap)
+        if roadmap_text is None:
+            roadmap_text = ""
             console.print(f"[dim]Roadmap file not found: {roadmap}. Proceeding without it.[/dim]")
 
         # Build user prompt
         user_prompt = ""
         if roadmap_text:
             user_prompt += f"## ROADMAP\n\n{roadmap_text}\n\n"
-        user_prompt += f"## DIFF\n\n```diff\n{diff[:8000]}\n```"
+        diff_budget = _diff_budget(model, reserved=len(SYSTEM_PROMPT) + len(user_prompt))
+        user_prompt += f"## DIFF\n\n```diff\n{diff[:diff_budget]}\n```"
+    finally:
+        conn.close()
 
-        # Call LLM
-        console.print("[dim]Analyzing with LLM...[/dim]")
-        try:
-            result = _call_llm(backend, model, SYSTEM_PROMPT, user_prompt)
-        except Exception as e:
-            console.print(f"[red]LLM call failed: {e}[/red]")
-            raise typer.Exit(1)
+    # Call LLM without holding the DB open; the call can take minutes.
+    console.print("[dim]Analyzing with LLM...[/dim]")
+    try:
+        result = _call_llm(backend, model, SYSTEM_PROMPT, user_prompt)
+    except Exception as e:
+        console.print(f"[red]LLM call failed: {e}[/red]")
+        raise typer.Exit(1)
 
-        # Save assessment
+    # Save assessment
+    conn = get_db(repo_path)
+    try:
         assessment = create_assessment(
             conn,
             checkpoint_id=checkpoint_id,
@@ -146,51 +221,53 @@ def futures_assess(
 def futures_list(
     verdict: Optional[str] = typer.Option(None, "--verdict", "-v", help="Filter by verdict (expand/narrow/neutral)"),
     limit: int = typer.Option(20, "--limit", "-n"),
+    before: Optional[str] = typer.Option(
+        None,
+        "--before",
+        help="Only assessments created before this timestamp (the cursor printed by the previous page)",
+    ),
+    before_id: Optional[str] = typer.Option(
+        None, "--before-id", help="Tiebreaker for --before: the assessment ID printed with the cursor"
+    ),
 ):
     """List futures assessments."""
-    from ..core.futures import list_assessments
-    from ..core.project import find_git_root
-    from ..db import get_db
+    from rich.table import Table
 
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
+    from ..core.futures import iter_assessments
 
-    conn = get_db(repo_path)
+    # Rows go from the cursor straight into the table; no intermediate list of dicts.
+    table = Table()
+    table.add_column("ID", style="dim", max_width=12)
+    table.add_column("Verdict")
+    table.add_column("Impact")
+    table.add_column("Feedback")
+    table.add_column("Created")
+
+    conn, _ = get_repo_connection(migrate=False)
     try:
-        assessments = list_assessments(conn, verdict=verdict, limit=limit)
+        last_created = last_id = None
+        for a in iter_assessments(conn, verdict=verdict, limit=limit, before=before, before_id=before_id):
+            last_created, last_id = a["created_at"], a["id"]
+            table.add_row(
+                a["id"][:12],
+                _verdict_cell(a["verdict"] or ""),
+                (a["impact_summary"] or "")[:60],
+                a["feedback"] or "",
+                a["created_at"],
+            )
     except ValueError as e:
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1)
     finally:
         conn.close()
 
-    if not assessments:
+    if not table.row_count:
         console.print("[dim]No assessments found.[/dim]")
         return
 
-    table = Table(title=f"Assessments ({len(assessments)})")
-    table.add_column("ID", style="dim", max_width=12)
-    table.add_column("Verdict")
-    table.add_column("Impact")
-    table.add_column("Feedback")
-    table.add_column("Created")
-
-    verdict_colors = {"expand": "green", "narrow": "red", "neutral": "yellow"}
-    for a in assessments:
-        v = a.get("verdict", "")
-        color = verdict_colors.get(v, "white")
-        fb = a.get("feedback") or ""
-        table.add_row(
-            a["id"][:12],
-            f"[{color}]{v}[/{color}]",
-            (a.get("impact_summary") or "")[:60],
-            fb,
-            a.get("created_at", ""),
-        )
-
+    table.title = f"Assessments ({table.row_count})"
     console.print(table)
+    print_next_cursor(table.row_count, limit, last_created, last_id)
 
 
 @futures_app.command("feedback")
@@ -200,32 +277,25 @@ def futures_feedback(
     reason: Optional[str] = typer.Option(None, "--reason", "-r", help="Feedback reason"),
 ):
     """Add feedback to an assessment."""
+    from ..core.config import load_config
     from ..core.futures import add_feedback, auto_distill_lessons
-    from ..core.project import find_git_root
-    from ..db import get_db
 
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
-
-    conn = get_db(repo_path)
+    conn, repo_path = get_repo_connection(migrate=False)
     try:
-        add_feedback(conn, assessment_id, feedback, feedback_reason=reason)
-    except ValueError as e:
-        console.print(f"[red]{e}[/red]")
-        raise typer.Exit(1)
-    finally:
-        conn.close()
-
-    console.print(f"[green]Feedback recorded:[/green] {feedback} on {assessment_id[:12]}")
+        try:
+            add_feedback(conn, assessment_id, feedback, feedback_reason=reason)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            raise typer.Exit(1)
 
-    from ..core.config import load_config
+        console.print(f"[green]Feedback recorded:[/green] {feedback} on {assessment_id[:12]}")
 
-    config = load_config(repo_path)
-    if auto_distill_lessons(repo_path):
-        output = config.get("futures", {}).get("lessons_output", "LESSONS.md")
-        console.print(f"[dim]Auto-updated {output}[/dim]")
+        config = load_config(repo_path)
+        if auto_distill_lessons(repo_path, conn=conn):
+            output = config.get("futures", {}).get("lessons_output", "LESSONS.md")
+            console.print(f"[dim]Auto-updated {output}[/dim]")
+    finally:
+        conn.close()
 
 
 @futures_app.command("lessons")
@@ -237,23 +307,13 @@ def futures_lessons(
 ):
     """Generate LESSONS.md from assessed changes with feedback."""
     from ..core.futures import distill_lessons, get_lessons
-    from ..core.project import find_git_root
-    from ..db import get_db
 
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
-
-    conn = get_db(repo_path)
+    conn, _ = get_repo_connection(migrate=False)
     try:
-        lessons = get_lessons(conn)
+        lessons = get_lessons(conn, since=since)
     finally:
         conn.close()
 
-    if since:
-        lessons = [item for item in lessons if (item.get("created_at") or "") >= since]
-
     text = distill_lessons(lessons)
     Path(output).write_text(text, encoding="utf-8")
     console.print(f"[green]Written {len(lessons)} lessons to {output}[/green]")
@@ -324,15 +384,8 @@ def futures_relate(
     Example: ec futures relate abc123 causes def456
     """
     from ..core.futures import add_assessment_relationship
-    from ..core.project import find_git_root
-    from ..db import get_db
 
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
-
-    conn = get_db(repo_path)
+    conn, _ = get_repo_connection(migrate=False)
     try:
         rel = add_assessment_relationship(conn, source_id, target_id, relationship_type, note=note)
     except ValueError as e:
@@ -341,8 +394,7 @@ def futures_relate(
     finally:
         conn.close()
 
-    type_colors = {"causes": "red", "fixes": "green", "contradicts": "yellow"}
-    color = type_colors.get(relationship_type, "white")
+    color = RELATIONSHIP_COLORS.get(relationship_type, "white")
     console.print(
         f"[green]Relationship added:[/green] {rel['source_id'][:12]} [{color}]{relationship_type}[/{color}] {rel['target_id'][:12]}"
     )
@@ -357,15 +409,8 @@ def futures_relationships(
 ):
     """List typed relationships for an assessment."""
     from ..core.futures import get_assessment_relationships
-    from ..core.project import find_git_root
-    from ..db import get_db
-
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
 
-    conn = get_db(repo_path)
+    conn, _ = get_repo_connection(migrate=False)
     try:
         rels = get_assessment_relationships(conn, assessment_id, direction=direction)
     finally:
@@ -375,8 +420,7 @@ def futures_relationships(
         console.print("[dim]No relationships found.[/dim]")
         return
 
-    type_colors = {"causes": "red", "fixes": "green", "contradicts": "yellow"}
-    type_icons = {"causes": "→", "fixes": "✓", "contradicts": "≠"}
+    from rich.table import Table
 
     table = Table(title=f"Relationships for {assessment_id[:12]} ({len(rels)})")
     table.add_column("Direction", style="dim", max_width=10)
@@ -396,8 +440,8 @@ def futures_relationships(
             summary = (r.get("source_impact_summary") or "")[:50]
 
         rtype = r["relationship_type"]
-        color = type_colors.get(rtype, "white")
-        icon = type_icons.get(rtype, "")
+        color = RELATIONSHIP_COLORS.get(rtype, "white")
+        icon = RELATIONSHIP_ICONS.get(rtype, "")
         table.add_row(
             dir_label,
             f"[{color}]{icon} {rtype}[/{color}]",
@@ -417,15 +461,8 @@ def futures_unrelate(
 ):
     """Remove a typed relationship between two assessments."""
     from ..core.futures import remove_assessment_relationship
-    from ..core.project import find_git_root
-    from ..db import get_db
-
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
 
-    conn = get_db(repo_path)
+    conn, _ = get_repo_connection(migrate=False)
     try:
         removed = remove_assessment_relationship(conn, source_id, target_id, relationship_type)
     finally:
@@ -449,35 +486,38 @@ def futures_trend(
 
     trends, warnings = cross_repo_assessment_trends(repos=repos, since=since, include_warnings=True)
 
-    for w in warnings:
-        console.print(f"[yellow]Warning:[/yellow] {w}")
+    from rich.console import Group
+
+    # Everything is collected and written with a single console.print.
+    renderables: list = [f"[yellow]Warning:[/yellow] {w}" for w in warnings]
 
     total = trends["total_count"]
     if total == 0:
-        console.print("[dim]No assessments found across repos.[/dim]")
+        renderables.append("[dim]No assessments found across repos.[/dim]")
+        console.print(Group(*renderables))
         return
 
+    from rich.table import Table
+
     overall = trends["overall"]
-    console.print(f"\n[bold]Cross-Repo Assessment Trends[/bold] — {total} total\n")
+    renderables.append(f"\n[bold]Cross-Repo Assessment Trends[/bold] — {total} total\n")
 
     overall_table = Table(title="Overall Distribution")
     overall_table.add_column("Verdict")
     overall_table.add_column("Count", justify="right")
     overall_table.add_column("Pct", justify="right")
 
-    verdict_colors = {"expand": "green", "narrow": "red", "neutral": "yellow"}
-    verdict_icons = {"expand": "🟢", "narrow": "🔴", "neutral": "🟡"}
     for v in ("expand", "narrow", "neutral"):
         count = overall.get(v, 0)
         pct = f"{100 * count / total:.0f}%" if total else "0%"
-        color = verdict_colors.get(v, "white")
-        icon = verdict_icons.get(v, "")
+        color = VERDICT_COLORS.get(v, "white")
+        icon = VERDICT_ICONS.get(v, "")
         overall_table.add_row(f"[{color}]{icon} {v}[/{color}]", str(count), pct)
 
-    console.print(overall_table)
+    renderables.append(overall_table)
 
     with_fb = trends["with_feedback"]
-    console.print(f"\nWith feedback: {with_fb}/{total} ({100 * with_fb // total if total else 0}%)\n")
+    renderables.append(f"\nWith feedback: {with_fb}/{total} ({100 * with_fb // total if total else 0}%)\n")
 
     by_repo = trends["by_repo"]
     if len(by_repo) > 1:
@@ -498,7 +538,9 @@ def futures_trend(
                 str(stats["neutral"]),
                 str(stats["with_feedback"]),
             )
-        console.print(repo_table)
+        renderables.append(repo_table)
+
+    console.print(Group(*renderables))
 
 
 @futures_app.command("report")
@@ -510,19 +552,14 @@ def futures_report(
     limit: int = typer.Option(100, "--limit", "-n", help="Maximum number of assessments to include"),
 ):
     """Generate a Markdown futures report — team-shareable summary of assessment trends."""
+    import sys
     from pathlib import Path
 
     from ..core.futures import list_assessments
-    from ..core.project import find_git_root, get_project
-    from ..core.report import generate_futures_report
-    from ..db import get_db
-
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
+    from ..core.project import get_project
+    from ..core.report import iter_futures_report
 
-    conn = get_db(repo_path)
+    conn, repo_path = get_repo_connection(migrate=False)
     try:
         # Pass `since` to SQL so LIMIT is applied after the date filter
         assessments = list_assessments(conn, limit=limit, since=since)
@@ -532,13 +569,16 @@ def futures_report(
 
     project_name = project.get("name") if project else None
 
-    report = generate_futures_report(assessments, project_name=project_name, since=since)
+    chunks = iter_futures_report(assessments, project_name=project_name, since=since)
 
+    # Written chunk by chunk; the full report string is never built.
     if output:
-        Path(output).write_text(report, encoding="utf-8")
+        with Path(output).open("w", encoding="utf-8") as f:
+            f.writelines(chunks)
         console.print(f"[green]Report written to:[/green] {output}")
     else:
-        typer.echo(report)
+        sys.stdout.writelines(chunks)
+        sys.stdout.write("\n")
 
 
 @futures_app.command("tidy-pr")
@@ -554,16 +594,9 @@ def futures_tidy_pr(
     """Generate a tidy PR draft from narrow assessment suggestions (rule-based)."""
     from pathlib import Path
 
-    from ..core.project import find_git_root
     from ..core.tidy_pr import generate_tidy_pr
-    from ..db import get_db
 
-    repo_path = find_git_root()
-    if not repo_path:
-        console.print("[red]Not in a git repository.[/red]")
-        raise typer.Exit(1)
-
-    conn = get_db(repo_path)
+    conn, _ = get_repo_connection(migrate=False)
     try:
         pr_text = generate_tidy_pr(conn, since=since, limit=limit)
     finally:
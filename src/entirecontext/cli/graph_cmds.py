@@ -3,10 +3,8 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .helpers import console
 
 
 def graph_cmd(
@@ -40,6 +38,9 @@ def graph_cmd(
         console.print("[dim]No graph data found. Run some sessions first.[/dim]")
         return
 
+    from rich.console import Group
+    from rich.table import Table
+
     # Nodes by type table
     nodes_table = Table(title="Knowledge Graph — Nodes")
     nodes_table.add_column("Type", style="cyan")
@@ -49,8 +50,6 @@ def graph_cmd(
         nodes_table.add_row(ntype, str(count))
     nodes_table.add_row("[bold]Total[/bold]", f"[bold]{stats['total_nodes']}[/bold]")
 
-    console.print(nodes_table)
-
     # Edges by relation table
     edges_table = Table(title="Knowledge Graph — Edges")
     edges_table.add_column("Relation", style="green")
@@ -60,7 +59,7 @@ def graph_cmd(
         edges_table.add_row(rel, str(count))
     edges_table.add_row("[bold]Total[/bold]", f"[bold]{stats['total_edges']}[/bold]")
 
-    console.print(edges_table)
+    console.print(Group(nodes_table, edges_table))
 
 
 def register(app: typer.Typer) -> None:
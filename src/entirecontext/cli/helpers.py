@@ -3,11 +3,45 @@
 from __future__ import annotations
 
 import sqlite3
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _LazyConsole:
+    """Proxy for the shared rich Console that builds it on first use.
+
+    Importing ``rich.console`` and probing the terminal is deferred until a
+    command actually prints, so dispatch and ``--help`` stay cheap.
+    """
+
+    _console: Console | None = None
+
+    def _get(self) -> Console:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+
+# Single Console shared by every command module, so terminal detection runs once per process.
+console: Console = _LazyConsole()  # type: ignore[assignment]
+
+
+def print_next_cursor(shown: int, limit: int, last_created: str | None, last_id: str | None) -> None:
+    """Print the ``--before``/``--before-id`` cursor for the next page when this page was full."""
+    if shown >= limit and last_created:
+        hint = f"--before {last_created}"
+        if last_id:
+            hint += f" --before-id {last_id}"
+        console.print(f"[dim]Next page:[/dim] {hint}")
 
 
 def get_repo_connection(*, migrate: bool = True) -> tuple[sqlite3.Connection, str]:
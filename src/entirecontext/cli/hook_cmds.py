@@ -14,12 +14,10 @@ def hook_handle(
     hook_type_arg: str = typer.Option(None, "--type", "-t", help="Hook type (e.g. SessionStart)"),
 ):
     """Read stdin JSON and dispatch to appropriate hook handler."""
-    import io
     import json
 
     from ..hooks.handler import handle_hook
 
-    raw = ""
     data = {}
     try:
         raw = sys.stdin.read()
@@ -32,10 +30,9 @@ def hook_handle(
     if not resolved_type:
         resolved_type = data.get("hook_type") or data.get("type")
 
-    if raw.strip():
-        sys.stdin = io.StringIO(raw)
-
-    exit_code = handle_hook(resolved_type, data=data if data else None)
+    # stdin is consumed and parsed exactly once; passing the dict (even when
+    # empty) keeps handle_hook from re-reading a re-wrapped copy of it.
+    exit_code = handle_hook(resolved_type, data=data)
     raise typer.Exit(exit_code)
 
 
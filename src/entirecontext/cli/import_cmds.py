@@ -6,9 +6,8 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 
-console = Console()
+from .helpers import console
 
 
 def import_cmd(
@@ -81,23 +80,17 @@ def _import_from_aline(
         if result.skipped:
             console.print(f"  Skipped: {result.skipped}")
 
-        if result.errors:
-            console.print(f"\n[red]Errors ({len(result.errors)}):[/red]")
-            for err in result.errors[:10]:
+        if result.error_count:
+            console.print(f"\n[red]Errors ({result.error_count}):[/red]")
+            for err in result.errors:
                 console.print(f"  {err}")
-            if len(result.errors) > 10:
-                console.print(f"  ... and {len(result.errors) - 10} more")
+            if result.error_count > len(result.errors):
+                console.print(f"  ... and {result.error_count - len(result.errors)} more")
             raise typer.Exit(1)
 
-        if not dry_run:
-            try:
-                from ..core.search import rebuild_fts_indexes
-
-                rebuild_fts_indexes(conn)
-                console.print("  FTS indexes rebuilt")
-            except Exception:
-                pass
-
+        # No FTS rebuild here: the importer only issues INSERT OR IGNORE, so the
+        # fts_* insert triggers already indexed every new row. `ec index` remains
+        # the way to rebuild from scratch.
         console.print("[green]Import complete.[/green]")
     finally:
         conn.close()
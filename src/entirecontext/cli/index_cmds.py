@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 import typer
-from rich.console import Console
 
-console = Console()
+from .helpers import console
 
 
 def index_cmd(
@@ -14,6 +15,9 @@ def index_cmd(
     ),
     force: bool = typer.Option(False, "--force", help="Force regenerate all embeddings"),
     model: str = typer.Option("all-MiniLM-L6-v2", "--model", help="Embedding model name"),
+    device: Optional[str] = typer.Option(
+        None, "--device", help="Torch device for embeddings (cpu, cuda, mps); auto-detected by default"
+    ),
 ):
     """Rebuild search indexes (FTS5) and optionally generate embeddings."""
     from ..core.project import find_git_root
@@ -37,7 +41,7 @@ def index_cmd(
             try:
                 from ..core.embedding import generate_embeddings
 
-                count = generate_embeddings(conn, repo_path, model_name=model, force=force)
+                count = generate_embeddings(conn, repo_path, model_name=model, force=force, device=device)
                 console.print(f"[green]Generated {count} embeddings[/green] (model: {model})")
             except ImportError as e:
                 console.print(f"[red]{e}[/red]")
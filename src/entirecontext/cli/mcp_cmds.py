@@ -3,23 +3,29 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
 
-console = Console()
+from .helpers import console
+
 mcp_app = typer.Typer(help="MCP server management")
 
+_MCP_MODULES = frozenset({"mcp", "entirecontext.mcp", "entirecontext.mcp.server"})
+
 
 @mcp_app.command("serve")
 def mcp_serve():
     """Start the MCP server (stdio transport)."""
     try:
         from ..mcp.server import run_server
-
-        run_server()
-    except ImportError:
+    except ImportError as exc:
+        # Only a missing MCP package means "not installed"; anything else is a
+        # real bug inside the server module and should surface as-is.
+        if exc.name not in _MCP_MODULES:
+            raise
         console.print("[red]MCP not available. Install with: pip install 'entirecontext[mcp]'[/red]")
         raise typer.Exit(1)
 
+    run_server()
+
 
 def register(app: typer.Typer) -> None:
     app.add_typer(mcp_app, name="mcp")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 import stat
@@ -10,13 +11,35 @@ import tomllib
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .helpers import console
 
 _AGENT_CHOICES = {"claude", "codex", "both"}
 
+# Claude Code hook events ec installs, with their timeouts in seconds.
+_EC_HOOK_TIMEOUTS = {
+    "SessionStart": 5,
+    "UserPromptSubmit": 5,
+    "Stop": 10,
+    "PostToolUse": 3,
+    "SessionEnd": 5,
+}
+
+
+def _read_json(path: Path) -> dict:
+    """Parse a JSON settings file, or return {} if it does not exist."""
+    try:
+        return json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+
+
+def _atomic_write_json(path: Path, data: dict) -> None:
+    """Write ``data`` as indented JSON via tmp+rename so a crash never truncates ``path``."""
+    from ..core.config import replace_file
+
+    replace_file(path, json.dumps(data, indent=2) + "\n")
+
 
 def _parse_agent_option(agent: str) -> str:
     value = (agent or "claude").strip().lower()
@@ -26,8 +49,9 @@ def _parse_agent_option(agent: str) -> str:
 
 
 def _resolve_ec_codex_notify_command() -> list[str]:
-    if shutil.which("ec"):
-        return [str(Path(shutil.which("ec")).resolve()), "hook", "codex-notify"]
+    ec_bin = _ec_bin()
+    if ec_bin:
+        return [ec_bin, "hook", "codex-notify"]
     return [sys.executable, "-m", "entirecontext.cli", "hook", "codex-notify"]
 
 
@@ -39,10 +63,11 @@ def _is_ec_codex_notify_command(command: list[str]) -> bool:
 
 
 def _read_toml_file(path: Path) -> dict:
-    if not path.exists():
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except FileNotFoundError:
         return {}
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
     return data if isinstance(data, dict) else {}
 
 
@@ -53,10 +78,6 @@ def _write_toml_file(path: Path, data: dict) -> None:
     _write_toml(path, data)
 
 
-def _codex_state_path(repo_path: str) -> Path:
-    return _codex_global_state_path()
-
-
 def _codex_legacy_state_path(repo_path: str) -> Path:
     return Path(repo_path) / ".entirecontext" / "state" / "codex_notify.json"
 
@@ -74,11 +95,8 @@ def _codex_project_config_path(repo_path: str) -> Path:
 
 
 def _read_global_state() -> dict:
-    state_path = _codex_global_state_path()
-    if not state_path.exists():
-        return {}
     try:
-        data = json.loads(state_path.read_text(encoding="utf-8"))
+        data = _read_json(_codex_global_state_path())
     except json.JSONDecodeError:
         return {}
     return data if isinstance(data, dict) else {}
@@ -87,7 +105,7 @@ def _read_global_state() -> dict:
 def _write_global_state(state: dict) -> None:
     state_path = _codex_global_state_path()
     state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
+    _atomic_write_json(state_path, state)
 
 
 _UNSET = object()
@@ -149,14 +167,12 @@ def _load_codex_upstream(repo_path: str) -> list[str] | None:
     if result:
         return result
 
-    legacy_path = _codex_legacy_state_path(repo_path)
-    if legacy_path.exists():
-        try:
-            legacy = json.loads(legacy_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return None
-        if isinstance(legacy, dict):
-            return _validate_upstream(legacy.get("upstream_notify"))
+    try:
+        legacy = _read_json(_codex_legacy_state_path(repo_path))
+    except json.JSONDecodeError:
+        return None
+    if isinstance(legacy, dict):
+        return _validate_upstream(legacy.get("upstream_notify"))
     return None
 
 
@@ -253,16 +269,42 @@ def _disable_codex_notify(repo_path: str) -> bool:
     return found
 
 
+@functools.cache
+def _ec_bin() -> str | None:
+    """Resolved path of the ``ec`` script on PATH, or None; looked up once per process."""
+    ec_path = shutil.which("ec")
+    return str(Path(ec_path).resolve()) if ec_path else None
+
+
+def _ec_executable() -> str:
+    """Command prefix that runs this install's ``ec``."""
+    return _ec_bin() or f"{sys.executable} -m entirecontext.cli"
+
+
+def _ec_hook_base() -> str:
+    return f"{_ec_executable()} hook handle"
+
+
 def _resolve_ec_command(hook_type: str | None = None) -> str:
-    if shutil.which("ec"):
-        base = f"{Path(shutil.which('ec')).resolve()} hook handle"
-    else:
-        base = f"{sys.executable} -m entirecontext.cli hook handle"
+    base = _ec_hook_base()
     if hook_type:
         base += f" --type {hook_type}"
     return base
 
 
+def _build_ec_hooks() -> dict[str, list[dict]]:
+    """Claude Code hook entries ec installs, keyed by event name."""
+    return {
+        name: [
+            {
+                "matcher": "",
+                "hooks": [{"type": "command", "command": _resolve_ec_command(name), "timeout": timeout}],
+            }
+        ]
+        for name, timeout in _EC_HOOK_TIMEOUTS.items()
+    }
+
+
 def _is_ec_hook(entry: dict) -> bool:
     cmd = entry.get("command", "")
     if "ec hook handle" in cmd or "entirecontext.cli hook handle" in cmd:
@@ -288,6 +330,30 @@ def init():
         raise typer.Exit(1)
 
 
+def _read_hook_script(hook_path: Path) -> str:
+    """Return a git hook's contents, or "" if it does not exist (one open, no separate stat)."""
+    try:
+        return hook_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+
+
+@functools.cache
+def _git_hook_scripts() -> dict[str, str]:
+    """Git hook name -> script body; built once per process like the command they run."""
+    ec = _ec_executable()
+    return {
+        "post-commit": f"""#!/bin/sh
+# EntireContext: create checkpoint on commit if active session
+{ec} hook handle --type PostCommit
+""",
+        "pre-push": f"""#!/bin/sh
+# EntireContext: sync on push if auto_sync_on_push is enabled
+{ec} sync --if-enabled
+""",
+    }
+
+
 def _install_git_hooks(repo_path: str) -> list[str]:
     """Install git hooks (post-commit, pre-push). Returns list of installed hook names."""
     hooks_dir = Path(repo_path) / ".git" / "hooks"
@@ -295,23 +361,10 @@ def _install_git_hooks(repo_path: str) -> list[str]:
         return []
 
     installed = []
-    ec_cmd = _resolve_ec_command()
-
-    post_commit_script = f"""#!/bin/sh
-# EntireContext: create checkpoint on commit if active session
-{ec_cmd.replace("hook handle", "hook handle --type PostCommit")}
-"""
-    pre_push_script = f"""#!/bin/sh
-# EntireContext: sync on push if auto_sync_on_push is enabled
-{ec_cmd.replace("hook handle", "sync --if-enabled")}
-"""
-
-    for name, script in [("post-commit", post_commit_script), ("pre-push", pre_push_script)]:
+    for name, script in _git_hook_scripts().items():
         hook_path = hooks_dir / name
-        if hook_path.exists():
-            content = hook_path.read_text(encoding="utf-8")
-            if "EntireContext" in content:
-                continue
+        if "EntireContext" in _read_hook_script(hook_path):
+            continue
         hook_path.write_text(script, encoding="utf-8")
         hook_path.chmod(hook_path.stat().st_mode | stat.S_IEXEC)
         installed.append(name)
@@ -326,13 +379,11 @@ def _remove_git_hooks(repo_path: str) -> list[str]:
         return []
 
     removed = []
-    for name in ("post-commit", "pre-push"):
+    for name in _git_hook_scripts():
         hook_path = hooks_dir / name
-        if hook_path.exists():
-            content = hook_path.read_text(encoding="utf-8")
-            if "EntireContext" in content:
-                hook_path.unlink()
-                removed.append(name)
+        if "EntireContext" in _read_hook_script(hook_path):
+            hook_path.unlink()
+            removed.append(name)
 
     return removed
 
@@ -351,38 +402,19 @@ def enable(
         raise typer.Exit(1)
 
     if agent in {"claude", "both"}:
-        settings_path = Path(repo_path) / ".claude" / "settings.local.json"
-        settings_path.parent.mkdir(parents=True, exist_ok=True)
-
-        settings: dict = {}
-        if settings_path.exists():
-            settings = json.loads(settings_path.read_text(encoding="utf-8"))
+        claude_dir = Path(repo_path) / ".claude"
+        claude_dir.mkdir(parents=True, exist_ok=True)
+        settings_path = claude_dir / "settings.local.json"
 
+        settings = _read_json(settings_path)
         hooks = settings.setdefault("hooks", {})
-        hook_timeouts = {
-            "SessionStart": 5,
-            "UserPromptSubmit": 5,
-            "Stop": 10,
-            "PostToolUse": 3,
-            "SessionEnd": 5,
-        }
-        ec_hooks = {
-            name: [
-                {
-                    "matcher": "",
-                    "hooks": [{"type": "command", "command": _resolve_ec_command(name), "timeout": timeout}],
-                }
-            ]
-            for name, timeout in hook_timeouts.items()
-        }
-
-        for hook_name, hook_configs in ec_hooks.items():
+        for hook_name, hook_configs in _build_ec_hooks().items():
             existing = hooks.get(hook_name, [])
             existing = [h for h in existing if not _is_ec_hook(h)]
             existing.extend(hook_configs)
             hooks[hook_name] = existing
 
-        settings_path.write_text(json.dumps(settings, indent=2) + "\n", encoding="utf-8")
+        _atomic_write_json(settings_path, settings)
         console.print("[green]Hooks installed[/green] in .claude/settings.local.json")
 
         if not no_git_hooks:
@@ -396,18 +428,16 @@ def enable(
 
     user_settings_path = Path.home() / ".claude" / "settings.json"
     user_settings_path.parent.mkdir(parents=True, exist_ok=True)
-    user_settings: dict = {}
-    if user_settings_path.exists():
-        user_settings = json.loads(user_settings_path.read_text(encoding="utf-8"))
+    user_settings = _read_json(user_settings_path)
     mcp_servers = user_settings.setdefault("mcpServers", {})
     if "entirecontext" not in mcp_servers:
-        ec_bin = shutil.which("ec")
+        ec_bin = _ec_bin()
         mcp_servers["entirecontext"] = {
-            "command": str(Path(ec_bin).resolve()) if ec_bin else sys.executable,
+            "command": ec_bin or sys.executable,
             "args": ["mcp", "serve"] if ec_bin else ["-m", "entirecontext.cli", "mcp", "serve"],
             "type": "stdio",
         }
-        user_settings_path.write_text(json.dumps(user_settings, indent=2) + "\n", encoding="utf-8")
+        _atomic_write_json(user_settings_path, user_settings)
         console.print("[green]MCP server configured[/green] in ~/.claude/settings.json")
 
 
@@ -424,28 +454,28 @@ def disable(
         raise typer.Exit(1)
 
     if agent in {"claude", "both"}:
-        local_settings_path = Path(repo_path) / ".claude" / "settings.local.json"
-        settings_path = Path(repo_path) / ".claude" / "settings.json"
+        claude_dir = Path(repo_path) / ".claude"
+        local_settings_path = claude_dir / "settings.local.json"
+        settings_path = claude_dir / "settings.json"
         changed = False
 
         for path in [local_settings_path, settings_path]:
-            if not path.exists():
-                continue
-            settings = json.loads(path.read_text(encoding="utf-8"))
+            settings = _read_json(path)
             hooks = settings.get("hooks", {})
             path_changed = False
             for hook_name in list(hooks.keys()):
                 original = hooks[hook_name]
+                if not any(_is_ec_hook(h) for h in original):
+                    continue
                 filtered = [h for h in original if not _is_ec_hook(h)]
-                if len(filtered) != len(original):
-                    path_changed = True
-                    changed = True
+                path_changed = True
+                changed = True
                 if filtered:
                     hooks[hook_name] = filtered
                 else:
                     del hooks[hook_name]
             if path_changed:
-                path.write_text(json.dumps(settings, indent=2) + "\n", encoding="utf-8")
+                _atomic_write_json(path, settings)
 
         if changed:
             console.print("[yellow]Hooks removed[/yellow] from .claude/settings.local.json")
@@ -467,17 +497,19 @@ def status(
     agent: str = typer.Option("claude", "--agent", help="View status for claude|codex|both"),
 ):
     """Show EntireContext capture status."""
-    from ..core.project import find_git_root
     from ..core.project import get_status
 
     agent = _parse_agent_option(agent)
-    st = get_status()
+    show_codex = agent in {"codex", "both"}
+    st = get_status(include_codex=show_codex)
 
     if not st.get("initialized"):
         console.print("[yellow]EntireContext is not initialized in this repository.[/yellow]")
         console.print("Run [bold]ec init[/bold] to get started.")
         return
 
+    from rich.table import Table
+
     table = Table(title="EntireContext Status")
     table.add_column("Property", style="bold")
     table.add_column("Value")
@@ -495,22 +527,9 @@ def status(
     else:
         table.add_row("Active Session", "None")
 
-    repo_path = find_git_root()
-    if repo_path and agent in {"codex", "both"}:
-        from ..db import get_db
-
-        conn = get_db(repo_path)
-        try:
-            codex_sessions = conn.execute("SELECT COUNT(*) FROM sessions WHERE session_type = 'codex'").fetchone()[0]
-            codex_turns = conn.execute(
-                """SELECT COUNT(*)
-                   FROM turns t JOIN sessions s ON s.id = t.session_id
-                   WHERE s.session_type = 'codex'"""
-            ).fetchone()[0]
-        finally:
-            conn.close()
-        table.add_row("Codex Sessions", str(codex_sessions))
-        table.add_row("Codex Turns", str(codex_turns))
+    if show_codex:
+        table.add_row("Codex Sessions", str(st["codex_session_count"]))
+        table.add_row("Codex Turns", str(st["codex_turn_count"]))
 
     console.print(table)
 
@@ -558,7 +577,8 @@ def doctor(
         console.print("[red]Not in a git repository.[/red]")
         raise typer.Exit(1)
 
-    ec_dir = Path(repo_path) / ".entirecontext"
+    repo = Path(repo_path)
+    ec_dir = repo / ".entirecontext"
     if not ec_dir.exists():
         issues.append("EntireContext not initialized. Run 'ec init'.")
     else:
@@ -587,18 +607,16 @@ def doctor(
                 conn.close()
 
     if agent in {"claude", "both"}:
-        local_settings_path = Path(repo_path) / ".claude" / "settings.local.json"
-        settings_path = Path(repo_path) / ".claude" / "settings.json"
+        claude_dir = repo / ".claude"
+        local_settings_path = claude_dir / "settings.local.json"
+        settings_path = claude_dir / "settings.json"
         active_settings_path = local_settings_path if local_settings_path.exists() else settings_path
         if not active_settings_path.exists():
             warnings.append("No .claude/settings.local.json found. Run 'ec enable'.")
         else:
-            settings = json.loads(active_settings_path.read_text(encoding="utf-8"))
+            settings = _read_json(active_settings_path)
             hooks = settings.get("hooks", {})
-            ec_hooks_found = any(
-                any(_is_ec_hook(h) for h in hooks.get(k, []))
-                for k in ["SessionStart", "UserPromptSubmit", "Stop", "PostToolUse", "SessionEnd"]
-            )
+            ec_hooks_found = any(_is_ec_hook(h) for name in _EC_HOOK_TIMEOUTS for h in hooks.get(name, ()))
             if not ec_hooks_found:
                 warnings.append("EntireContext hooks not installed. Run 'ec enable'.")
 
@@ -616,19 +634,15 @@ def doctor(
             else:
                 state = _read_global_state()
                 repo_enrolled = repo_path in state.get("repos", {})
-                legacy_state = Path(repo_path) / ".entirecontext" / "state" / "codex_notify.json"
+                legacy_state = ec_dir / "state" / "codex_notify.json"
                 if not repo_enrolled and not legacy_state.exists():
                     warnings.append(
                         "This repo is not enrolled for Codex capture. Run 'ec enable --agent codex' in this repo."
                     )
 
     if agent in {"claude", "both"}:
-        user_settings_path = Path.home() / ".claude" / "settings.json"
-        if user_settings_path.exists():
-            user_settings = json.loads(user_settings_path.read_text(encoding="utf-8"))
-            if "entirecontext" not in user_settings.get("mcpServers", {}):
-                warnings.append("MCP server not configured. Run 'ec enable' to add MCP support.")
-        else:
+        user_settings = _read_json(Path.home() / ".claude" / "settings.json")
+        if "entirecontext" not in user_settings.get("mcpServers", {}):
             warnings.append("MCP server not configured. Run 'ec enable' to add MCP support.")
 
     if issues:
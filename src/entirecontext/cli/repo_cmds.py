@@ -5,10 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.table import Table
 
-console = Console()
+from .helpers import console
+
 repo_app = typer.Typer(help="Repository management")
 
 
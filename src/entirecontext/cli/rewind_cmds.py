@@ -5,9 +5,8 @@ from __future__ import annotations
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 
-console = Console()
+from .helpers import console
 
 
 def rewind(
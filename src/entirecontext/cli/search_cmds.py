@@ -7,10 +7,9 @@ import time
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 from rich.table import Table
 
-console = Console()
+from .helpers import console
 
 
 def search(
@@ -74,6 +73,12 @@ def search(
         except ValueError as exc:
             console.print(f"[red]{exc}[/red]")
             raise typer.Exit(1)
+        except ImportError:
+            console.print(
+                "[red]sentence-transformers is required for semantic search. "
+                "Install with: pip install 'entirecontext[semantic]'[/red]"
+            )
+            raise typer.Exit(1)
     else:
         from ..core.telemetry import detect_current_context, record_retrieval_event
         from ..db import check_and_migrate, get_db
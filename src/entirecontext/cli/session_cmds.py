@@ -5,10 +5,10 @@ from __future__ import annotations
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 from rich.table import Table
 
-console = Console()
+from .helpers import console
+
 session_app = typer.Typer(help="Session management")
 
 
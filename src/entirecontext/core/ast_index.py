@@ -22,6 +22,8 @@ from __future__ import annotations
 
 import ast
 import json
+import sqlite3
+from functools import lru_cache
 from uuid import uuid4
 
 from .context import transaction
@@ -228,6 +230,27 @@ def get_ast_symbols_for_file(
     return [dict(r) for r in rows]
 
 
+@lru_cache(maxsize=4)
+def _ast_search_sql(has_symbol_type: bool, has_file_filter: bool) -> str:
+    """Build the search statement once per filter combination.
+
+    Keeping the SQL text stable per variant lets sqlite3's statement cache
+    reuse the compiled statement across calls.
+    """
+    # Additional filters are AND-conditions after the FTS MATCH clause
+    extra_sql = ""
+    if has_symbol_type:
+        extra_sql += " AND s.symbol_type = ?"
+    if has_file_filter:
+        extra_sql += " AND s.file_path = ?"
+    return f"""SELECT s.*
+                FROM ast_symbols s
+                JOIN fts_ast_symbols fts ON fts.rowid = s.rowid
+                WHERE fts_ast_symbols MATCH ?{extra_sql}
+                ORDER BY rank
+                LIMIT ?"""
+
+
 def search_ast_symbols(
     conn,
     query: str,
@@ -258,31 +281,14 @@ def search_ast_symbols(
     safe_query = query.replace('"', '""')
 
     params: list = [f'"{safe_query}"']
-    where_clauses: list[str] = []
-
     if symbol_type:
-        where_clauses.append("s.symbol_type = ?")
         params.append(symbol_type)
     if file_filter:
-        where_clauses.append("s.file_path = ?")
         params.append(file_filter)
-
-    # Additional filters are AND-conditions after the FTS MATCH clause
-    extra_sql = (" AND " + " AND ".join(where_clauses)) if where_clauses else ""
-
-    import sqlite3
+    params.append(limit)
 
     try:
-        rows = conn.execute(
-            f"""SELECT s.*
-                FROM ast_symbols s
-                JOIN fts_ast_symbols fts ON fts.rowid = s.rowid
-                WHERE fts_ast_symbols MATCH ?
-                {extra_sql}
-                ORDER BY rank
-                LIMIT ?""",
-            params + [limit],
-        ).fetchall()
+        rows = conn.execute(_ast_search_sql(bool(symbol_type), bool(file_filter)), params).fetchall()
     except sqlite3.OperationalError:
         # FTS table not yet initialised or query syntax error
         return []
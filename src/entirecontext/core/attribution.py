@@ -180,11 +180,15 @@ def get_file_attribution_summary(conn: sqlite3.Connection, file_path: str) -> di
 
     Returns dict with total lines, human/agent percentages, and per-agent breakdown.
     """
+    # One aggregated row per (human?, agent) — SQLite sums the line spans, so
+    # Python only touches O(distinct agents) rows however long the file is.
     rows = conn.execute(
-        "SELECT a.attribution_type, a.start_line, a.end_line, a.agent_id, "
-        "ag.name as agent_name, ag.agent_type "
+        "SELECT a.attribution_type = 'human' AS is_human, a.agent_id, "
+        "ag.name AS agent_name, ag.agent_type, "
+        "SUM(a.end_line - a.start_line + 1) AS line_count "
         "FROM attributions a LEFT JOIN agents ag ON a.agent_id = ag.id "
-        "WHERE a.file_path = ? ORDER BY a.start_line",
+        "WHERE a.file_path = ? "
+        "GROUP BY is_human, a.agent_id ORDER BY MIN(a.start_line)",
         (file_path,),
     ).fetchall()
 
@@ -204,8 +208,8 @@ def get_file_attribution_summary(conn: sqlite3.Connection, file_path: str) -> di
     agents: dict[str, int] = {}
 
     for r in rows:
-        line_count = r["end_line"] - r["start_line"] + 1
-        if r["attribution_type"] == "human":
+        line_count = r["line_count"]
+        if r["is_human"]:
             human_lines += line_count
         else:
             agent_lines += line_count
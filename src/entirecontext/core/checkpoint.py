@@ -7,6 +7,13 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
+from .resolve import prefix_range
+
+
+# Every column except the JSON blobs (files_snapshot, agent_state, metadata),
+# which can be large and are unused by list views.
+_SUMMARY_COLUMNS = "id, session_id, git_commit_hash, git_branch, parent_checkpoint_id, diff_summary, created_at"
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -55,9 +62,9 @@ def create_checkpoint(
 
 def get_checkpoint(conn, checkpoint_id: str) -> dict | None:
     """Get a checkpoint by ID (supports prefix match)."""
-    row = conn.execute("SELECT * FROM checkpoints WHERE id = ?", (checkpoint_id,)).fetchone()
-    if not row:
-        row = conn.execute("SELECT * FROM checkpoints WHERE id LIKE ?", (f"{checkpoint_id}%",)).fetchone()
+    row = conn.execute(
+        "SELECT * FROM checkpoints WHERE id >= ? AND id < ? ORDER BY id LIMIT 1", prefix_range(checkpoint_id)
+    ).fetchone()
     if row:
         result = dict(row)
         if result.get("files_snapshot"):
@@ -78,9 +85,17 @@ def list_checkpoints(
     conn,
     session_id: str | None = None,
     limit: int = 20,
+    *,
+    include_snapshot: bool = True,
 ) -> list[dict]:
-    """List checkpoints, optionally filtered by session."""
-    query = "SELECT * FROM checkpoints"
+    """List checkpoints, optionally filtered by session.
+
+    With ``include_snapshot=False`` the ``files_snapshot``, ``agent_state`` and
+    ``metadata`` columns are not read, so callers that only render summary
+    fields do not pull per-checkpoint file maps out of SQLite.
+    """
+    columns = "*" if include_snapshot else _SUMMARY_COLUMNS
+    query = f"SELECT {columns} FROM checkpoints"
     params: list[Any] = []
 
     if session_id:
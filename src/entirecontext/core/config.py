@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 import tomllib
 from pathlib import Path
 from typing import Any
@@ -239,11 +241,34 @@ def _parse_value(value: str) -> Any:
     return value
 
 
+def replace_file(path: Path, text: str) -> None:
+    """Durably replace ``path`` with ``text``: write a sibling tmp file, fsync, then rename over it.
+
+    Symlinks are followed (dotfile managers link these files) and the existing
+    file mode is kept; the tmp file is removed if anything fails.
+    """
+    path = path.resolve()
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            try:
+                os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+            except FileNotFoundError:
+                pass
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def _write_toml(path: Path, data: dict) -> None:
     """Write dict as TOML (simple serializer for flat/nested dicts)."""
     lines: list[str] = []
     _write_toml_section(lines, data, [])
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    replace_file(path, "\n".join(lines) + "\n")
 
 
 def _needs_quoting(key: str) -> bool:
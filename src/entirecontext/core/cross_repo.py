@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable
 
@@ -56,7 +58,7 @@ class CrossRepoPolicy:
             for repo in repo_list:
                 try:
                     conn = sqlite3.connect(repo["db_path"], factory=_ECConnection)
-                    _configure_connection(conn)
+                    _configure_connection(conn, repo["db_path"])
                     repo_config = load_config(repo["repo_path"]).get("sync", {})
                     if should_pull(conn, repo_config):
                         conn.close()
@@ -68,53 +70,83 @@ class CrossRepoPolicy:
         except Exception as exc:
             logger.debug("Lazy pull setup failed: %s", exc, exc_info=True)
 
-    def sort_and_limit(self, results: list[dict], *, sort_key: str | None, limit: int) -> list[dict]:
-        if sort_key:
+    def sort_and_limit(self, results: list[dict], *, sort_key: str | tuple[str, ...] | None, limit: int) -> list[dict]:
+        if isinstance(sort_key, tuple):
+            results.sort(key=lambda row: tuple(row.get(k, "") for k in sort_key), reverse=True)
+        elif sort_key:
             results.sort(key=lambda row: row.get(sort_key, ""), reverse=True)
         return results[:limit]
 
 
 class RepoExecutor:
+    MAX_WORKERS = 8
+
     def __init__(self, *, registry: RepoRegistry | None = None, policy: CrossRepoPolicy | None = None):
         self.registry = registry or RepoRegistry()
         self.policy = policy or CrossRepoPolicy()
 
+    def _query_repo(
+        self, fn: Callable[[sqlite3.Connection, dict], Any], repo: dict, phase: str = "query"
+    ) -> tuple[Any, WarningEntry | None]:
+        """Run ``fn`` against one repo DB on a connection owned by the calling thread."""
+        from ..db.connection import _configure_connection, _ECConnection
+        from ..db.migration import check_and_migrate
+
+        conn = None
+        try:
+            conn = sqlite3.connect(repo["db_path"], factory=_ECConnection)
+            _configure_connection(conn, repo["db_path"])
+            check_and_migrate(conn)
+            return fn(conn, repo), None
+        except FTSQueryError:
+            raise
+        except Exception as exc:
+            logger.debug("Skipping repo %s", repo.get("repo_path"), exc_info=True)
+            return None, self.policy.warning(repo, phase, exc)
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def map(
+        self, fn: Callable[[sqlite3.Connection, dict], Any], repo_list: list[dict], *, phase: str = "query"
+    ) -> Iterator[tuple[dict, Any, WarningEntry | None]]:
+        """Query repos concurrently, yielding ``(repo, result, warning)`` in registry order.
+
+        ``result`` is None when ``warning`` is set; ``phase`` labels those warnings.
+        """
+        if len(repo_list) <= 1:
+            for repo in repo_list:
+                yield (repo, *self._query_repo(fn, repo, phase))
+            return
+        pool = ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(repo_list)))
+        try:
+            futures = [pool.submit(self._query_repo, fn, repo, phase) for repo in repo_list]
+            for repo, future in zip(repo_list, futures):
+                yield (repo, *future.result())
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def execute(
         self,
         fn: Callable[[sqlite3.Connection, dict], list[dict]],
         *,
         repos: list[str] | None = None,
-        sort_key: str | None = None,
+        sort_key: str | tuple[str, ...] | None = None,
         limit: int = 20,
     ) -> tuple[list[dict], list[WarningEntry]]:
-        from ..db.connection import _configure_connection, _ECConnection
-        from ..db.migration import check_and_migrate
-
         repo_list = self.registry.list_repos(repos)
         self.policy.lazy_pull_repos(repo_list)
         all_results: list[dict] = []
         warnings: list[WarningEntry] = []
 
-        for repo in repo_list:
-            conn = None
-            try:
-                conn = sqlite3.connect(repo["db_path"], factory=_ECConnection)
-                _configure_connection(conn)
-                check_and_migrate(conn)
-                results = fn(conn, repo)
-
-                for result in results:
-                    result["repo_name"] = repo["repo_name"]
-                    result["repo_path"] = repo["repo_path"]
-                all_results.extend(results)
-            except FTSQueryError:
-                raise
-            except Exception as exc:
-                warnings.append(self.policy.warning(repo, "query", exc))
-                logger.debug("Skipping repo %s", repo.get("repo_path"), exc_info=True)
-            finally:
-                if conn is not None:
-                    conn.close()
+        for repo, results, warning in self.map(fn, repo_list):
+            if warning is not None:
+                warnings.append(warning)
+                continue
+            for result in results:
+                result["repo_name"] = repo["repo_name"]
+                result["repo_path"] = repo["repo_path"]
+            all_results.extend(results)
 
         return self.policy.sort_and_limit(all_results, sort_key=sort_key, limit=limit), warnings
 
@@ -124,32 +156,17 @@ class RepoExecutor:
         *,
         repos: list[str] | None = None,
     ) -> tuple[dict | None, list[WarningEntry]]:
-        from ..db.connection import _configure_connection, _ECConnection
-        from ..db.migration import check_and_migrate
-
         repo_list = self.registry.list_repos(repos)
         self.policy.lazy_pull_repos(repo_list)
         warnings: list[WarningEntry] = []
 
-        for repo in repo_list:
-            conn = None
-            try:
-                conn = sqlite3.connect(repo["db_path"], factory=_ECConnection)
-                _configure_connection(conn)
-                check_and_migrate(conn)
-                result = fn(conn, repo)
-                if result:
-                    result["repo_name"] = repo["repo_name"]
-                    result["repo_path"] = repo["repo_path"]
-                    return result, warnings
-            except FTSQueryError:
-                raise
-            except Exception as exc:
-                warnings.append(self.policy.warning(repo, "query", exc))
-                logger.debug("Skipping repo %s", repo.get("repo_path"), exc_info=True)
-            finally:
-                if conn is not None:
-                    conn.close()
+        for repo, result, warning in self.map(fn, repo_list):
+            if warning is not None:
+                warnings.append(warning)
+            elif result:
+                result["repo_name"] = repo["repo_name"]
+                result["repo_path"] = repo["repo_path"]
+                return result, warnings
 
         return None, warnings
 
@@ -191,6 +208,13 @@ def cross_repo_search(
 ) -> list[dict] | tuple[list[dict], list[WarningEntry]]:
     from ..core.search import fts_search, regex_search
 
+    # Encode the query once here rather than once per repo on the worker threads.
+    query_embedding = None
+    if search_type == "semantic":
+        from ..core.embedding import embed_text
+
+        query_embedding = embed_text(query)
+
     def fn(conn: sqlite3.Connection, repo: dict) -> list[dict]:
         per_repo_limit = limit * 2
         if search_type == "semantic":
@@ -204,6 +228,7 @@ def cross_repo_search(
                 agent_filter=agent_filter,
                 since=since,
                 limit=per_repo_limit,
+                query_embedding=query_embedding,
             )
         if search_type == "fts":
             return fts_search(
@@ -272,11 +297,12 @@ def cross_repo_checkpoints(
     since: str | None = None,
     limit: int = 20,
     include_warnings: bool = False,
+    include_snapshot: bool = True,
 ) -> list[dict] | tuple[list[dict], list[WarningEntry]]:
     from ..core.checkpoint import list_checkpoints
 
     def fn(conn: sqlite3.Connection, repo: dict) -> list[dict]:
-        results = list_checkpoints(conn, session_id=session_id, limit=limit * 2)
+        results = list_checkpoints(conn, session_id=session_id, limit=limit * 2, include_snapshot=include_snapshot)
         if since:
             results = [row for row in results if row.get("created_at", "") >= since]
         return results
@@ -312,13 +338,17 @@ def cross_repo_events(
     event_type: str | None = None,
     limit: int = 20,
     include_warnings: bool = False,
+    before: str | None = None,
+    before_id: str | None = None,
 ) -> list[dict] | tuple[list[dict], list[WarningEntry]]:
     from ..core.event import list_events
 
     def fn(conn: sqlite3.Connection, repo: dict) -> list[dict]:
-        return list_events(conn, status=status, event_type=event_type, limit=limit * 2)
+        return list_events(
+            conn, status=status, event_type=event_type, limit=limit * 2, before=before, before_id=before_id
+        )
 
-    results, warnings = RepoExecutor().execute(fn, repos=repos, sort_key="created_at", limit=limit)
+    results, warnings = RepoExecutor().execute(fn, repos=repos, sort_key=("created_at", "id"), limit=limit)
     return _return_with_warnings(results, warnings, include_warnings)
 
 
@@ -447,43 +477,31 @@ def cross_repo_assessment_trends(
     total_count = 0
     with_feedback = 0
 
-    from ..db.connection import _configure_connection, _ECConnection
-    from ..db.migration import check_and_migrate
-
-    for repo in repo_list:
-        try:
-            conn = sqlite3.connect(repo["db_path"], factory=_ECConnection)
-            _configure_connection(conn)
-            check_and_migrate(conn)
-            assessments = list_assessments(conn, limit=10000)
-            conn.close()
-            if since:
-                assessments = [assessment for assessment in assessments if assessment.get("created_at", "") >= since]
-
-            counts: dict[str, int] = {"expand": 0, "narrow": 0, "neutral": 0}
-            repo_with_feedback = 0
-            for assessment in assessments:
-                verdict = assessment.get("verdict", "neutral")
-                if verdict in counts:
-                    counts[verdict] += 1
-                    overall[verdict] = overall.get(verdict, 0) + 1
-                if assessment.get("feedback"):
-                    repo_with_feedback += 1
-                    with_feedback += 1
-
-            repo_total = sum(counts.values())
-            total_count += repo_total
-            by_repo[repo["repo_name"]] = {
-                "total": repo_total,
-                "expand": counts["expand"],
-                "narrow": counts["narrow"],
-                "neutral": counts["neutral"],
-                "with_feedback": repo_with_feedback,
-                "repo_path": repo["repo_path"],
-            }
-        except Exception as exc:
-            warnings.append(executor.policy.warning(repo, "trends", exc))
-            logger.debug("Skipping repo %s", repo.get("repo_path"), exc_info=True)
+    def fn(conn: sqlite3.Connection, repo: dict) -> dict:
+        assessments = list_assessments(conn, limit=10000)
+        if since:
+            assessments = [assessment for assessment in assessments if assessment.get("created_at", "") >= since]
+
+        stats = {"total": 0, "expand": 0, "narrow": 0, "neutral": 0, "with_feedback": 0}
+        for assessment in assessments:
+            verdict = assessment.get("verdict", "neutral")
+            if verdict in overall:
+                stats[verdict] += 1
+                stats["total"] += 1
+            if assessment.get("feedback"):
+                stats["with_feedback"] += 1
+        return stats
+
+    # Per-repo open + aggregate runs on the executor's thread pool; merging stays here.
+    for repo, stats, warning in executor.map(fn, repo_list, phase="trends"):
+        if warning is not None:
+            warnings.append(warning)
+            continue
+        for verdict in overall:
+            overall[verdict] += stats[verdict]
+        total_count += stats["total"]
+        with_feedback += stats["with_feedback"]
+        by_repo[repo["repo_name"]] = {**stats, "repo_path": repo["repo_path"]}
 
     result = {
         "total_count": total_count,
@@ -6,33 +6,87 @@ import hashlib
 import json
 import sqlite3
 import struct
+import threading
 from uuid import uuid4
 
 from .context import transaction
 
+# Texts per model.encode() call, and the model's internal batch size.
+_ENCODE_CHUNK_SIZE = 1024
+_ENCODE_BATCH_SIZE = 64
+
+
+# Loaded models keyed by (model_name, device), oldest first; at most _MODEL_CACHE_SIZE are kept.
+_MODEL_CACHE_SIZE = 2
+_models: dict[tuple[str, str | None], object] = {}
+_models_lock = threading.Lock()
+
+
+def _load_model(model_name: str, device: str | None):
+    """Load a SentenceTransformer once per process; the MCP server reuses it across queries.
+
+    ``device`` has no default so every caller builds the same cache key.
+    Concurrent misses wait on the lock and pick up the first thread's model
+    instead of each loading their own copy.
+    """
+    key = (model_name, device)
+    model = _models.get(key)
+    if model is not None:
+        return model
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(model_name, device=device)
+            if len(_models) >= _MODEL_CACHE_SIZE:
+                del _models[next(iter(_models))]
+            _models[key] = model
+    return model
+
+
+def _clear_model_cache() -> None:
+    with _models_lock:
+        _models.clear()
+
 
 def embed_text(text: str, model_name: str = "all-MiniLM-L6-v2") -> bytes:
     """Encode text to embedding bytes using sentence-transformers."""
     try:
-        from sentence_transformers import SentenceTransformer
+        model = _load_model(model_name, None)
     except ImportError:
         raise ImportError(
             "sentence-transformers is required for semantic search. Install with: pip install 'entirecontext[semantic]'"
         )
 
-    model = SentenceTransformer(model_name)
     vector = model.encode(text)
     return vector.tobytes()
 
 
-def cosine_similarity(a: bytes, b: bytes) -> float:
-    """Compute cosine similarity between two embedding byte vectors."""
-    n = len(a) // 4
-    if len(b) // 4 != n:
-        raise ValueError(f"Dimension mismatch: {n} vs {len(b) // 4}")
+def _quantize(vector_bytes: bytes) -> bytes:
+    """Pack a float32 vector as int8, scaled so its largest component maps to ±127.
+
+    Cosine similarity ignores vector length, so the scale is not stored.
+    """
+    n = len(vector_bytes) // 4
+    values = struct.unpack(f"{n}f", vector_bytes)
+    peak = max(map(abs, values), default=0.0)
+    if peak == 0.0:
+        return bytes(n)
+    factor = 127.0 / peak
+    return struct.pack(f"{n}b", *(round(v * factor) for v in values))
+
+
+def _decode_vector(blob: bytes, dimensions: int) -> tuple[float, ...]:
+    """Unpack a stored vector: int8 (one byte per dimension) or legacy float32."""
+    if len(blob) == dimensions:
+        return struct.unpack(f"{dimensions}b", blob)
+    return struct.unpack(f"{len(blob) // 4}f", blob)
 
-    vec_a = struct.unpack(f"{n}f", a)
-    vec_b = struct.unpack(f"{n}f", b)
+
+def _cosine(vec_a, vec_b) -> float:
+    if len(vec_a) != len(vec_b):
+        raise ValueError(f"Dimension mismatch: {len(vec_a)} vs {len(vec_b)}")
 
     dot = sum(x * y for x, y in zip(vec_a, vec_b))
     norm_a = sum(x * x for x in vec_a) ** 0.5
@@ -44,6 +98,15 @@ def cosine_similarity(a: bytes, b: bytes) -> float:
     return dot / (norm_a * norm_b)
 
 
+def cosine_similarity(a: bytes, b: bytes) -> float:
+    """Compute cosine similarity between two float32 embedding byte vectors."""
+    n = len(a) // 4
+    if len(b) // 4 != n:
+        raise ValueError(f"Dimension mismatch: {n} vs {len(b) // 4}")
+
+    return _cosine(struct.unpack(f"{n}f", a), struct.unpack(f"{n}f", b))
+
+
 def semantic_search(
     conn: sqlite3.Connection,
     query: str,
@@ -53,22 +116,28 @@ def semantic_search(
     commit_filter: str | None = None,
     agent_filter: str | None = None,
     since: str | None = None,
+    query_embedding: bytes | None = None,
 ) -> list[dict]:
     """Embed query and compare against stored embeddings.
 
     Returns ranked results with similarity scores.
     Supports post-filters: file_filter, commit_filter, agent_filter, since.
+    Pass ``query_embedding`` (from :func:`embed_text`) to skip re-encoding a
+    query already embedded with ``model_name``.
     """
-    query_embedding = embed_text(query, model_name)
+    if query_embedding is None:
+        query_embedding = embed_text(query, model_name)
+    query_vec = struct.unpack(f"{len(query_embedding) // 4}f", query_embedding)
 
     rows = conn.execute(
-        "SELECT id, source_type, source_id, vector FROM embeddings WHERE model_name = ? AND source_type != 'decision'",
+        "SELECT id, source_type, source_id, vector, dimensions FROM embeddings "
+        "WHERE model_name = ? AND source_type != 'decision'",
         (model_name,),
     ).fetchall()
 
     scored = []
     for row in rows:
-        score = cosine_similarity(query_embedding, row["vector"])
+        score = _cosine(query_vec, _decode_vector(row["vector"], row["dimensions"]))
         scored.append(
             {
                 "embedding_id": row["id"],
@@ -179,13 +248,14 @@ def semantic_search_decisions(
 ) -> list[dict]:
     """Search decisions by embedding similarity."""
     query_embedding = embed_text(query, model_name)
+    query_vec = struct.unpack(f"{len(query_embedding) // 4}f", query_embedding)
     rows = conn.execute(
-        "SELECT source_id, vector FROM embeddings WHERE source_type = 'decision' AND model_name = ?",
+        "SELECT source_id, vector, dimensions FROM embeddings WHERE source_type = 'decision' AND model_name = ?",
         (model_name,),
     ).fetchall()
     scored = []
     for row in rows:
-        score = cosine_similarity(query_embedding, row["vector"])
+        score = _cosine(query_vec, _decode_vector(row["vector"], row["dimensions"]))
         scored.append({"decision_id": row["source_id"], "score": round(score, 4)})
     scored.sort(key=lambda x: x["score"], reverse=True)
     results = scored[:limit]
@@ -201,21 +271,22 @@ def generate_embeddings(
     model_name: str = "all-MiniLM-L6-v2",
     force: bool = False,
     decisions_only: bool = False,
+    device: str | None = None,
 ) -> int:
     """Generate embeddings for turns/sessions without existing embeddings.
 
     Returns the count of new embeddings generated.
-    Requires sentence-transformers to be installed.
+    Requires sentence-transformers to be installed. ``device`` (e.g. ``"cuda"``)
+    overrides sentence-transformers' own CUDA/MPS/CPU detection.
     """
     try:
-        from sentence_transformers import SentenceTransformer
+        model = _load_model(model_name, device)
     except ImportError:
         raise ImportError(
             "sentence-transformers is required for embedding generation. "
             "Install with: pip install 'entirecontext[semantic]'"
         )
 
-    model = SentenceTransformer(model_name)
     count = 0
 
     if decisions_only:
@@ -257,115 +328,63 @@ def generate_embeddings(
         ).fetchall()
         existing_decision_hashes = {r["source_id"]: (r["text_hash"], r["cnt"]) for r in rows}
 
-    # Skip the writer transaction when there is no DML to issue. Pre-S2a's
-    # implicit-tx model deferred BEGIN to the first DML, so a force=False
-    # call with all embeddings already cached stayed read-only. Without this
-    # short-circuit, S2a's wrap would acquire the writer lock unconditionally.
-    # The text check mirrors the loop body's `if not text: continue` gate
-    # exactly — a row with no embedding but blank text still produces no DML.
-    turns_need_work = any(
-        (force or t["id"] not in existing_turn_ids)
-        and f"{t['user_message'] or ''} {t['assistant_summary'] or ''}".strip()
-        for t in turns
-    )
-    sessions_need_work = any(
-        (force or s["id"] not in existing_session_ids)
-        and f"{s['session_title'] or ''} {s['session_summary'] or ''}".strip()
-        for s in sessions
-    )
-
-    def _decision_needs_work(d: dict) -> bool:
-        if force:
-            return bool(_build_decision_embed_text(d["title"], d["rationale"], d["rejected_alternatives"]).strip())
-        text = _build_decision_embed_text(d["title"], d["rationale"], d["rejected_alternatives"]).strip()
+    # (source_type, source_id, text, replace) for every row that needs a vector.
+    # ``replace`` marks rows whose stale embeddings must be deleted first.
+    pending: list[tuple[str, str, str, bool]] = []
+    for turn in turns:
+        if not force and turn["id"] in existing_turn_ids:
+            continue
+        text = f"{turn['user_message'] or ''} {turn['assistant_summary'] or ''}".strip()
+        if text:
+            pending.append(("turn", turn["id"], text, force))
+
+    for session in sessions:
+        if not force and session["id"] in existing_session_ids:
+            continue
+        text = f"{session['session_title'] or ''} {session['session_summary'] or ''}".strip()
+        if text:
+            pending.append(("session", session["id"], text, force))
+
+    for decision in decisions:
+        text = _build_decision_embed_text(decision["title"], decision["rationale"], decision["rejected_alternatives"])
         if not text:
-            return False
-        if d["id"] not in existing_decision_hashes:
-            return True
-        stored_hash, cnt = existing_decision_hashes[d["id"]]
-        if cnt > 1:
-            return True
-        return hashlib.md5(text.encode()).hexdigest() != stored_hash
-
-    decisions_need_work = any(_decision_needs_work(d) for d in decisions)
-    if not (turns_need_work or sessions_need_work or decisions_need_work):
+            continue
+        stored = existing_decision_hashes.get(decision["id"])
+        if stored is not None and stored[1] == 1 and stored[0] == hashlib.md5(text.encode()).hexdigest():
+            continue
+        pending.append(("decision", decision["id"], text, True))
+
+    # Nothing to embed: return before taking the writer lock, so a fully
+    # cached run stays read-only.
+    if not pending:
         return 0
 
+    # One encode() call per chunk lets sentence-transformers batch (and
+    # length-sort) the texts, instead of a forward pass per row.
     with transaction(conn):
-        for turn in turns:
-            if not force and turn["id"] in existing_turn_ids:
-                continue
-            text = f"{turn['user_message'] or ''} {turn['assistant_summary'] or ''}".strip()
-            if not text:
-                continue
-            vector = model.encode(text)
-            vector_bytes = vector.tobytes()
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-
-            if force:
-                conn.execute(
-                    "DELETE FROM embeddings WHERE source_type = 'turn' AND source_id = ? AND model_name = ?",
-                    (turn["id"], model_name),
-                )
-
-            conn.execute(
-                "INSERT INTO embeddings (id, source_type, source_id, model_name, vector, dimensions, text_hash) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (str(uuid4()), "turn", turn["id"], model_name, vector_bytes, len(vector), text_hash),
-            )
-            count += 1
-
-        for session in sessions:
-            if not force and session["id"] in existing_session_ids:
-                continue
-            text = f"{session['session_title'] or ''} {session['session_summary'] or ''}".strip()
-            if not text:
-                continue
-            vector = model.encode(text)
-            vector_bytes = vector.tobytes()
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-
-            if force:
-                conn.execute(
-                    "DELETE FROM embeddings WHERE source_type = 'session' AND source_id = ? AND model_name = ?",
-                    (session["id"], model_name),
-                )
-
-            conn.execute(
-                "INSERT INTO embeddings (id, source_type, source_id, model_name, vector, dimensions, text_hash) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (str(uuid4()), "session", session["id"], model_name, vector_bytes, len(vector), text_hash),
-            )
-            count += 1
-
-        for decision in decisions:
-            text = _build_decision_embed_text(
-                decision["title"], decision["rationale"], decision["rejected_alternatives"]
-            )
-            if not text:
-                continue
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-
-            if not force:
-                stored_rows = conn.execute(
-                    "SELECT text_hash FROM embeddings WHERE source_type = 'decision' AND source_id = ? AND model_name = ?",
-                    (decision["id"], model_name),
-                ).fetchall()
-                if len(stored_rows) == 1 and stored_rows[0]["text_hash"] == text_hash:
-                    continue
-
-            vector = model.encode(text)
-            vector_bytes = vector.tobytes()
-
-            conn.execute(
-                "DELETE FROM embeddings WHERE source_type = 'decision' AND source_id = ? AND model_name = ?",
-                (decision["id"], model_name),
+        for start in range(0, len(pending), _ENCODE_CHUNK_SIZE):
+            chunk = pending[start : start + _ENCODE_CHUNK_SIZE]
+            vectors = model.encode([text for _, _, text, _ in chunk], batch_size=_ENCODE_BATCH_SIZE)
+            conn.executemany(
+                "DELETE FROM embeddings WHERE source_type = ? AND source_id = ? AND model_name = ?",
+                [(source_type, source_id, model_name) for source_type, source_id, _, replace in chunk if replace],
             )
-            conn.execute(
+            conn.executemany(
                 "INSERT INTO embeddings (id, source_type, source_id, model_name, vector, dimensions, text_hash) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (str(uuid4()), "decision", decision["id"], model_name, vector_bytes, len(vector), text_hash),
+                [
+                    (
+                        str(uuid4()),
+                        source_type,
+                        source_id,
+                        model_name,
+                        _quantize(vector.tobytes()),
+                        len(vector),
+                        hashlib.md5(text.encode()).hexdigest(),
+                    )
+                    for (source_type, source_id, text, _), vector in zip(chunk, vectors)
+                ],
             )
-            count += 1
+            count += len(chunk)
 
     return count
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
+from .context import transaction
+from .resolve import prefix_range
+
 VALID_EVENT_TYPES = ("task", "temporal", "milestone")
 VALID_STATUSES = ("active", "frozen", "archived")
 STATUS_TRANSITIONS = {
@@ -13,6 +18,8 @@ STATUS_TRANSITIONS = {
     "frozen": ("archived",),
     "archived": (),
 }
+# Columns a listing renders; excludes the free-text description and metadata.
+EVENT_SUMMARY_COLUMNS = ("id", "title", "event_type", "status", "created_at")
 
 
 def _now_iso() -> str:
@@ -47,14 +54,25 @@ def get_event(conn, event_id: str) -> dict | None:
     return dict(row) if row else None
 
 
-def list_events(
+def iter_events(
     conn,
     status: str | None = None,
     event_type: str | None = None,
     limit: int = 20,
-) -> list[dict]:
-    """List events with optional filters."""
-    query = "SELECT * FROM events"
+    before: str | None = None,
+    columns: tuple[str, ...] | None = None,
+    before_id: str | None = None,
+) -> Iterator[sqlite3.Row]:
+    """Yield event rows with optional filters, newest first, straight from the cursor.
+
+    ``before`` is a keyset cursor: only events created strictly before that
+    ``created_at`` value are returned, so paging costs O(limit) at any depth.
+    Pass the last row's ``id`` as ``before_id`` too so rows sharing the
+    boundary timestamp are not skipped.
+    ``columns`` narrows the SELECT (e.g. ``EVENT_SUMMARY_COLUMNS``); it must
+    be trusted column names, never user input.
+    """
+    query = f"SELECT {', '.join(columns) if columns else '*'} FROM events"
     params: list[Any] = []
     conditions = []
 
@@ -64,14 +82,32 @@ def list_events(
     if event_type:
         conditions.append("event_type = ?")
         params.append(event_type)
+    if before and before_id:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend((before, before_id))
+    elif before:
+        conditions.append("created_at < ?")
+        params.append(before)
 
     if conditions:
         query += " WHERE " + " AND ".join(conditions)
 
-    query += " ORDER BY created_at DESC LIMIT ?"
+    query += " ORDER BY created_at DESC, id DESC LIMIT ?"
     params.append(limit)
 
-    rows = conn.execute(query, params).fetchall()
+    return conn.execute(query, params)
+
+
+def list_events(
+    conn,
+    status: str | None = None,
+    event_type: str | None = None,
+    limit: int = 20,
+    before: str | None = None,
+    before_id: str | None = None,
+) -> list[dict]:
+    """List events with optional filters."""
+    rows = iter_events(conn, status=status, event_type=event_type, limit=limit, before=before, before_id=before_id)
     return [dict(r) for r in rows]
 
 
@@ -105,6 +141,15 @@ def link_event_session(conn, event_id: str, session_id: str) -> None:
     )
 
 
+def link_event_sessions(conn, event_id: str, session_ids: list[str]) -> None:
+    """Link several sessions to an event in a single transaction."""
+    with transaction(conn):
+        conn.executemany(
+            "INSERT OR IGNORE INTO event_sessions (event_id, session_id) VALUES (?, ?)",
+            [(event_id, sid) for sid in session_ids],
+        )
+
+
 def link_event_checkpoint(conn, event_id: str, checkpoint_id: str) -> None:
     """Link a checkpoint to an event."""
     conn.execute(
@@ -125,6 +170,40 @@ def get_event_sessions(conn, event_id: str) -> list[dict]:
     return [dict(r) for r in rows]
 
 
+_EVENT_WITH_SESSIONS_SQL = """SELECT e.*,
+    s.id AS linked_session_id, s.session_type AS linked_session_type, s.ended_at AS linked_ended_at
+FROM events e
+LEFT JOIN event_sessions es ON es.event_id = e.id
+LEFT JOIN sessions s ON s.id = es.session_id
+WHERE e.id >= ? AND e.id < ?
+ORDER BY e.id, s.last_activity_at DESC"""
+
+_LINKED_SESSION_COLUMNS = {
+    "linked_session_id": "id",
+    "linked_session_type": "session_type",
+    "linked_ended_at": "ended_at",
+}
+
+
+def get_event_with_sessions(conn, event_id: str) -> tuple[dict | None, list[dict]]:
+    """Resolve a full or prefix event ID and fetch its linked sessions in one query.
+
+    An exact ID match wins over prefix matches. Sessions carry ``id``,
+    ``session_type`` and ``ended_at``, most recently active first.
+    """
+    rows = conn.execute(_EVENT_WITH_SESSIONS_SQL, prefix_range(event_id)).fetchall()
+    if not rows:
+        return None, []
+    resolved_id = rows[0]["id"]
+    event = {k: rows[0][k] for k in rows[0].keys() if k not in _LINKED_SESSION_COLUMNS}
+    sessions = [
+        {name: row[col] for col, name in _LINKED_SESSION_COLUMNS.items()}
+        for row in rows
+        if row["id"] == resolved_id and row["linked_session_id"] is not None
+    ]
+    return event, sessions
+
+
 def get_event_checkpoints(conn, event_id: str) -> list[dict]:
     """Get checkpoints linked to an event."""
     rows = conn.execute(
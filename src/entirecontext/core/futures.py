@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from .resolve import prefix_range
 from .resolve import resolve_assessment_id as _resolve_assessment_id
 
 VALID_VERDICTS = ("expand", "narrow", "neutral")
@@ -31,6 +35,25 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def read_roadmap(path: str | Path) -> str | None:
+    """Read a roadmap file, or ``None`` if it does not exist.
+
+    The decoded text is cached per path and invalidated by the file's mtime
+    and size, so a long-lived process (the MCP server) only re-reads edits.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return _read_roadmap(str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _read_roadmap(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
 def create_assessment(
     conn,
     checkpoint_id: str | None = None,
@@ -78,25 +101,24 @@ def create_assessment(
 
 def get_assessment(conn, assessment_id: str) -> dict | None:
     """Get an assessment by ID (supports prefix match)."""
-    row = conn.execute("SELECT * FROM assessments WHERE id = ?", (assessment_id,)).fetchone()
-    if row is None:
-        row = conn.execute("SELECT * FROM assessments WHERE id LIKE ?", (f"{assessment_id}%",)).fetchone()
+    row = conn.execute(
+        "SELECT * FROM assessments WHERE id >= ? AND id < ? ORDER BY id LIMIT 1", prefix_range(assessment_id)
+    ).fetchone()
     return dict(row) if row else None
 
 
-def list_assessments(
+def iter_assessments(
     conn,
     verdict: str | None = None,
     limit: int = 20,
     since: str | None = None,
-) -> list[dict]:
-    """List assessments with optional verdict and date filters.
+    before: str | None = None,
+    before_id: str | None = None,
+) -> Iterator[sqlite3.Row]:
+    """Yield assessment rows, newest first, straight from the cursor.
 
-    Args:
-        conn: DB connection.
-        verdict: Filter by verdict string (expand/narrow/neutral).
-        limit: Maximum rows to return (applied after all filters).
-        since: ISO date/datetime string; only assessments with created_at >= since are returned.
+    Takes the same filters as :func:`list_assessments`; an invalid verdict
+    raises before the query runs.
     """
     query = "SELECT * FROM assessments"
     params: list[Any] = []
@@ -112,13 +134,41 @@ def list_assessments(
         conditions.append("created_at >= ?")
         params.append(since)
 
+    if before and before_id:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend((before, before_id))
+    elif before:
+        conditions.append("created_at < ?")
+        params.append(before)
+
     if conditions:
         query += " WHERE " + " AND ".join(conditions)
 
-    query += " ORDER BY created_at DESC LIMIT ?"
+    query += " ORDER BY created_at DESC, id DESC LIMIT ?"
     params.append(limit)
 
-    rows = conn.execute(query, params).fetchall()
+    return conn.execute(query, params)
+
+
+def list_assessments(
+    conn,
+    verdict: str | None = None,
+    limit: int = 20,
+    since: str | None = None,
+    before: str | None = None,
+    before_id: str | None = None,
+) -> list[dict]:
+    """List assessments with optional verdict and date filters.
+
+    Args:
+        conn: DB connection.
+        verdict: Filter by verdict string (expand/narrow/neutral).
+        limit: Maximum rows to return (applied after all filters).
+        since: ISO date/datetime string; only assessments with created_at >= since are returned.
+        before: Keyset cursor; only assessments with created_at < before are returned.
+        before_id: Tiebreaker for ``before``; with it, rows are compared on (created_at, id).
+    """
+    rows = iter_assessments(conn, verdict=verdict, limit=limit, since=since, before=before, before_id=before_id)
     return [dict(r) for r in rows]
 
 
@@ -139,13 +189,19 @@ def add_feedback(conn, assessment_id: str, feedback: str, feedback_reason: str |
     )
 
 
-def get_lessons(conn, limit: int = 50) -> list[dict]:
-    """Get assessments that have feedback — these are lessons learned."""
-    rows = conn.execute(
-        "SELECT * FROM assessments WHERE feedback IS NOT NULL ORDER BY created_at DESC LIMIT ?",
-        (limit,),
-    ).fetchall()
-    return [dict(r) for r in rows]
+def get_lessons(conn, limit: int = 50, since: str | None = None) -> list[dict]:
+    """Get assessments that have feedback — these are lessons learned.
+
+    ``since`` (ISO date/datetime) keeps only assessments created at or after it.
+    """
+    query = "SELECT * FROM assessments WHERE feedback IS NOT NULL"
+    params: list[Any] = []
+    if since:
+        query += " AND created_at >= ?"
+        params.append(since)
+    query += " ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+    return [dict(r) for r in conn.execute(query, params)]
 
 
 def distill_lessons(assessments: list[dict]) -> str:
@@ -190,8 +246,11 @@ def distill_lessons(assessments: list[dict]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def auto_distill_lessons(repo_path: str | Path) -> bool:
-    """Auto-distill lessons to file if futures.auto_distill is enabled. Returns True if file was written."""
+def auto_distill_lessons(repo_path: str | Path, conn=None) -> bool:
+    """Auto-distill lessons to file if futures.auto_distill is enabled. Returns True if file was written.
+
+    Reuses ``conn`` when the caller already holds one for the repo.
+    """
     from .config import load_config
     from ..db import get_db
 
@@ -199,11 +258,14 @@ def auto_distill_lessons(repo_path: str | Path) -> bool:
     if not config.get("futures", {}).get("auto_distill", False):
         return False
 
-    conn = get_db(str(repo_path))
-    try:
+    if conn is not None:
         lessons = get_lessons(conn)
-    finally:
-        conn.close()
+    else:
+        conn = get_db(str(repo_path))
+        try:
+            lessons = get_lessons(conn)
+        finally:
+            conn.close()
 
     text = distill_lessons(lessons)
     output_name = config.get("futures", {}).get("lessons_output", "LESSONS.md")
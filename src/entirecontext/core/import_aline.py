@@ -11,6 +11,9 @@ from uuid import uuid4
 
 from .context import transaction
 
+# Only the first few messages are reported; the rest are just counted.
+_MAX_KEPT_ERRORS = 10
+
 
 @dataclass
 class ImportResult:
@@ -22,6 +25,16 @@ class ImportResult:
     event_links: int = 0
     skipped: int = 0
     errors: list[str] = field(default_factory=list)
+    error_count: int = 0
+
+    def __post_init__(self) -> None:
+        self.error_count = max(self.error_count, len(self.errors))
+
+    def add_error(self, message: str, *, keep: bool = False) -> None:
+        """Count an error; its message is kept only while under the cap, or if ``keep``."""
+        self.error_count += 1
+        if keep or len(self.errors) < _MAX_KEPT_ERRORS:
+            self.errors.append(message)
 
 
 def import_from_aline(
@@ -37,7 +50,7 @@ def import_from_aline(
 
     aline_path = Path(aline_db_path)
     if not aline_path.exists():
-        result.errors.append(f"Aline DB not found: {aline_db_path}")
+        result.add_error(f"Aline DB not found: {aline_db_path}")
         return result
 
     aline_conn = sqlite3.connect(f"file:{aline_db_path}?mode=ro", uri=True)
@@ -51,7 +64,7 @@ def import_from_aline(
         _generate_checkpoints(ec_conn, dry_run, result)
         _import_events(aline_conn, ec_conn, dry_run, result)
     except Exception as e:
-        result.errors.append(str(e))
+        result.add_error(str(e), keep=True)
     finally:
         aline_conn.close()
 
@@ -77,7 +90,7 @@ def _import_sessions(
         query += " WHERE workspace_path LIKE ?"
         params.append(f"%{workspace_filter}%")
 
-    rows = aline_conn.execute(query, params).fetchall()
+    rows = aline_conn.execute(query, params)
 
     # Two interaction notes for the wrapped batch below:
     # (1) `with transaction(conn):` only rolls back on exceptions that escape
@@ -118,7 +131,7 @@ def _import_sessions(
                 else:
                     result.skipped += 1
             except Exception as e:
-                result.errors.append(f"Session {row['id']}: {e}")
+                result.add_error(f"Session {row['id']}: {e}")
                 result.skipped += 1
 
 
@@ -136,7 +149,7 @@ def _import_turns(
     rows = aline_conn.execute(
         f"SELECT * FROM turns WHERE session_id IN ({placeholders})",
         list(ec_session_ids),
-    ).fetchall()
+    )
 
     ctx = contextlib.nullcontext() if dry_run else transaction(ec_conn)
     with ctx:
@@ -171,7 +184,7 @@ def _import_turns(
                 else:
                     result.skipped += 1
             except Exception as e:
-                result.errors.append(f"Turn {row['id']}: {e}")
+                result.add_error(f"Turn {row['id']}: {e}")
                 result.skipped += 1
 
 
@@ -190,11 +203,13 @@ def _import_turn_content(
 
     placeholders = ",".join("?" for _ in ec_turn_ids)
 
+    # Iterate the cursor rather than fetchall(): each row carries a full
+    # transcript, so only one is held in memory at a time.
     try:
         rows = aline_conn.execute(
             f"SELECT * FROM turn_content WHERE turn_id IN ({placeholders})",
             list(ec_turn_ids),
-        ).fetchall()
+        )
     except sqlite3.OperationalError:
         return
 
@@ -228,7 +243,7 @@ def _import_turn_content(
                 else:
                     result.skipped += 1
             except Exception as e:
-                result.errors.append(f"Content {row['turn_id']}: {e}")
+                result.add_error(f"Content {row['turn_id']}: {e}")
                 result.skipped += 1
 
 
@@ -261,7 +276,7 @@ def _generate_checkpoints(
                 )
                 result.checkpoints += 1
             except Exception as e:
-                result.errors.append(f"Checkpoint for turn {row['id']}: {e}")
+                result.add_error(f"Checkpoint for turn {row['id']}: {e}")
 
 
 def _import_events(
@@ -271,7 +286,7 @@ def _import_events(
     result: ImportResult,
 ) -> None:
     try:
-        event_rows = aline_conn.execute("SELECT * FROM events").fetchall()
+        event_rows = aline_conn.execute("SELECT * FROM events")
     except sqlite3.OperationalError:
         return
 
@@ -302,11 +317,11 @@ def _import_events(
                 else:
                     result.skipped += 1
             except Exception as e:
-                result.errors.append(f"Event {row['id']}: {e}")
+                result.add_error(f"Event {row['id']}: {e}")
                 result.skipped += 1
 
     try:
-        link_rows = aline_conn.execute("SELECT * FROM event_sessions").fetchall()
+        link_rows = aline_conn.execute("SELECT * FROM event_sessions")
     except sqlite3.OperationalError:
         return
 
@@ -331,4 +346,4 @@ def _import_events(
                 if cursor.rowcount > 0:
                     result.event_links += 1
             except Exception as e:
-                result.errors.append(f"Event link {row['event_id']}-{row['session_id']}: {e}")
+                result.add_error(f"Event link {row['event_id']}-{row['session_id']}: {e}")
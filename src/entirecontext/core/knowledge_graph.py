@@ -97,12 +97,19 @@ def build_knowledge_graph(
     # ------------------------------------------------------------------
     # 2. Agents (only those linked to included sessions)
     # ------------------------------------------------------------------
-    placeholders = ",".join("?" * len(session_ids_in_graph))
+    # Every session is in the graph unless one was requested, so the scoped
+    # queries below only need an id filter in that case.  Binding the whole
+    # session list as an IN (...) would defeat the timestamp index on turns.
+    if session_id:
+        session_filter, scope_filter, scope_params = "s.id = ? AND ", "session_id = ?", [session_id]
+    else:
+        session_filter, scope_filter, scope_params = "", "1", []
+
     agent_rows = conn.execute(
         f"SELECT DISTINCT s.agent_id, a.agent_type, a.name, a.role "
         f"FROM sessions s JOIN agents a ON a.id = s.agent_id "
-        f"WHERE s.id IN ({placeholders}) AND s.agent_id IS NOT NULL",
-        list(session_ids_in_graph),
+        f"WHERE {session_filter}s.agent_id IS NOT NULL",
+        scope_params,
     ).fetchall()
 
     for row in agent_rows:
@@ -113,8 +120,8 @@ def build_knowledge_graph(
     # ------------------------------------------------------------------
     # 3. Turns (limited, filtered by session / since)
     # ------------------------------------------------------------------
-    params: list = list(session_ids_in_graph)
-    where_clauses = [f"session_id IN ({placeholders})"]
+    params: list = list(scope_params)
+    where_clauses = [scope_filter]
 
     if since:
         where_clauses.append("timestamp >= ?")
@@ -122,7 +129,8 @@ def build_knowledge_graph(
 
     where_sql = " AND ".join(where_clauses)
     turn_rows = conn.execute(
-        f"SELECT * FROM turns WHERE {where_sql} ORDER BY timestamp DESC LIMIT ?",
+        f"SELECT id, session_id, user_message, git_commit_hash, files_touched "
+        f"FROM turns WHERE {where_sql} ORDER BY timestamp DESC LIMIT ?",
         params + [limit],
     ).fetchall()
 
@@ -135,8 +143,8 @@ def build_knowledge_graph(
     # 4. Checkpoints (for included sessions)
     # ------------------------------------------------------------------
     chk_rows = conn.execute(
-        f"SELECT * FROM checkpoints WHERE session_id IN ({placeholders})",
-        list(session_ids_in_graph),
+        f"SELECT id, session_id, git_commit_hash, git_branch FROM checkpoints WHERE {scope_filter}",
+        scope_params,
     ).fetchall()
 
     for row in chk_rows:
@@ -2,20 +2,85 @@
 
 from __future__ import annotations
 
+import http.client
+import io
 import json
 import os
+import re
 import subprocess
-from urllib.request import Request, urlopen
+import threading
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+# Opening fence line (with optional info string such as ``json``), after any leading whitespace.
+_FENCE_OPEN_RE = re.compile(r"\A\s*```[^\n]*(?:\n|\Z)")
 
 
 def strip_markdown_fences(content: str) -> str:
     """Strip markdown code fences from LLM response content."""
-    if content.startswith("```"):
-        content = content.split("\n", 1)[1] if "\n" in content else content
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-    return content
+    opening = _FENCE_OPEN_RE.match(content)
+    if opening is None:
+        return content
+    body = content[opening.end() :].rstrip()
+    if body.endswith("```"):
+        body = body[:-3]
+    return body.strip()
+
+
+# Keep-alive HTTP connections per thread, keyed by (scheme, host). Repeated
+# completions in one process (MCP server, batch extraction) reuse the socket
+# instead of paying a TCP + TLS handshake per call.
+_http = threading.local()
+
+# Seconds to wait on connect and on each socket read; local models can be slow to answer.
+_HTTP_TIMEOUT = 300
+
+
+def _post_json(url: str, payload: dict, headers: dict[str, str] | None = None) -> dict:
+    """POST ``payload`` as JSON over a kept-alive connection and return the decoded response.
+
+    When a proxy applies to ``url`` the request goes through ``urlopen`` instead.
+
+    Raises :class:`urllib.error.HTTPError` for 4xx/5xx responses, like ``urlopen``.
+    """
+    parts = urlsplit(url)
+    body = json.dumps(payload).encode()
+    send_headers = {"Content-Type": "application/json", **(headers or {})}
+    if parts.scheme in getproxies() and not proxy_bypass(parts.hostname or ""):
+        # Honor HTTP(S)_PROXY / no_proxy the way urlopen always did.
+        with urlopen(Request(url, data=body, headers=send_headers), timeout=_HTTP_TIMEOUT) as resp:
+            return json.loads(resp.read())
+
+    key = (parts.scheme, parts.netloc)
+    pool: dict = _http.__dict__.setdefault("pool", {})
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    while True:
+        conn = pool.pop(key, None)
+        reused = conn is not None
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conn_cls(parts.netloc, timeout=_HTTP_TIMEOUT)
+        try:
+            conn.request("POST", path, body=body, headers=send_headers)
+            resp = conn.getresponse()
+            data = resp.read()
+        except (ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if reused:
+                # The server dropped an idle keep-alive socket; retry once on a fresh one.
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            pool[key] = conn
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(data))
+        return json.loads(data)
 
 
 class LLMBackend:
@@ -38,7 +103,8 @@ class OpenAIBackend(LLMBackend):
     def complete(self, system: str, user: str) -> str:
         if not self.api_key:
             raise RuntimeError("OPENAI_API_KEY environment variable not set")
-        payload = json.dumps(
+        data = _post_json(
+            "https://api.openai.com/v1/chat/completions",
             {
                 "model": self.model,
                 "messages": [
@@ -46,18 +112,9 @@ class OpenAIBackend(LLMBackend):
                     {"role": "user", "content": user},
                 ],
                 "temperature": 0.3,
-            }
-        ).encode()
-        req = Request(
-            "https://api.openai.com/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
             },
+            headers={"Authorization": f"Bearer {self.api_key}"},
         )
-        with urlopen(req) as resp:
-            data = json.loads(resp.read())
         return data["choices"][0]["message"]["content"]
 
 
@@ -111,7 +168,8 @@ class OllamaBackend(LLMBackend):
         self.base_url = base_url
 
     def complete(self, system: str, user: str) -> str:
-        payload = json.dumps(
+        data = _post_json(
+            f"{self.base_url}/api/chat",
             {
                 "model": self.model,
                 "messages": [
@@ -119,15 +177,8 @@ class OllamaBackend(LLMBackend):
                     {"role": "user", "content": user},
                 ],
                 "stream": False,
-            }
-        ).encode()
-        req = Request(
-            f"{self.base_url}/api/chat",
-            data=payload,
-            headers={"Content-Type": "application/json"},
+            },
         )
-        with urlopen(req) as resp:
-            data = json.loads(resp.read())
         return data["message"]["content"]
 
 
@@ -141,7 +192,8 @@ class GitHubModelsBackend(LLMBackend):
     def complete(self, system: str, user: str) -> str:
         if not self.api_key:
             raise RuntimeError("GITHUB_TOKEN environment variable not set")
-        payload = json.dumps(
+        data = _post_json(
+            "https://models.github.ai/inference/chat/completions",
             {
                 "model": self.model,
                 "messages": [
@@ -149,18 +201,9 @@ class GitHubModelsBackend(LLMBackend):
                     {"role": "user", "content": user},
                 ],
                 "temperature": 0.3,
-            }
-        ).encode()
-        req = Request(
-            "https://models.github.ai/inference/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
             },
+            headers={"Authorization": f"Bearer {self.api_key}"},
         )
-        with urlopen(req) as resp:
-            data = json.loads(resp.read())
         return data["choices"][0]["message"]["content"]
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 from uuid import uuid4
@@ -11,21 +12,58 @@ from ..db import get_db, get_global_db, check_and_migrate
 from ..db.global_schema import init_global_schema
 
 
+_GIT_ROOT_CACHE: dict[str, str] = {}
+
+# Environment variables that point git at a repository other than the cwd's.
+_GIT_LOCATION_VARS = frozenset({"GIT_DIR", "GIT_WORK_TREE", "GIT_COMMON_DIR"})
+
+
 def find_git_root(path: str | Path = ".") -> str | None:
-    """Find git repo root from given path."""
+    """Find git repo root from given path.
+
+    Roots are memoized per process, together with every directory between
+    ``path`` and the root, so repeated lookups skip the ``git`` subprocess.
+    For the default cwd lookup, an explicit ``$GIT_WORK_TREE`` wins, as it
+    does for git itself, provided its git dir (``$GIT_DIR`` or ``.git``)
+    exists. An explicit ``path`` is always resolved from that path.
+    """
+    env = None
+    if path == ".":
+        work_tree = os.environ.get("GIT_WORK_TREE")
+        if work_tree and os.path.isdir(work_tree):
+            git_dir = os.environ.get("GIT_DIR") or os.path.join(work_tree, ".git")
+            if os.path.exists(git_dir):
+                return os.path.abspath(work_tree)
+    else:
+        # Keep the caller's repo overrides from redirecting git away from ``path``.
+        env = {k: v for k, v in os.environ.items() if k not in _GIT_LOCATION_VARS}
+    start = os.path.abspath(path)
+    cached = _GIT_ROOT_CACHE.get(start)
+    if cached is not None and os.path.isdir(cached):
+        return cached
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
-            cwd=str(path),
+            cwd=start,
+            env=env,
             capture_output=True,
             text=True,
             timeout=5,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-    return None
+    except (subprocess.TimeoutExpired, FileNotFoundError, NotADirectoryError):
+        return None
+    if result.returncode != 0:
+        return None
+    root = result.stdout.strip()
+    _GIT_ROOT_CACHE[start] = root
+    # Every directory between ``start`` and the root resolves to the same root.
+    current, real_root = os.path.realpath(start), os.path.realpath(root)
+    if current == real_root or current.startswith(real_root + os.sep):
+        while current != real_root:
+            _GIT_ROOT_CACHE[current] = root
+            current = os.path.dirname(current)
+        _GIT_ROOT_CACHE[real_root] = root
+    return root
 
 
 def init_project(repo_path: str | Path | None = None) -> dict:
@@ -116,8 +154,11 @@ def get_project(repo_path: str | Path | None = None) -> dict | None:
         context.close()
 
 
-def get_status(repo_path: str | Path | None = None) -> dict:
-    """Get project status including session/turn counts."""
+def get_status(repo_path: str | Path | None = None, *, include_codex: bool = False) -> dict:
+    """Get project status including session/turn counts.
+
+    With ``include_codex``, also counts Codex sessions and turns on the same connection.
+    """
     if repo_path is None:
         context = RepoContext.from_cwd()
     else:
@@ -136,7 +177,7 @@ def get_status(repo_path: str | Path | None = None) -> dict:
             "SELECT id, started_at, total_turns FROM sessions WHERE ended_at IS NULL ORDER BY last_activity_at DESC LIMIT 1"
         ).fetchone()
 
-        return {
+        status = {
             "initialized": True,
             "project": context.project,
             "session_count": session_count,
@@ -144,5 +185,12 @@ def get_status(repo_path: str | Path | None = None) -> dict:
             "checkpoint_count": checkpoint_count,
             "active_session": dict(active_session) if active_session else None,
         }
+        if include_codex:
+            status["codex_session_count"], status["codex_turn_count"] = context.conn.execute(
+                """SELECT COUNT(DISTINCT s.id), COUNT(t.id)
+                   FROM sessions s LEFT JOIN turns t ON t.session_id = s.id
+                   WHERE s.session_type = 'codex'"""
+            ).fetchone()
+        return status
     finally:
         context.close()
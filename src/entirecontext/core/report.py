@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
 _KNOWN_VERDICTS = ("expand", "narrow", "neutral")
+_VERDICT_ICONS = {"expand": "🟢", "narrow": "🔴", "neutral": "🟡"}
 
 
 def _iso_now() -> str:
@@ -44,38 +46,49 @@ def generate_futures_report(
     Returns:
         A UTF-8-safe Markdown string.
     """
+    return "".join(iter_futures_report(assessments, project_name=project_name, since=since))
+
+
+def iter_futures_report(
+    assessments: list[dict[str, Any]],
+    *,
+    project_name: str | None = None,
+    since: str | None = None,
+) -> Iterator[str]:
+    """Yield the report of ``generate_futures_report`` in chunks, for writing without building it whole."""
+    lines = _report_lines(assessments, project_name=project_name, since=since)
+    yield next(lines)
+    for line in lines:
+        yield "\n" + line
+
+
+def _report_lines(
+    assessments: list[dict[str, Any]],
+    *,
+    project_name: str | None,
+    since: str | None,
+) -> Iterator[str]:
     total = len(assessments)
     generated_at = _iso_now()
 
     # --- YAML frontmatter ---
-    fm_lines: list[str] = [
-        "---",
-        "report: futures",
-        f"generated: {generated_at}",
-        f"total_assessments: {total}",
-    ]
+    yield "---"
+    yield "report: futures"
+    yield f"generated: {generated_at}"
+    yield f"total_assessments: {total}"
     if project_name is not None:
-        fm_lines.append(f"project: {_yaml_scalar(project_name)}")
+        yield f"project: {_yaml_scalar(project_name)}"
     if since is not None:
-        fm_lines.append(f"since: {_yaml_scalar(since)}")
-    fm_lines.append("---")
+        yield f"since: {_yaml_scalar(since)}"
+    yield "---"
 
     # --- Header ---
     title = f"Futures Report — {project_name}" if project_name else "Futures Report"
-    body_lines: list[str] = [
-        "",
-        f"# {title}",
-        "",
-        f"_Generated {generated_at}_",
-        "",
-    ]
+    yield from ("", f"# {title}", "", f"_Generated {generated_at}_", "")
 
     if total == 0:
-        body_lines += [
-            "> No assessments found for the specified period.",
-            "",
-        ]
-        return "\n".join(fm_lines) + "\n" + "\n".join(body_lines)
+        yield from ("> No assessments found for the specified period.", "")
+        return
 
     # --- Verdict distribution ---
     # Normalise unknown verdicts to "neutral" so the table totals are consistent.
@@ -85,7 +98,7 @@ def generate_futures_report(
         normalised = v if v in _KNOWN_VERDICTS else "neutral"
         counts[normalised] += 1
 
-    body_lines += [
+    yield from (
         "## Verdict Distribution",
         "",
         "| Verdict | Count | % |",
@@ -95,19 +108,14 @@ def generate_futures_report(
         f"| 🟡 Neutral | {counts['neutral']} | {_percent(counts['neutral'], total)} |",
         f"| **Total**  | **{total}** | 100% |",
         "",
-    ]
+    )
 
     # --- Assessments detail ---
-    body_lines += [
-        "## Assessments",
-        "",
-    ]
-
-    verdict_icons = {"expand": "🟢", "narrow": "🔴", "neutral": "🟡"}
+    yield from ("## Assessments", "")
 
     for a in assessments:
         verdict = a.get("verdict", "neutral")
-        icon = verdict_icons.get(verdict, "🟡")
+        icon = _VERDICT_ICONS.get(verdict, "🟡")
         short_id = (a.get("id") or "")[:8]
         created = (a.get("created_at") or "")[:10]
         impact = a.get("impact_summary") or ""
@@ -117,42 +125,40 @@ def generate_futures_report(
         feedback_reason = a.get("feedback_reason")
         model = a.get("model_name")
 
-        body_lines.append(f"### {icon} {impact or short_id}")
-        body_lines.append("")
-        body_lines.append(f"- **Verdict:** {verdict}  ")
-        body_lines.append(f"- **ID:** `{short_id}`  ")
-        body_lines.append(f"- **Date:** {created}  ")
+        yield f"### {icon} {impact or short_id}"
+        yield ""
+        yield f"- **Verdict:** {verdict}  "
+        yield f"- **ID:** `{short_id}`  "
+        yield f"- **Date:** {created}  "
         if model:
-            body_lines.append(f"- **Model:** {model}  ")
-        body_lines.append("")
+            yield f"- **Model:** {model}  "
+        yield ""
         if alignment:
-            body_lines.append(f"**Roadmap alignment:** {alignment}")
-            body_lines.append("")
+            yield f"**Roadmap alignment:** {alignment}"
+            yield ""
         if suggestion:
-            body_lines.append(f"**Tidy suggestion:** {suggestion}")
-            body_lines.append("")
+            yield f"**Tidy suggestion:** {suggestion}"
+            yield ""
         if feedback:
             feedback_icon = "✅" if feedback == "agree" else "❌"
             fb_line = f"**Feedback:** {feedback_icon} {feedback}"
             if feedback_reason:
                 fb_line += f" — {feedback_reason}"
-            body_lines.append(fb_line)
-            body_lines.append("")
-        body_lines.append("---")
-        body_lines.append("")
+            yield fb_line
+            yield ""
+        yield "---"
+        yield ""
 
     # --- Feedback summary ---
     feedbacked = [a for a in assessments if a.get("feedback")]
     if feedbacked:
         agree_count = sum(1 for a in feedbacked if a.get("feedback") == "agree")
         disagree_count = len(feedbacked) - agree_count
-        body_lines += [
+        yield from (
             "## Feedback Summary",
             "",
             f"- **Reviewed:** {len(feedbacked)} / {total}",
             f"- **Agree:** {agree_count}",
             f"- **Disagree:** {disagree_count}",
             "",
-        ]
-
-    return "\n".join(fm_lines) + "\n" + "\n".join(body_lines)
+        )
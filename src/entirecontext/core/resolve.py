@@ -10,21 +10,41 @@ def escape_like(value: str) -> str:
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+_MAX_CHAR = chr(0x10FFFF)
+
+# SQLite sorts every TEXT value below every BLOB, so an empty blob is an
+# upper bound no ID can reach.
+_ABOVE_ALL_TEXT = b""
+
+
+def prefix_range(prefix: str) -> tuple[str, str | bytes]:
+    """Half-open bounds ``(lo, hi)`` such that ``lo <= id < hi`` iff ``id`` starts with ``prefix``.
+
+    Unlike ``id LIKE 'prefix%'`` the range is seekable on an ``id`` index, and
+    since ``prefix`` itself sorts first, ``ORDER BY id LIMIT 1`` prefers an
+    exact match. Matching is case-sensitive (BINARY collation).
+    """
+    # U+10FFFF cannot be incremented; every string starting with "...\U0010FFFF"
+    # still sorts below the incremented shorter prefix.
+    stem = prefix.rstrip(_MAX_CHAR)
+    if not stem:
+        return prefix, _ABOVE_ALL_TEXT
+    return prefix, stem[:-1] + chr(ord(stem[-1]) + 1)
+
+
 def resolve_id(conn, table: str, id_value: str) -> str | None:
     """Resolve a full or prefix ID from any table. Returns full ID or None.
 
-    First tries an exact match, then falls back to a prefix LIKE query.
-    LIKE metacharacters (%, _) in the input are escaped so they are treated literally.
+    An exact match wins over longer IDs sharing the prefix; one index range
+    seek covers both (see ``prefix_range``).
 
     Raises ValueError if ``table`` is not in the allowed set, preventing SQL injection.
     """
     if table not in _ALLOWED_TABLES:
         raise ValueError(f"Table '{table}' is not allowed. Must be one of: {sorted(_ALLOWED_TABLES)}")
-    row = conn.execute(f"SELECT id FROM {table} WHERE id = ?", (id_value,)).fetchone()
-    if row is None:
-        row = conn.execute(
-            f"SELECT id FROM {table} WHERE id LIKE ? ESCAPE '\\'", (f"{escape_like(id_value)}%",)
-        ).fetchone()
+    row = conn.execute(
+        f"SELECT id FROM {table} WHERE id >= ? AND id < ? ORDER BY id LIMIT 1", prefix_range(id_value)
+    ).fetchone()
     return row["id"] if row else None
 
 
@@ -39,6 +39,16 @@ def get_session(conn, session_id: str) -> dict | None:
     return dict(row) if row else None
 
 
+def missing_session_ids(conn, session_ids: list[str]) -> list[str]:
+    """Return the IDs from *session_ids* that have no session row, in input order."""
+    if not session_ids:
+        return []
+    placeholders = ",".join("?" * len(session_ids))
+    rows = conn.execute(f"SELECT id FROM sessions WHERE id IN ({placeholders})", session_ids).fetchall()
+    found = {row[0] for row in rows}
+    return [sid for sid in session_ids if sid not in found]
+
+
 def list_sessions(
     conn,
     project_id: str | None = None,
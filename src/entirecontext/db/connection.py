@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import os
 import sqlite3
 from pathlib import Path
 
 _GLOBAL_DB_DIR = Path.home() / ".entirecontext" / "db"
 _GLOBAL_DB_PATH = _GLOBAL_DB_DIR / "ec.db"
 
+# (path, device, inode, ctime) of database files already switched to WAL in
+# this process. journal_mode is persistent in the file header, so re-issuing
+# it on every open only costs a lock round trip. ctime guards against a
+# deleted file's inode being reused by a fresh, non-WAL database.
+_WAL_READY: set[tuple[str, int, int, int]] = set()
+
 
 class _ECConnection(sqlite3.Connection):
     """sqlite3.Connection subclass that supports ad-hoc instance attributes.
@@ -19,11 +26,34 @@ class _ECConnection(sqlite3.Connection):
     """
 
 
-def _configure_connection(conn: sqlite3.Connection) -> None:
+def _ensure_wal(conn: sqlite3.Connection, db_path: str | Path | None) -> None:
+    if db_path is None:
+        conn.execute("PRAGMA journal_mode=WAL")
+        return
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        conn.execute("PRAGMA journal_mode=WAL")
+        return
+    if (str(db_path), st.st_dev, st.st_ino, st.st_ctime_ns) in _WAL_READY:
+        return
+    # Only memoize a confirmed switch; e.g. a read-only file stays in its old mode.
+    if conn.execute("PRAGMA journal_mode=WAL").fetchone()[0] != "wal":
+        return
+    # Re-stat: switching rewrites the header of a fresh file and bumps its ctime.
+    st = os.stat(db_path)
+    _WAL_READY.add((str(db_path), st.st_dev, st.st_ino, st.st_ctime_ns))
+
+
+def _configure_connection(conn: sqlite3.Connection, db_path: str | Path | None = None) -> None:
     conn.autocommit = True
-    conn.execute("PRAGMA journal_mode=WAL")
+    _ensure_wal(conn, db_path)
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
     conn.row_factory = sqlite3.Row
 
 
@@ -32,7 +62,7 @@ def get_db(repo_path: str | Path) -> sqlite3.Connection:
     db_path = Path(repo_path) / ".entirecontext" / "db" / "local.db"
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(db_path), factory=_ECConnection)
-    _configure_connection(conn)
+    _configure_connection(conn, db_path)
     return conn
 
 
@@ -40,7 +70,7 @@ def get_global_db() -> sqlite3.Connection:
     """Get a connection to the global cross-repo index database."""
     _GLOBAL_DB_DIR.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(_GLOBAL_DB_PATH), factory=_ECConnection)
-    _configure_connection(conn)
+    _configure_connection(conn, _GLOBAL_DB_PATH)
     return conn
 
 
@@ -0,0 +1,17 @@
+"""Migration to schema v18: index attribution line ranges per file."""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def _index_attribution_lines(conn: sqlite3.Connection) -> None:
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'attributions'").fetchone()
+    if not exists:
+        return
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_attributions_file_lines ON attributions(file_path, start_line)")
+    # The composite index covers every lookup the single-column one served.
+    conn.execute("DROP INDEX IF EXISTS idx_attributions_file")
+
+
+MIGRATION_STEPS = [_index_attribution_lines]
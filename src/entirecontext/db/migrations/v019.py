@@ -0,0 +1,19 @@
+"""Migration to schema v19: index event listing filters."""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def _index_event_listing(conn: sqlite3.Connection) -> None:
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events'").fetchone()
+    if not exists:
+        return
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_status_type_created ON events(status, event_type, created_at DESC)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_status_created ON events(status, created_at DESC)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at DESC)")
+
+
+MIGRATION_STEPS = [_index_event_listing]
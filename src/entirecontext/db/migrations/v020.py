@@ -0,0 +1,36 @@
+"""Migration to schema v20: add the id tiebreaker to listing indexes."""
+
+from __future__ import annotations
+
+import sqlite3
+
+_EVENT_INDEXES = {
+    "idx_events_status_type_created": "events(status, event_type, created_at DESC, id DESC)",
+    "idx_events_status_created": "events(status, created_at DESC, id DESC)",
+    "idx_events_created": "events(created_at DESC, id DESC)",
+}
+_ASSESSMENT_INDEXES = {
+    "idx_assessments_created": "assessments(created_at DESC, id DESC)",
+}
+
+
+def _rebuild(conn: sqlite3.Connection, table: str, indexes: dict[str, str]) -> None:
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if not {"id", "created_at"} <= columns:
+        return
+    # Same names, wider keys: ORDER BY created_at DESC, id DESC is then read
+    # straight from the index instead of through a temp b-tree.
+    for name, target in indexes.items():
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+        conn.execute(f"CREATE INDEX {name} ON {target}")
+
+
+def _index_event_tiebreaker(conn: sqlite3.Connection) -> None:
+    _rebuild(conn, "events", _EVENT_INDEXES)
+
+
+def _index_assessment_tiebreaker(conn: sqlite3.Connection) -> None:
+    _rebuild(conn, "assessments", _ASSESSMENT_INDEXES)
+
+
+MIGRATION_STEPS = [_index_event_tiebreaker, _index_assessment_tiebreaker]
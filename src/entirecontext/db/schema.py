@@ -1,6 +1,6 @@
 """Database schema definitions for EntireContext."""
 
-SCHEMA_VERSION = 17
+SCHEMA_VERSION = 20
 
 # Minimum SQLite version required (for JSON functions)
 MIN_SQLITE_VERSION = "3.38.0"
@@ -127,6 +127,9 @@ CREATE TABLE IF NOT EXISTS events (
     updated_at TEXT DEFAULT (datetime('now')),
     metadata TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_events_status_type_created ON events(status, event_type, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_events_status_created ON events(status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at DESC, id DESC);
 """,
     "event_sessions": """
 CREATE TABLE IF NOT EXISTS event_sessions (
@@ -167,7 +170,7 @@ CREATE TABLE IF NOT EXISTS attributions (
     FOREIGN KEY (turn_id) REFERENCES turns(id) ON DELETE SET NULL
 );
 CREATE INDEX IF NOT EXISTS idx_attributions_checkpoint ON attributions(checkpoint_id);
-CREATE INDEX IF NOT EXISTS idx_attributions_file ON attributions(file_path);
+CREATE INDEX IF NOT EXISTS idx_attributions_file_lines ON attributions(file_path, start_line);
 CREATE INDEX IF NOT EXISTS idx_attributions_agent ON attributions(agent_id);
 """,
     "embeddings": """
@@ -200,7 +203,7 @@ CREATE TABLE IF NOT EXISTS assessments (
     FOREIGN KEY (checkpoint_id) REFERENCES checkpoints(id) ON DELETE SET NULL
 );
 CREATE INDEX IF NOT EXISTS idx_assessments_verdict ON assessments(verdict);
-CREATE INDEX IF NOT EXISTS idx_assessments_created ON assessments(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_assessments_created ON assessments(created_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_assessments_checkpoint ON assessments(checkpoint_id);
 """,
     "decisions": """
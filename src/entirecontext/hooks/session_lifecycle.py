@@ -550,7 +550,7 @@ def _maybe_create_auto_checkpoint(repo_path: str, session_id: str) -> None:
         git_branch = get_current_branch(repo_path)
         conn = get_db(repo_path)
         try:
-            prev_checkpoints = list_checkpoints(conn, session_id=session_id, limit=1)
+            prev_checkpoints = list_checkpoints(conn, session_id=session_id, limit=1, include_snapshot=False)
             if prev_checkpoints:
                 from_commit = prev_checkpoints[0]["git_commit_hash"]
             else:
@@ -662,7 +662,7 @@ def on_post_commit(data: dict[str, Any]) -> None:
             session_id = session["id"]
             git_branch = get_current_branch(repo_path)
 
-            prev_checkpoints = list_checkpoints(conn, session_id=session_id, limit=1)
+            prev_checkpoints = list_checkpoints(conn, session_id=session_id, limit=1, include_snapshot=False)
             if prev_checkpoints:
                 from_commit = prev_checkpoints[0]["git_commit_hash"]
             else:
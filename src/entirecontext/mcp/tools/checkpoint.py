@@ -24,6 +24,7 @@ async def ec_checkpoint_list(
             since=since,
             limit=limit,
             include_warnings=True,
+            include_snapshot=False,
         )
         checkpoints = [
             {
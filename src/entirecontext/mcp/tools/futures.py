@@ -57,9 +57,11 @@ async def ec_assess_create(
 
         resolved_checkpoint_id = None
         if checkpoint_id:
+            from ...core.resolve import prefix_range
+
             row = conn.execute(
-                "SELECT id, diff_summary FROM checkpoints WHERE id = ? OR id LIKE ?",
-                (checkpoint_id, f"{checkpoint_id}%"),
+                "SELECT id, diff_summary FROM checkpoints WHERE id >= ? AND id < ? ORDER BY id LIMIT 1",
+                prefix_range(checkpoint_id),
             ).fetchone()
             if row:
                 resolved_checkpoint_id = row["id"]
@@ -92,9 +94,9 @@ async def ec_assess_create(
         if not roadmap_text and repo_path:
             from pathlib import Path
 
-            roadmap_path = Path(repo_path) / "ROADMAP.md"
-            if roadmap_path.exists():
-                roadmap_text = roadmap_path.read_text(encoding="utf-8")[:8000]
+            from ...core.futures import read_roadmap
+
+            roadmap_text = (read_roadmap(Path(repo_path) / "ROADMAP.md") or "")[:8000]
 
         user_prompt = ""
         if roadmap_text:
@@ -137,7 +139,7 @@ async def ec_feedback(assessment_id: str, feedback: str, reason: str | None = No
         from ...core.futures import add_feedback, auto_distill_lessons
 
         add_feedback(conn, assessment_id, feedback, feedback_reason=reason)
-        distilled = auto_distill_lessons(repo_path) if repo_path else False
+        distilled = auto_distill_lessons(repo_path, conn=conn) if repo_path else False
         return json.dumps(
             {
                 "status": "ok",
@@ -38,6 +38,8 @@ async def ec_search(
             )
         except ValueError as exc:
             return runtime.error_payload(str(exc))
+        except ImportError as exc:
+            return runtime.error_payload(f"sentence-transformers is required: {exc}")
         retrieval_event_id = None
     else:
         (conn, repo_path), error = runtime.resolve_repo()
@@ -18,6 +18,16 @@ def reset_mcp_runtime_cache(monkeypatch):
     monkeypatch.setattr(runtime, "_cached_repo_path", None)
 
 
+@pytest.fixture(autouse=True)
+def reset_embedding_model_cache():
+    """Drop memoized SentenceTransformer models so each test sees its own mock."""
+    from entirecontext.core.embedding import _clear_model_cache
+
+    _clear_model_cache()
+    yield
+    _clear_model_cache()
+
+
 @pytest.fixture
 def git_repo(tmp_path):
     """Create a real git repo in a temp directory."""
@@ -435,6 +435,12 @@ class TestSearchAstSymbols:
         results = search_ast_symbols(ec_db, "compute", limit=1)
         assert len(results) <= 1
 
+    def test_combined_filters_bind_in_order(self, ec_repo, ec_db):
+        self._seed(ec_db)
+        results = search_ast_symbols(ec_db, "simple_function", symbol_type="function", file_filter="auth.py", limit=5)
+        assert [r["name"] for r in results] == ["simple_function"]
+        assert search_ast_symbols(ec_db, "simple_function", symbol_type="function", file_filter="widgets.py") == []
+
     def test_no_results_for_unknown_term(self, ec_repo, ec_db):
         self._seed(ec_db)
         results = search_ast_symbols(ec_db, "xyzzy_nonexistent_xyz")
@@ -82,6 +82,25 @@ class TestBlameCommand:
             runner.invoke(app, ["blame", "somefile.py", "-L", "10,20"])
             mock_attr.assert_called_once_with(mock_conn, "somefile.py", start_line=10, end_line=20)
 
+    @pytest.mark.parametrize("spec", ["10-20", "10:20"])
+    def test_line_range_alternate_separators(self, spec):
+        mock_conn = MagicMock()
+        with (
+            patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
+            patch("entirecontext.db.get_db", return_value=mock_conn),
+            patch("entirecontext.core.attribution.get_file_attributions", return_value=[]) as mock_attr,
+        ):
+            runner.invoke(app, ["blame", "somefile.py", "-L", spec])
+            mock_attr.assert_called_once_with(mock_conn, "somefile.py", start_line=10, end_line=20)
+
+    def test_invalid_line_range(self):
+        with patch("entirecontext.db.get_db") as mock_get_db:
+            result = runner.invoke(app, ["blame", "somefile.py", "-L", "ten"])
+            assert result.exit_code == 1
+            assert "Invalid line range" in result.output
+            assert "N, N,M, N-M or N:M" in " ".join(result.output.split())
+            mock_get_db.assert_not_called()
+
     def test_single_line(self):
         mock_conn = MagicMock()
         with (
@@ -120,6 +120,23 @@ class TestListCheckpoints:
         result = list_checkpoints(db)
         assert result[0]["id"] == "cp-second"
 
+    def test_without_snapshot_skips_blob_columns(self, db):
+        create_checkpoint(
+            db,
+            "s1",
+            "aaa",
+            files_snapshot={"a.py": "h1"},
+            diff_summary="1 file changed",
+            metadata={"k": "v"},
+            checkpoint_id="cp-slim",
+        )
+        result = list_checkpoints(db, include_snapshot=False)
+        assert result[0]["id"] == "cp-slim"
+        assert result[0]["git_commit_hash"] == "aaa"
+        assert result[0]["diff_summary"] == "1 file changed"
+        assert "files_snapshot" not in result[0]
+        assert "metadata" not in result[0]
+
 
 class TestDiffCheckpoints:
     def test_basic_diff(self, db):
@@ -219,6 +236,25 @@ class TestCheckpointCLI:
         assert "Added auth" in result.output
         assert "src/auth.py" in result.output
 
+    def test_checkpoint_show_truncates_large_snapshot(self, ec_repo, ec_db, monkeypatch):
+        from typer.testing import CliRunner
+
+        from entirecontext.cli import app
+
+        project_row = ec_db.execute("SELECT id FROM projects LIMIT 1").fetchone()
+        create_session(ec_db, project_row["id"], session_id="test-s1")
+        snapshot = {f"src/f{i:03d}.py": "h" for i in reversed(range(60))}
+        create_checkpoint(ec_db, "test-s1", "abc123", files_snapshot=snapshot, checkpoint_id="cp-big")
+
+        monkeypatch.setattr("entirecontext.core.project.find_git_root", lambda *a, **kw: str(ec_repo))
+        result = CliRunner().invoke(app, ["checkpoint", "show", "cp-big"])
+        assert result.exit_code == 0
+        assert "Files Snapshot (60 files)" in result.output
+        assert "src/f000.py" in result.output
+        assert "src/f049.py" in result.output
+        assert "src/f050.py" not in result.output
+        assert "... and 10 more" in result.output
+
     def test_checkpoint_show_not_found(self, ec_repo, ec_db, monkeypatch):
         from typer.testing import CliRunner
 
@@ -163,3 +163,40 @@ class TestRewindSafety:
         result = runner.invoke(app, ["rewind", "rw-cp1", "--restore"])
         assert result.exit_code == 1
         assert "uncommitted" in result.output.lower() or "stash" in result.output.lower()
+
+
+class TestLazyCommandLoading:
+    def test_importing_cli_does_not_import_command_modules(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, entirecontext.cli; print(sorted(m for m in sys.modules if m.startswith('entirecontext.cli.')))"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert proc.stdout.strip() == "[]"
+
+    def test_importing_command_module_defers_rich(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, entirecontext.cli.ast_cmds, entirecontext.cli.dashboard_cmds, "
+            "entirecontext.cli.futures_cmds, entirecontext.cli.graph_cmds, entirecontext.cli.project_cmds; "
+            "print('rich.console' in sys.modules, 'rich.table' in sys.modules, 'rich.panel' in sys.modules)"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert proc.stdout.strip() == "False False False"
+
+    def test_every_listed_command_resolves(self):
+        from entirecontext.cli import _COMMAND_MODULES
+
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for name in _COMMAND_MODULES:
+            assert name in result.output
+
+    def test_typo_still_suggests_lazy_command(self):
+        result = runner.invoke(app, ["stat"])
+        assert result.exit_code != 0
+        assert "status" in result.output
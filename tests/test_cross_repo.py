@@ -68,6 +68,21 @@ class TestCrossRepoSearch:
         assert "backend" in repo_names
         assert all("hybrid_score" in r for r in results)
 
+    def test_semantic_embeds_query_once(self, multi_ec_repos, monkeypatch):
+        import struct
+
+        calls = []
+
+        def fake_embed_text(text, model_name="all-MiniLM-L6-v2"):
+            calls.append(text)
+            return struct.pack("3f", 1.0, 0.0, 0.0)
+
+        monkeypatch.setattr("entirecontext.core.embedding.embed_text", fake_embed_text)
+        results, warnings = cross_repo_search("auth", search_type="semantic", include_warnings=True)
+        assert calls == ["auth"]
+        assert warnings == []
+        assert results == []
+
     def test_results_contain_repo_name(self, multi_ec_repos):
         results = cross_repo_search("auth")
         for r in results:
@@ -127,3 +142,26 @@ class TestCrossRepoSessions:
     def test_limit_applied(self, multi_ec_repos):
         sessions = cross_repo_sessions(limit=1)
         assert len(sessions) <= 1
+
+
+class TestRepoExecutorMap:
+    def test_yields_results_and_warnings_in_registry_order(self, multi_ec_repos):
+        from entirecontext.core.cross_repo import RepoExecutor
+
+        executor = RepoExecutor()
+        repo_list = executor.registry.list_repos()
+
+        def fn(conn, repo):
+            if repo["repo_name"] == "backend":
+                raise RuntimeError("boom")
+            return repo["repo_name"]
+
+        rows = list(executor.map(fn, repo_list, phase="probe"))
+        assert [repo["repo_name"] for repo, _, _ in rows] == [repo["repo_name"] for repo in repo_list]
+        for repo, result, warning in rows:
+            if repo["repo_name"] == "backend":
+                assert result is None
+                assert warning["phase"] == "probe"
+            else:
+                assert result == repo["repo_name"]
+                assert warning is None
@@ -112,6 +112,21 @@ class TestForEachRepo:
         assert results == []
         assert warnings == []
 
+    def test_repos_queried_on_worker_threads(self, multi_ec_repos):
+        import threading
+
+        seen = []
+
+        def fn(conn, repo):
+            seen.append(threading.get_ident())
+            return [{"repo": repo["repo_name"]}]
+
+        results, warnings = _for_each_repo(fn)
+        assert warnings == []
+        assert len(results) == 2
+        assert len(seen) == 2
+        assert threading.get_ident() not in seen
+
 
 class TestReturnWithWarnings:
     def test_include_warnings_true(self):
@@ -241,5 +241,5 @@ class TestCrossRepoAssessmentTrends:
 
         trends, warnings = cross_repo_assessment_trends(include_warnings=True)
         assert len(warnings) >= 1
-        assert any(w["repo_name"] == "broken" for w in warnings)
+        assert any(w["repo_name"] == "broken" and w["phase"] == "trends" for w in warnings)
         assert "frontend" in trends["by_repo"]
@@ -69,6 +69,34 @@ class TestSchemaCreation:
         result = db.execute("PRAGMA foreign_keys").fetchone()
         assert result[0] == 1
 
+    def test_file_db_tuned_and_stays_wal_on_reopen(self, tmp_path):
+        from entirecontext.db.connection import get_db
+
+        for _ in range(2):
+            conn = get_db(tmp_path)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+            conn.close()
+
+    def test_recreated_db_file_is_switched_to_wal(self, tmp_path, monkeypatch):
+        import os
+
+        from entirecontext.db import connection
+
+        db_path = tmp_path / ".entirecontext" / "db" / "local.db"
+        db_path.parent.mkdir(parents=True)
+        fresh = sqlite3.connect(db_path)
+        fresh.execute("CREATE TABLE t (x)")
+        fresh.close()
+        # Memo left by an earlier, since-deleted file whose inode was reused.
+        st = os.stat(db_path)
+        monkeypatch.setattr(connection, "_WAL_READY", {(str(db_path), st.st_dev, st.st_ino, st.st_ctime_ns - 1)})
+
+        conn = connection.get_db(tmp_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
     def test_decisions_table_has_auto_promotion_reset_at(self, db):
         columns = {row[1] for row in db.execute("PRAGMA table_info(decisions)").fetchall()}
         assert "auto_promotion_reset_at" in columns
@@ -479,9 +507,7 @@ class TestMigration:
 
     def test_migrate_v14_to_v15_adds_ranking_snapshots(self):
         conn = get_memory_db()
-        conn.execute(
-            "CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT, description TEXT)"
-        )
+        conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT, description TEXT)")
         conn.execute("INSERT INTO schema_version (version, description) VALUES (14, 'v14')")
         # ranking_snapshots FK target
         conn.execute(
@@ -491,24 +517,25 @@ class TestMigration:
         conn.commit()
 
         # Verify table does not exist yet
-        row = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='ranking_snapshots'"
-        ).fetchone()
+        row = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='ranking_snapshots'").fetchone()
         assert row is None
 
         check_and_migrate(conn)
 
         # Table exists
-        row = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='ranking_snapshots'"
-        ).fetchone()
+        row = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='ranking_snapshots'").fetchone()
         assert row is not None
 
         # Columns are correct
         cols = {r[1] for r in conn.execute("PRAGMA table_info(ranking_snapshots)").fetchall()}
         expected = {
-            "id", "retrieval_event_id", "input_files", "input_diff_text",
-            "input_commits", "scored_candidates", "effective_limit",
+            "id",
+            "retrieval_event_id",
+            "input_files",
+            "input_diff_text",
+            "input_commits",
+            "scored_candidates",
+            "effective_limit",
             "created_at",
         }
         assert expected.issubset(cols)
@@ -518,15 +545,11 @@ class TestMigration:
         assert col_info["retrieval_event_id"] == 0  # notnull=0 means nullable
 
         # Verify schema version
-        ver = conn.execute(
-            "SELECT version FROM schema_version ORDER BY version DESC LIMIT 1"
-        ).fetchone()[0]
+        ver = conn.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1").fetchone()[0]
         assert ver == SCHEMA_VERSION
 
         # FK works: can insert with NULL retrieval_event_id
-        conn.execute(
-            "INSERT INTO ranking_snapshots (id, scored_candidates, effective_limit) VALUES ('s1', '[]', 5)"
-        )
+        conn.execute("INSERT INTO ranking_snapshots (id, scored_candidates, effective_limit) VALUES ('s1', '[]', 5)")
         row = conn.execute("SELECT * FROM ranking_snapshots WHERE id='s1'").fetchone()
         assert row is not None
         conn.close()
@@ -28,7 +28,7 @@ def _make_mock_model() -> MagicMock:
     fake_vector = MagicMock()
     fake_vector.tobytes.return_value = b"\x00" * 1536
     fake_vector.__len__ = lambda self: 384
-    mock_model.encode.return_value = fake_vector
+    mock_model.encode.side_effect = lambda texts, **kwargs: [fake_vector for _ in texts]
     return mock_model
 
 
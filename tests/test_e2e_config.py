@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tomllib
 
+import pytest
 from typer.testing import CliRunner
 
 from entirecontext.cli import app
@@ -36,6 +37,36 @@ class TestConfigAPI:
             data = tomllib.load(f)
         assert data["capture"]["auto_capture"] is False
 
+    def test_failed_save_keeps_previous_config(self, ec_repo, isolated_global_config):
+        from unittest.mock import patch
+
+        save_config(str(ec_repo), "capture.auto_capture", "false")
+        config_path = ec_repo / ".entirecontext" / "config.toml"
+        before = config_path.read_text()
+
+        with patch("entirecontext.core.config.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                save_config(str(ec_repo), "capture.auto_capture", "true")
+
+        assert config_path.read_text() == before
+        assert not config_path.with_suffix(".toml.tmp").exists()
+
+    def test_write_follows_symlink_and_keeps_mode(self, tmp_path):
+        from entirecontext.core.config import _write_toml
+
+        target = tmp_path / "dotfiles" / "config.toml"
+        target.parent.mkdir()
+        target.write_text('notify = ["old"]\n')
+        target.chmod(0o600)
+        link = tmp_path / "config.toml"
+        link.symlink_to(target)
+
+        _write_toml(link, {"notify": ["new"]})
+
+        assert link.is_symlink()
+        assert tomllib.loads(target.read_text()) == {"notify": ["new"]}
+        assert target.stat().st_mode & 0o777 == 0o600
+
 
 class TestConfigCLI:
     def test_dump_all(self, ec_repo, isolated_global_config, monkeypatch):
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+
 from entirecontext.core.project import get_status, init_project
 from entirecontext.db import get_db
 
@@ -67,3 +70,52 @@ class TestProjectInit:
         assert status["turn_count"] == 0
         assert status["checkpoint_count"] == 0
         assert status["active_session"] is None
+
+
+class TestFindGitRoot:
+    def test_memoizes_root_for_subdirectories(self, git_repo, monkeypatch):
+
+        from entirecontext.core import project
+
+        sub = git_repo / "a" / "b"
+        sub.mkdir(parents=True)
+        root = project.find_git_root(sub)
+        assert root is not None
+
+        def _no_git(*args, **kwargs):
+            raise AssertionError("git should not be spawned for a cached path")
+
+        monkeypatch.setattr(subprocess, "run", _no_git)
+        assert project.find_git_root(sub) == root
+        assert project.find_git_root(git_repo / "a") == root
+
+    def test_git_work_tree_env_wins_for_cwd_lookup(self, git_repo, tmp_path, monkeypatch):
+        from entirecontext.core.project import find_git_root
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_WORK_TREE", str(git_repo))
+        assert find_git_root() == str(git_repo)
+
+    def test_git_work_tree_env_ignored_for_explicit_path(self, git_repo, tmp_path, monkeypatch):
+        from entirecontext.core.project import find_git_root
+
+        other = tmp_path / "other"
+        subprocess.run(["git", "init", str(other)], check=True, capture_output=True)
+        monkeypatch.setenv("GIT_WORK_TREE", str(git_repo))
+        assert find_git_root(tmp_path) is None
+        assert os.path.realpath(find_git_root(other)) == os.path.realpath(other)
+
+    def test_git_work_tree_env_ignored_when_not_a_repo(self, tmp_path, monkeypatch):
+        from entirecontext.core.project import find_git_root
+
+        not_a_repo = tmp_path / "plain"
+        not_a_repo.mkdir()
+        monkeypatch.chdir(not_a_repo)
+        monkeypatch.setenv("GIT_WORK_TREE", str(not_a_repo))
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        assert find_git_root() is None
+
+    def test_non_repo_returns_none(self, tmp_path):
+        from entirecontext.core.project import find_git_root
+
+        assert find_git_root(tmp_path) is None
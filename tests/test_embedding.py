@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import struct
 import sys
 import types
 from unittest.mock import MagicMock, patch
@@ -37,7 +38,9 @@ def _make_mock_model():
     fake_vector = MagicMock()
     fake_vector.tobytes.return_value = b"\x00" * 1536
     fake_vector.__len__ = lambda self: 384
-    mock_model.encode.return_value = fake_vector
+    mock_model.encode.side_effect = lambda texts, **kwargs: (
+        fake_vector if isinstance(texts, str) else [fake_vector for _ in texts]
+    )
     return mock_model
 
 
@@ -125,6 +128,106 @@ def test_generate_embeddings_force(conn):
     assert len(rows) == 2
 
 
+def test_generate_embeddings_encodes_rows_in_one_batch(conn):
+    db, session_id = conn
+    _seed_turn(db, session_id, "implement auth", "added auth module")
+    mock_model = _make_mock_model()
+
+    with _patch_sentence_transformers(mock_model):
+        generate_embeddings(db, "/tmp/test-repo")
+
+    mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args.args[0] == ["implement auth added auth module", "test session session summary"]
+
+
+def test_model_is_loaded_once_per_process(conn):
+    db, session_id = conn
+    _seed_turn(db, session_id, "implement auth", "added auth module")
+    mock_model = _make_mock_model()
+
+    with _patch_sentence_transformers(mock_model):
+        import sentence_transformers
+
+        generate_embeddings(db, "/tmp/test-repo")
+        generate_embeddings(db, "/tmp/test-repo", force=True)
+
+    sentence_transformers.SentenceTransformer.assert_called_once_with("all-MiniLM-L6-v2", device=None)
+
+
+def test_concurrent_first_loads_share_one_model():
+    import threading
+    import time
+
+    from entirecontext.core.embedding import _load_model
+
+    mock_module = types.ModuleType("sentence_transformers")
+
+    def slow_model(*args, **kwargs):
+        time.sleep(0.05)
+        return _make_mock_model()
+
+    mock_module.SentenceTransformer = MagicMock(side_effect=slow_model)
+    barrier = threading.Barrier(4)
+    models = []
+
+    def load():
+        barrier.wait()
+        models.append(_load_model("all-MiniLM-L6-v2", None))
+
+    with patch.dict(sys.modules, {"sentence_transformers": mock_module}):
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    mock_module.SentenceTransformer.assert_called_once_with("all-MiniLM-L6-v2", device=None)
+    assert all(model is models[0] for model in models)
+
+
+def test_embed_text_and_generate_embeddings_share_model(conn):
+    from entirecontext.core.embedding import embed_text
+
+    db, session_id = conn
+    _seed_turn(db, session_id, "implement auth", "added auth module")
+    mock_model = _make_mock_model()
+
+    with _patch_sentence_transformers(mock_model):
+        import sentence_transformers
+
+        embed_text("auth")
+        generate_embeddings(db, "/tmp/test-repo")
+
+    sentence_transformers.SentenceTransformer.assert_called_once_with("all-MiniLM-L6-v2", device=None)
+
+
+def test_generate_embeddings_stores_int8_vectors(conn):
+    db, session_id = conn
+    _seed_turn(db, session_id, "implement auth", "added auth module")
+    mock_model = _make_mock_model()
+
+    with _patch_sentence_transformers(mock_model):
+        generate_embeddings(db, "/tmp/test-repo")
+
+    row = db.execute("SELECT vector, dimensions FROM embeddings WHERE source_type = 'turn'").fetchone()
+    assert row["dimensions"] == 384
+    assert len(row["vector"]) == 384
+
+
+def test_quantized_vectors_keep_cosine_ranking():
+    from entirecontext.core.embedding import _cosine, _decode_vector, _quantize, cosine_similarity
+
+    query = struct.pack("4f", 0.9, 0.1, -0.3, 0.2)
+    near = struct.pack("4f", 0.8, 0.2, -0.25, 0.1)
+    far = struct.pack("4f", -0.5, 0.7, 0.4, -0.1)
+    query_vec = struct.unpack("4f", query)
+
+    for doc in (near, far):
+        quantized = _decode_vector(_quantize(doc), 4)
+        assert _cosine(query_vec, quantized) == pytest.approx(cosine_similarity(query, doc), abs=0.01)
+    assert _decode_vector(_quantize(struct.pack("2f", 0.0, 0.0)), 2) == (0, 0)
+
+
 def test_generate_embeddings_null_text(conn):
     db, session_id = conn
     turn_id = str(uuid4())
@@ -7,14 +7,17 @@ import pytest
 from entirecontext.db.connection import get_memory_db
 from entirecontext.db.migration import init_schema
 from entirecontext.core.event import (
+    EVENT_SUMMARY_COLUMNS,
     create_event,
     get_event,
+    iter_events,
     list_events,
     update_event,
     link_event_session,
     link_event_checkpoint,
     get_event_sessions,
     get_event_checkpoints,
+    get_event_with_sessions,
 )
 from entirecontext.core.session import create_session
 
@@ -96,6 +99,18 @@ class TestListEvents:
         events = list_events(db)
         assert events == []
 
+    def test_iter_events_yields_rows_newest_first(self, db):
+        for i in range(3):
+            create_event(db, f"Event {i}")
+        rows = iter_events(db, limit=2)
+        assert [r["title"] for r in rows] == ["Event 2", "Event 1"]
+
+    def test_iter_events_selects_only_requested_columns(self, db):
+        create_event(db, "Narrow", description="long text")
+        (row,) = iter_events(db, columns=EVENT_SUMMARY_COLUMNS)
+        assert tuple(row.keys()) == EVENT_SUMMARY_COLUMNS
+        assert row["title"] == "Narrow"
+
 
 class TestUpdateEvent:
     def test_update_title(self, db):
@@ -202,6 +217,27 @@ class TestGetEventSessions:
         assert get_event_sessions(db, e["id"]) == []
 
 
+class TestGetEventWithSessions:
+    def test_prefix_lookup_returns_event_and_sessions(self, db):
+        e = create_event(db, "Test event", description="details")
+        create_session(db, "p1", session_id="s1")
+        create_session(db, "p1", session_id="s2")
+        link_event_session(db, e["id"], "s1")
+        link_event_session(db, e["id"], "s2")
+        event, sessions = get_event_with_sessions(db, e["id"][:8])
+        assert event == get_event(db, e["id"])
+        assert {s["id"] for s in sessions} == {"s1", "s2"}
+        assert set(sessions[0]) == {"id", "session_type", "ended_at"}
+
+    def test_without_sessions_and_missing(self, db):
+        e = create_event(db, "Empty event")
+        event, sessions = get_event_with_sessions(db, e["id"])
+        assert event["id"] == e["id"]
+        assert sessions == []
+        assert get_event_with_sessions(db, "nope") == (None, [])
+        assert get_event_with_sessions(db, "%") == (None, [])
+
+
 class TestGetEventCheckpoints:
     def test_no_linked_checkpoints(self, db):
         e = create_event(db, "Empty event")
@@ -22,7 +22,7 @@ class TestEventList:
         with (
             patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
             patch("entirecontext.db.get_db", return_value=mock_conn),
-            patch("entirecontext.core.event.list_events", return_value=[]),
+            patch("entirecontext.core.event.iter_events", return_value=[]),
         ):
             result = runner.invoke(app, ["event", "list"])
             assert result.exit_code == 0
@@ -42,7 +42,7 @@ class TestEventList:
         with (
             patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
             patch("entirecontext.db.get_db", return_value=mock_conn),
-            patch("entirecontext.core.event.list_events", return_value=events),
+            patch("entirecontext.core.event.iter_events", return_value=events),
         ):
             result = runner.invoke(app, ["event", "list"])
             assert result.exit_code == 0
@@ -70,6 +70,40 @@ class TestEventList:
             assert result.exit_code == 0
             assert "No events found" in result.output
 
+    def test_before_cursor_pages_through_events(self, ec_repo, ec_db, monkeypatch):
+        from entirecontext.core.event import create_event
+
+        for i in range(3):
+            event = create_event(ec_db, f"Event {i}")
+            ec_db.execute("UPDATE events SET created_at = ? WHERE id = ?", (f"2025-01-0{i + 1}", event["id"]))
+        monkeypatch.chdir(ec_repo)
+
+        first = runner.invoke(app, ["event", "list", "--limit", "2"])
+        assert first.exit_code == 0
+        assert "Event 2" in first.output and "Event 1" in first.output
+        assert "--before 2025-01-02 --before-id " in first.output
+
+        second = runner.invoke(app, ["event", "list", "--limit", "2", "--before", "2025-01-02"])
+        assert second.exit_code == 0
+        assert "Event 0" in second.output and "Event 1" not in second.output
+        assert "--before" not in second.output
+
+    def test_before_cursor_keeps_rows_sharing_the_boundary_timestamp(self, ec_repo, ec_db, monkeypatch):
+        from entirecontext.core.event import create_event
+
+        for i in range(3):
+            event = create_event(ec_db, f"Event {i}")
+            ec_db.execute("UPDATE events SET created_at = '2025-01-01', id = ? WHERE id = ?", (f"evt-{i}", event["id"]))
+        monkeypatch.chdir(ec_repo)
+
+        first = runner.invoke(app, ["event", "list", "--limit", "2"])
+        assert "Event 2" in first.output and "Event 1" in first.output
+        assert "--before 2025-01-01 --before-id evt-1" in first.output
+
+        second = runner.invoke(app, ["event", "list", "--limit", "2", "--before", "2025-01-01", "--before-id", "evt-1"])
+        assert second.exit_code == 0
+        assert "Event 0" in second.output and "Event 1" not in second.output
+
 
 class TestEventShow:
     def test_not_in_repo(self):
@@ -79,11 +113,10 @@ class TestEventShow:
 
     def test_not_found(self):
         mock_conn = MagicMock()
-        mock_conn.execute.return_value.fetchone.return_value = None
         with (
             patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
             patch("entirecontext.db.get_db", return_value=mock_conn),
-            patch("entirecontext.core.event.get_event", return_value=None),
+            patch("entirecontext.core.event.get_event_with_sessions", return_value=(None, [])),
         ):
             result = runner.invoke(app, ["event", "show", "evt-notexist"])
             assert result.exit_code == 1
@@ -109,8 +142,7 @@ class TestEventShow:
         with (
             patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
             patch("entirecontext.db.get_db", return_value=mock_conn),
-            patch("entirecontext.core.event.get_event", return_value=event),
-            patch("entirecontext.core.event.get_event_sessions", return_value=sessions),
+            patch("entirecontext.core.event.get_event_with_sessions", return_value=(event, sessions)),
         ):
             result = runner.invoke(app, ["event", "show", "evt-abc123456789"])
             assert result.exit_code == 0
@@ -175,24 +207,44 @@ class TestEventLink:
             patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
             patch("entirecontext.db.get_db", return_value=mock_conn),
             patch("entirecontext.core.event.get_event", return_value=event),
-            patch("entirecontext.core.session.get_session", return_value=None),
+            patch("entirecontext.core.session.missing_session_ids", return_value=["sess-notexist"]),
+            patch("entirecontext.core.event.link_event_sessions") as mock_link,
         ):
-            result = runner.invoke(app, ["event", "link", "evt-123", "sess-notexist"])
+            result = runner.invoke(app, ["event", "link", "evt-123", "sess-1", "sess-notexist"])
             assert result.exit_code == 1
             assert "Session not found" in result.output
+            assert "sess-notexist" in result.output
+            mock_link.assert_not_called()
 
     def test_success(self):
         mock_conn = MagicMock()
         event = {"id": "evt-123456789abc"}
-        session = {"id": "sess-123456789abc"}
         with (
             patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
             patch("entirecontext.db.get_db", return_value=mock_conn),
             patch("entirecontext.core.event.get_event", return_value=event),
-            patch("entirecontext.core.session.get_session", return_value=session),
-            patch("entirecontext.core.event.link_event_session") as mock_link,
+            patch("entirecontext.core.session.missing_session_ids", return_value=[]),
+            patch("entirecontext.core.event.link_event_sessions") as mock_link,
         ):
             result = runner.invoke(app, ["event", "link", "evt-123456789abc", "sess-123456789abc"])
             assert result.exit_code == 0
             assert "Linked" in result.output
-            mock_link.assert_called_once_with(mock_conn, "evt-123456789abc", "sess-123456789abc")
+            mock_link.assert_called_once_with(mock_conn, "evt-123456789abc", ["sess-123456789abc"])
+
+    def test_links_multiple_sessions(self, ec_repo, ec_db, monkeypatch):
+        from entirecontext.core.event import create_event, get_event_sessions
+        from entirecontext.core.session import create_session
+
+        project = ec_db.execute("SELECT id FROM projects LIMIT 1").fetchone()
+        for sid in ("sess-a", "sess-b"):
+            create_session(ec_db, project["id"], session_id=sid)
+        event = create_event(ec_db, "Multi")
+        monkeypatch.setattr("entirecontext.core.project.find_git_root", lambda *a, **kw: str(ec_repo))
+
+        result = runner.invoke(app, ["event", "link", event["id"], "sess-a", "sess-b", "sess-a"])
+        assert result.exit_code == 0
+        assert sorted(s["id"] for s in get_event_sessions(ec_db, event["id"])) == ["sess-a", "sess-b"]
+
+        result = runner.invoke(app, ["event", "link", event["id"], "sess-missing"])
+        assert result.exit_code == 1
+        assert "sess-missing" in result.output
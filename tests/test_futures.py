@@ -12,6 +12,7 @@ from entirecontext.core.futures import (
     get_assessment,
     get_lessons,
     list_assessments,
+    read_roadmap,
 )
 
 
@@ -50,6 +51,20 @@ def test_list_assessments_filter(ec_db):
     assert len(narrow_only) == 1
 
 
+def test_list_assessments_before_cursor_breaks_timestamp_ties(ec_db):
+    for i in range(3):
+        result = create_assessment(ec_db, verdict="neutral", impact_summary=str(i))
+        ec_db.execute(
+            "UPDATE assessments SET created_at = '2025-01-01', id = ? WHERE id = ?", (f"as-{i}", result["id"])
+        )
+
+    first = list_assessments(ec_db, limit=2)
+    assert [a["id"] for a in first] == ["as-2", "as-1"]
+
+    rest = list_assessments(ec_db, limit=2, before=first[-1]["created_at"], before_id=first[-1]["id"])
+    assert [a["id"] for a in rest] == ["as-0"]
+
+
 def test_add_feedback(ec_db):
     """Test adding feedback to an assessment."""
     result = create_assessment(ec_db, verdict="neutral", impact_summary="Test")
@@ -64,6 +79,31 @@ def test_add_feedback(ec_db):
     assert lessons[0]["id"] == result["id"]
 
 
+def test_read_roadmap_rereads_after_edit(tmp_path):
+    import os
+
+    path = tmp_path / "ROADMAP.md"
+    assert read_roadmap(path) is None
+    path.write_text("v1", encoding="utf-8")
+    assert read_roadmap(path) == "v1"
+    assert read_roadmap(str(path)) == "v1"
+    st = path.stat()
+    path.write_text("v2!", encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert read_roadmap(path) == "v2!"
+
+
+def test_get_lessons_since_filters_in_sql(ec_db):
+    old = create_assessment(ec_db, verdict="narrow", impact_summary="Old")
+    new = create_assessment(ec_db, verdict="expand", impact_summary="New")
+    for a in (old, new):
+        add_feedback(ec_db, a["id"], "agree")
+    ec_db.execute("UPDATE assessments SET created_at = '2024-01-01' WHERE id = ?", (old["id"],))
+
+    assert [item["id"] for item in get_lessons(ec_db, since="2025-01-01")] == [new["id"]]
+    assert len(get_lessons(ec_db)) == 2
+
+
 def test_invalid_verdict(ec_db):
     """Test that invalid verdict raises ValueError."""
     with pytest.raises(ValueError, match="Invalid verdict"):
@@ -162,6 +202,29 @@ def test_auto_distill_lessons_enabled(ec_repo, monkeypatch):
     assert "Auto distill test" in output.read_text(encoding="utf-8")
 
 
+def test_auto_distill_lessons_reuses_connection(ec_repo, monkeypatch):
+    from entirecontext.core.config import load_config
+    from entirecontext.db import get_db
+
+    monkeypatch.setattr(
+        "entirecontext.core.config.load_config",
+        lambda repo_path=None: {
+            **load_config(repo_path),
+            "futures": {"auto_distill": True, "lessons_output": "LESSONS.md"},
+        },
+    )
+
+    conn = get_db(str(ec_repo))
+    a = create_assessment(conn, verdict="expand", impact_summary="Shared conn test")
+    add_feedback(conn, a["id"], "agree")
+    monkeypatch.setattr("entirecontext.db.get_db", lambda *a, **kw: pytest.fail("opened a second connection"))
+
+    assert auto_distill_lessons(str(ec_repo), conn=conn) is True
+    assert conn.execute("SELECT 1").fetchone()[0] == 1
+    conn.close()
+    assert "Shared conn test" in (ec_repo / "LESSONS.md").read_text(encoding="utf-8")
+
+
 def test_auto_distill_lessons_disabled(ec_repo, monkeypatch):
     """Test that auto_distill=False does not write LESSONS.md."""
     from entirecontext.core.config import load_config
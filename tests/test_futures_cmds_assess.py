@@ -81,6 +81,86 @@ def test_assess_no_staged_diff(ec_repo, monkeypatch):
     assert "No staged changes" in result.output
 
 
+def test_staged_diff_is_read_up_to_cap(ec_repo, monkeypatch):
+    import subprocess
+
+    from entirecontext.cli.futures_cmds import _get_staged_diff
+
+    monkeypatch.chdir(ec_repo)
+    (ec_repo / "big.txt").write_text("line\n" * 50000)
+    subprocess.run(["git", "add", "big.txt"], check=True, capture_output=True)
+    diff = _get_staged_diff(max_chars=200)
+    assert len(diff) == 200
+    assert diff.startswith("diff --git a/big.txt b/big.txt")
+
+
+def test_staged_diff_drops_generated_files_when_over_budget(ec_repo, monkeypatch):
+    import subprocess
+
+    from entirecontext.cli.futures_cmds import _get_staged_diff
+
+    monkeypatch.chdir(ec_repo)
+    (ec_repo / "uv.lock").write_text("pkg\n" * 50000)
+    (ec_repo / "app.py").write_text("print('hi')\n")
+    subprocess.run(["git", "add", "uv.lock", "app.py"], check=True, capture_output=True)
+    diff = _get_staged_diff(max_chars=2000)
+    assert "diff --git a/app.py b/app.py" in diff
+    assert "uv.lock" not in diff
+
+
+def test_staged_diff_drops_root_lockfile_from_subdirectory(ec_repo, monkeypatch):
+    import subprocess
+
+    from entirecontext.cli.futures_cmds import _get_staged_diff
+
+    sub = ec_repo / "sub"
+    sub.mkdir()
+    (ec_repo / "uv.lock").write_text("pkg\n" * 50000)
+    (sub / "app.py").write_text("print('hi')\n")
+    monkeypatch.chdir(sub)
+    subprocess.run(["git", "add", "../uv.lock", "app.py"], check=True, capture_output=True)
+    diff = _get_staged_diff(max_chars=2000)
+    assert "diff --git a/sub/app.py b/sub/app.py" in diff
+    assert "uv.lock" not in diff
+
+
+def test_diff_budget_scales_with_model_context():
+    from entirecontext.cli.futures_cmds import _MAX_DIFF_CHARS, _diff_budget
+
+    assert _diff_budget("gpt-4o-mini") > _diff_budget("gpt-3.5-turbo") > _MAX_DIFF_CHARS
+    assert _diff_budget("openai/gpt-4o-mini") == _diff_budget("gpt-4o-mini")
+    assert _diff_budget("gpt-3.5-turbo", reserved=1000) == _diff_budget("gpt-3.5-turbo") - 1000
+    assert _diff_budget("some-unknown-model") == _MAX_DIFF_CHARS
+
+
+def test_assess_releases_db_during_llm_call(ec_repo, monkeypatch):
+    monkeypatch.chdir(ec_repo)
+    opened = []
+
+    def tracking_get_db(repo_path):
+        conn = get_db(repo_path)
+        opened.append(conn)
+        return conn
+
+    def fake_llm(*args):
+        for conn in opened:
+            try:
+                conn.execute("SELECT 1")
+            except Exception:
+                continue
+            raise AssertionError("DB connection held open during LLM call")
+        return {"verdict": "neutral", "impact_summary": "ok"}
+
+    with (
+        patch("entirecontext.db.get_db", side_effect=tracking_get_db),
+        patch("entirecontext.cli.futures_cmds._get_staged_diff", return_value="diff text"),
+        patch("entirecontext.cli.futures_cmds._call_llm", side_effect=fake_llm),
+    ):
+        result = runner.invoke(app, ["futures", "assess"])
+    assert result.exit_code == 0, result.output
+    assert len(opened) == 2
+
+
 def test_assess_llm_error(ec_repo, monkeypatch):
     monkeypatch.chdir(ec_repo)
     with (
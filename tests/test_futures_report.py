@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 from typer.testing import CliRunner
 
 from entirecontext.cli import app
-from entirecontext.core.report import generate_futures_report
+from entirecontext.core.report import generate_futures_report, iter_futures_report
 
 runner = CliRunner()
 
@@ -64,6 +64,13 @@ class TestGenerateFuturesReport:
         result = generate_futures_report(assessments)
         assert isinstance(result, str)
 
+    def test_iter_chunks_join_to_the_report(self):
+        with patch("entirecontext.core.report._iso_now", return_value="2025-01-01T00:00:00+00:00"):
+            for assessments in (_make_assessments_varied(), []):
+                chunks = list(iter_futures_report(assessments, project_name="p", since="2025-01-01"))
+                assert len(chunks) > 1
+                assert "".join(chunks) == generate_futures_report(assessments, project_name="p", since="2025-01-01")
+
     def test_empty_assessments_returns_no_data_message(self):
         result = generate_futures_report([])
         assert "no" in result.lower() or "empty" in result.lower() or "0" in result
@@ -37,6 +37,13 @@ class TestHookHandle:
             assert result.exit_code == 0
             mock_handle.assert_called_once()
 
+    def test_parsed_payload_is_passed_without_rereading_stdin(self):
+        for stdin, expected in (('{"session_id": "s1"}', {"session_id": "s1"}), ("not json", {}), ("", {})):
+            with patch("entirecontext.hooks.handler.handle_hook", return_value=0) as mock_handle:
+                result = runner.invoke(app, ["hook", "handle", "--type", "Stop"], input=stdin)
+                assert result.exit_code == 0
+                assert mock_handle.call_args.kwargs["data"] == expected
+
     def test_nonzero_exit_code(self):
         with patch("entirecontext.hooks.handler.handle_hook", return_value=2):
             result = runner.invoke(app, ["hook", "handle", "--type", "UserPromptSubmit"], input="{}")
@@ -203,6 +203,26 @@ class TestImportFromAline:
         commit_hashes = {c["git_commit_hash"] for c in checkpoints}
         assert commit_hashes == {"abc123", "def456"}
 
+    def test_imported_rows_are_searchable_without_rebuild(self, ec_db, ec_repo, aline_db):
+        from entirecontext.core.import_aline import import_from_aline
+        from entirecontext.core.search import fts_search
+
+        project_id = ec_db.execute("SELECT id FROM projects").fetchone()["id"]
+        import_from_aline(ec_db, aline_db["path"], project_id, str(ec_repo))
+
+        assert fts_search(ec_db, "tests", target="turn")
+        assert fts_search(ec_db, "Sprint", target="event")
+
+    def test_errors_are_counted_but_capped(self):
+        from entirecontext.core.import_aline import ImportResult
+
+        result = ImportResult()
+        for i in range(25):
+            result.add_error(f"row {i}")
+        result.add_error("fatal", keep=True)
+        assert result.error_count == 26
+        assert result.errors == [f"row {i}" for i in range(10)] + ["fatal"]
+
     def test_idempotent(self, ec_db, ec_repo, aline_db):
         from entirecontext.core.import_aline import import_from_aline
 
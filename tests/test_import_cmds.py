@@ -45,7 +45,6 @@ class TestImportCmds:
         monkeypatch.chdir(ec_repo)
         mock_result = ImportResult(sessions=2, turns=5, turn_content=3, checkpoints=1, events=1, event_links=1)
         monkeypatch.setattr("entirecontext.core.import_aline.import_from_aline", lambda **kwargs: mock_result)
-        monkeypatch.setattr("entirecontext.core.search.rebuild_fts_indexes", lambda conn: None)
 
         result = runner.invoke(app, ["import", "--from-aline", "/tmp/fake.db"])
         assert result.exit_code == 0
@@ -64,28 +63,24 @@ class TestImportCmds:
         assert "error1" in result.output
         assert "error2" in result.output
 
-    def test_import_fts_rebuild_called(self, ec_repo, monkeypatch):
+    def test_import_reports_uncapped_error_count(self, ec_repo, monkeypatch):
         monkeypatch.chdir(ec_repo)
-        mock_result = ImportResult(sessions=1, turns=1)
+        mock_result = ImportResult(errors=["error1"], error_count=500)
         monkeypatch.setattr("entirecontext.core.import_aline.import_from_aline", lambda **kwargs: mock_result)
-        rebuild_mock = MagicMock()
-        monkeypatch.setattr("entirecontext.core.search.rebuild_fts_indexes", rebuild_mock)
 
         result = runner.invoke(app, ["import", "--from-aline", "/tmp/fake.db"])
-        assert result.exit_code == 0
-        rebuild_mock.assert_called_once()
-        assert "FTS indexes rebuilt" in result.output
+        assert result.exit_code == 1
+        assert "Errors (500)" in result.output
+        assert "and 499 more" in result.output
 
-    def test_import_fts_rebuild_exception_ignored(self, ec_repo, monkeypatch):
+    def test_import_does_not_rebuild_fts(self, ec_repo, monkeypatch):
         monkeypatch.chdir(ec_repo)
         mock_result = ImportResult(sessions=1, turns=1)
         monkeypatch.setattr("entirecontext.core.import_aline.import_from_aline", lambda **kwargs: mock_result)
-        monkeypatch.setattr(
-            "entirecontext.core.search.rebuild_fts_indexes",
-            MagicMock(side_effect=Exception("FTS rebuild failed")),
-        )
+        rebuild_mock = MagicMock()
+        monkeypatch.setattr("entirecontext.core.search.rebuild_fts_indexes", rebuild_mock)
 
         result = runner.invoke(app, ["import", "--from-aline", "/tmp/fake.db"])
         assert result.exit_code == 0
         assert "Import complete" in result.output
-        assert "FTS indexes rebuilt" not in result.output
+        rebuild_mock.assert_not_called()
@@ -43,7 +43,9 @@ class TestIndexCommand:
             result = runner.invoke(app, ["index", "--semantic"])
             assert result.exit_code == 0
             assert "Generated 25 embeddings" in result.output
-            mock_gen.assert_called_once_with(mock_conn, "/tmp/test", model_name="all-MiniLM-L6-v2", force=False)
+            mock_gen.assert_called_once_with(
+                mock_conn, "/tmp/test", model_name="all-MiniLM-L6-v2", force=False, device=None
+            )
 
     def test_semantic_import_error(self):
         mock_conn = MagicMock()
@@ -72,7 +74,9 @@ class TestIndexCommand:
         ):
             result = runner.invoke(app, ["index", "--semantic", "--force"])
             assert result.exit_code == 0
-            mock_gen.assert_called_once_with(mock_conn, "/tmp/test", model_name="all-MiniLM-L6-v2", force=True)
+            mock_gen.assert_called_once_with(
+                mock_conn, "/tmp/test", model_name="all-MiniLM-L6-v2", force=True, device=None
+            )
 
     def test_custom_model(self):
         mock_conn = MagicMock()
@@ -85,4 +89,18 @@ class TestIndexCommand:
         ):
             result = runner.invoke(app, ["index", "--semantic", "--model", "custom-model"])
             assert result.exit_code == 0
-            mock_gen.assert_called_once_with(mock_conn, "/tmp/test", model_name="custom-model", force=False)
+            mock_gen.assert_called_once_with(
+                mock_conn, "/tmp/test", model_name="custom-model", force=False, device=None
+            )
+
+    def test_device_option(self):
+        mock_conn = MagicMock()
+        with (
+            patch("entirecontext.core.project.find_git_root", return_value="/tmp/test"),
+            patch("entirecontext.db.get_db", return_value=mock_conn),
+            patch("entirecontext.core.search.rebuild_fts_indexes", return_value={}),
+            patch("entirecontext.core.embedding.generate_embeddings", return_value=10) as mock_gen,
+        ):
+            result = runner.invoke(app, ["index", "--semantic", "--device", "cuda"])
+            assert result.exit_code == 0
+            assert mock_gen.call_args.kwargs["device"] == "cuda"
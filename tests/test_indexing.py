@@ -131,6 +131,20 @@ class TestAttribution:
         assert summary["agent_pct"] == pytest.approx(66.7, abs=0.1)
         assert "Claude" in summary["agents"]
 
+    def test_get_file_attribution_summary_aggregates_per_agent(self, db):
+        self._seed_attributions(db)
+        insert = (
+            "INSERT INTO attributions (id, checkpoint_id, file_path, start_line, end_line, attribution_type, agent_id) "
+            "VALUES (?, 'cp1', 'src/main.py', ?, ?, ?, ?)"
+        )
+        db.execute(insert, ("at4", 31, 35, "agent", "a1"))
+        db.execute(insert, ("at5", 36, 40, "human", None))
+        db.execute(insert, ("at6", 41, 42, "agent", None))
+        summary = get_file_attribution_summary(db, "src/main.py")
+        assert summary["human_lines"] == 15
+        assert summary["agent_lines"] == 27
+        assert summary["agents"] == {"Claude": 25, "unknown": 2}
+
     def test_get_file_attribution_summary_empty(self, db):
         summary = get_file_attribution_summary(db, "nonexistent.py")
         assert summary["total_lines"] == 0
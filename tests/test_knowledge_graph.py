@@ -260,6 +260,14 @@ class TestBuildKnowledgeGraphFilters:
         assert ids["s1"] in session_ids
         assert ids["s2"] not in session_ids
 
+    def test_session_filter_restricts_agents_and_checkpoints(self, ec_repo, ec_db):
+        ids = _seed_graph_db(ec_repo, ec_db)
+        graph = build_knowledge_graph(ec_db, session_id=ids["s2"])
+        node_ids = {n["id"] for n in graph["nodes"]}
+        assert ids["agent2"] in node_ids
+        assert ids["agent1"] not in node_ids
+        assert "chk-1" not in node_ids
+
     def test_limit_caps_total_turns(self, ec_repo, ec_db):
         _seed_graph_db(ec_repo, ec_db)
         graph = build_knowledge_graph(ec_db, limit=1)
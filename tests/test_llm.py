@@ -68,25 +68,26 @@ class TestStripMarkdownFences:
     def test_empty_string(self):
         assert strip_markdown_fences("") == ""
 
+    def test_surrounding_whitespace_and_unclosed_fence(self):
+        assert strip_markdown_fences('\n```json\n{"a": 1}\n```\n') == '{"a": 1}'
+        assert strip_markdown_fences('```\n{"a": 1}') == '{"a": 1}'
+
 
 class TestOpenAIBackendComplete:
     def test_success(self, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         backend = OpenAIBackend()
-        response_body = json.dumps({"choices": [{"message": {"content": "test response"}}]}).encode()
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = response_body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        with patch("entirecontext.core.llm.urlopen", return_value=mock_resp) as mock_urlopen:
+        response = {"choices": [{"message": {"content": "test response"}}]}
+        with patch("entirecontext.core.llm._post_json", return_value=response) as mock_post:
             result = backend.complete("system prompt", "user prompt")
             assert result == "test response"
-            mock_urlopen.assert_called_once()
+            mock_post.assert_called_once()
+            assert mock_post.call_args.kwargs["headers"] == {"Authorization": "Bearer test-key"}
 
     def test_http_error(self, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         backend = OpenAIBackend()
-        with patch("entirecontext.core.llm.urlopen", side_effect=URLError("connection refused")):
+        with patch("entirecontext.core.llm._post_json", side_effect=URLError("connection refused")):
             with pytest.raises(URLError):
                 backend.complete("system prompt", "user prompt")
 
@@ -132,26 +133,84 @@ class TestCLIBackendComplete:
 class TestOllamaBackendComplete:
     def test_success(self):
         backend = OllamaBackend()
-        response_body = json.dumps({"message": {"content": "ollama response"}}).encode()
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = response_body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        with patch("entirecontext.core.llm.urlopen", return_value=mock_resp):
+        with patch("entirecontext.core.llm._post_json", return_value={"message": {"content": "ollama response"}}):
             result = backend.complete("system", "user")
             assert result == "ollama response"
 
+    def test_reuses_keep_alive_connection(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        connections = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                connections.append(self.client_address)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body = json.dumps({"message": {"content": "ok"}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            backend = OllamaBackend(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+            assert backend.complete("system", "user") == "ok"
+            assert backend.complete("system", "user") == "ok"
+            assert len(connections) == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_routes_through_configured_proxy(self, monkeypatch):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        proxied_paths = []
+
+        class ProxyHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                proxied_paths.append(self.path)
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body = json.dumps({"message": {"content": "via proxy"}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ProxyHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        for var in ("no_proxy", "NO_PROXY", "http_proxy"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_address[1]}")
+        try:
+            backend = OllamaBackend(base_url="http://ollama.internal:11434")
+            assert backend.complete("system", "user") == "via proxy"
+            assert proxied_paths == ["http://ollama.internal:11434/api/chat"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
 
 class TestGitHubModelsBackendComplete:
     def test_success(self, monkeypatch):
         monkeypatch.setenv("GITHUB_TOKEN", "ghp-test-token")
         backend = GitHubModelsBackend()
-        response_body = json.dumps({"choices": [{"message": {"content": "github response"}}]}).encode()
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = response_body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        with patch("entirecontext.core.llm.urlopen", return_value=mock_resp):
+        response = {"choices": [{"message": {"content": "github response"}}]}
+        with patch("entirecontext.core.llm._post_json", return_value=response):
             result = backend.complete("system", "user")
             assert result == "github response"
 
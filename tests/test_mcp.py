@@ -837,7 +837,7 @@ class TestMCPAssessAndFeedback:
 
         distill_calls = []
 
-        def mock_auto_distill(repo_path):
+        def mock_auto_distill(repo_path, conn=None):
             distill_calls.append(str(repo_path))
             return True
 
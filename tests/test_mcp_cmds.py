@@ -23,3 +23,9 @@ class TestMcpServe:
             result = runner.invoke(app, ["mcp", "serve"])
             assert result.exit_code == 0
             mock_run.assert_called_once()
+
+    def test_unrelated_import_error_is_not_masked(self):
+        with patch("entirecontext.mcp.server.run_server", side_effect=ImportError("boom", name="some_dep")):
+            result = runner.invoke(app, ["mcp", "serve"])
+            assert isinstance(result.exception, ImportError)
+            assert "MCP not available" not in result.output
@@ -0,0 +1,30 @@
+"""Tests for schema v17 to v18 migration."""
+
+from entirecontext.db.connection import get_memory_db
+from entirecontext.db.migration import apply_migrations
+
+
+def test_attribution_file_index_becomes_composite():
+    conn = get_memory_db()
+    conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT, description TEXT)")
+    conn.execute("INSERT INTO schema_version (version, description) VALUES (17, 'v17')")
+    conn.execute(
+        "CREATE TABLE attributions (id TEXT PRIMARY KEY, file_path TEXT NOT NULL, "
+        "start_line INTEGER NOT NULL, end_line INTEGER NOT NULL)"
+    )
+    conn.execute("CREATE INDEX idx_attributions_file ON attributions(file_path)")
+
+    apply_migrations(conn, 17, 18)
+
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(attributions)")}
+    assert "idx_attributions_file_lines" in indexes
+    assert "idx_attributions_file" not in indexes
+    plan = " ".join(
+        row[3]
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM attributions WHERE file_path = ? AND start_line <= ? ORDER BY start_line",
+            ("a.py", 20),
+        )
+    )
+    assert "idx_attributions_file_lines" in plan
+    conn.close()
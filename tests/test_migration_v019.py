@@ -0,0 +1,36 @@
+"""Tests for schema v18 to v19 migration."""
+
+import pytest
+
+from entirecontext.db.connection import get_memory_db
+from entirecontext.db.migration import apply_migrations
+
+
+@pytest.mark.parametrize(
+    ("where", "params", "index"),
+    [
+        ("WHERE status = ? AND event_type = ?", ("active", "task"), "idx_events_status_type_created"),
+        ("WHERE status = ?", ("frozen",), "idx_events_status_created"),
+        ("", (), "idx_events_created"),
+    ],
+)
+def test_event_listing_uses_index_without_sort(where, params, index):
+    conn = get_memory_db()
+    conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT, description TEXT)")
+    conn.execute("INSERT INTO schema_version (version, description) VALUES (18, 'v18')")
+    conn.execute(
+        "CREATE TABLE events (id TEXT PRIMARY KEY, title TEXT NOT NULL, event_type TEXT NOT NULL, "
+        "status TEXT NOT NULL DEFAULT 'active', created_at TEXT)"
+    )
+
+    apply_migrations(conn, 18, 19)
+
+    plan = " ".join(
+        row[3]
+        for row in conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM events {where} ORDER BY created_at DESC LIMIT ?", (*params, 20)
+        )
+    )
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
+    conn.close()
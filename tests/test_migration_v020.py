@@ -0,0 +1,73 @@
+"""Tests for schema v19 to v20 migration."""
+
+import pytest
+
+from entirecontext.core.event import iter_events
+from entirecontext.core.futures import iter_assessments
+from entirecontext.db.connection import get_memory_db
+from entirecontext.db.migration import apply_migrations
+
+
+class _RecordingConnection:
+    """Capture the SQL a listing helper emits without running it."""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, query, params=()):
+        self.calls.append((query, tuple(params)))
+        return iter(())
+
+
+@pytest.fixture
+def v19_conn():
+    conn = get_memory_db()
+    conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT, description TEXT)")
+    conn.execute("INSERT INTO schema_version (version, description) VALUES (19, 'v19')")
+    conn.execute(
+        "CREATE TABLE events (id TEXT PRIMARY KEY, title TEXT NOT NULL, event_type TEXT NOT NULL, "
+        "status TEXT NOT NULL DEFAULT 'active', created_at TEXT)"
+    )
+    conn.execute("CREATE INDEX idx_events_status_type_created ON events(status, event_type, created_at DESC)")
+    conn.execute("CREATE INDEX idx_events_status_created ON events(status, created_at DESC)")
+    conn.execute("CREATE INDEX idx_events_created ON events(created_at DESC)")
+    conn.execute("CREATE TABLE assessments (id TEXT PRIMARY KEY, verdict TEXT, created_at TEXT)")
+    conn.execute("CREATE INDEX idx_assessments_created ON assessments(created_at DESC)")
+    apply_migrations(conn, 19, 20)
+    yield conn
+    conn.close()
+
+
+def _plan(conn, recorder):
+    ((query, params),) = recorder.calls
+    return " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "index"),
+    [
+        ({"status": "active", "event_type": "task"}, "idx_events_status_type_created"),
+        ({"status": "frozen"}, "idx_events_status_created"),
+        ({}, "idx_events_created"),
+        ({"before": "2026-01-01", "before_id": "abc"}, "idx_events_created"),
+        ({"status": "active", "before": "2026-01-01", "before_id": "abc"}, "idx_events_status_created"),
+    ],
+)
+def test_event_listing_uses_index_without_sort(v19_conn, kwargs, index):
+    recorder = _RecordingConnection()
+    iter_events(recorder, **kwargs)
+    plan = _plan(v19_conn, recorder)
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"since": "2026-01-01"}, {"before": "2026-01-01", "before_id": "abc"}],
+)
+def test_assessment_listing_uses_index_without_sort(v19_conn, kwargs):
+    recorder = _RecordingConnection()
+    iter_assessments(recorder, **kwargs)
+    plan = _plan(v19_conn, recorder)
+    assert "idx_assessments_created" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,36 @@
+"""Guard test: the lazily-dispatched CLI package has exactly one module per command group.
+
+``entirecontext.cli`` resolves top-level commands through ``_COMMAND_MODULES``
+and imports the target module on first use. A second copy of a command module
+(e.g. a leftover stub shadowing the real one in a nested directory) would make
+dispatch depend on import order, so every module basename under ``cli/`` must
+be unique and every dispatch target must be a real module exposing
+``register(app)``.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections import Counter
+from pathlib import Path
+
+CLI_DIR = Path(__file__).resolve().parent.parent / "src" / "entirecontext" / "cli"
+
+
+def test_cli_module_basenames_are_unique():
+    names = Counter(path.stem for path in CLI_DIR.rglob("*.py") if path.stem != "__init__")
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    assert duplicates == [], f"duplicate CLI modules: {duplicates}"
+
+
+def test_cli_package_has_single_init():
+    assert [p.relative_to(CLI_DIR) for p in CLI_DIR.rglob("__init__.py")] == [Path("__init__.py")]
+
+
+def test_every_dispatch_target_is_a_real_command_module():
+    from entirecontext.cli import _COMMAND_MODULES
+
+    for module_name in set(_COMMAND_MODULES.values()):
+        assert (CLI_DIR / f"{module_name}.py").is_file(), module_name
+        module = importlib.import_module(f"entirecontext.cli.{module_name}")
+        assert callable(getattr(module, "register", None)), module_name
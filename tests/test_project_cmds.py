@@ -223,6 +223,14 @@ class TestGitHooksInstallation:
         assert "EntireContext" in content
         assert "sync --if-enabled" in content
 
+    def test_hook_scripts_share_ec_executable(self):
+        from entirecontext.cli.project_cmds import _ec_executable, _git_hook_scripts
+
+        scripts = _git_hook_scripts()
+        assert f"{_ec_executable()} hook handle --type PostCommit\n" in scripts["post-commit"]
+        assert f"{_ec_executable()} sync --if-enabled\n" in scripts["pre-push"]
+        assert "hook handle" not in scripts["pre-push"]
+
 
 def _setup_fake_home_with_mcp(ec_repo, monkeypatch):
     """Set up a fake HOME with MCP config for doctor tests."""
@@ -387,6 +395,73 @@ class TestEnableDisableRoundTrip:
         assert any("other-tool" in h.get("command", "") for h in session_start_hooks)
         assert any(_is_ec_hook(h) for h in session_start_hooks)
 
+    @patch("entirecontext.core.project.find_git_root")
+    def test_failed_write_leaves_settings_intact(self, mock_git_root, tmp_path, monkeypatch):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / ".git" / "hooks").mkdir(parents=True)
+        mock_git_root.return_value = str(repo)
+        monkeypatch.setenv("HOME", str(tmp_path / "fakehome"))
+
+        settings_path = repo / ".claude" / "settings.local.json"
+        settings_path.parent.mkdir(parents=True)
+        original = json.dumps({"hooks": {}, "keep": True})
+        settings_path.write_text(original)
+
+        with patch("entirecontext.core.config.os.replace", side_effect=OSError("disk full")):
+            runner.invoke(app, ["enable", "--no-git-hooks"])
+
+        assert settings_path.read_text() == original
+
+    @patch("entirecontext.core.project.find_git_root")
+    def test_enable_both_looks_up_ec_once(self, mock_git_root, tmp_path, monkeypatch):
+        from entirecontext.cli.project_cmds import _ec_bin, _git_hook_scripts
+
+        repo = tmp_path / "repo"
+        (repo / ".git" / "hooks").mkdir(parents=True)
+        mock_git_root.return_value = str(repo)
+        monkeypatch.setenv("HOME", str(tmp_path / "fakehome"))
+
+        _ec_bin.cache_clear()
+        _git_hook_scripts.cache_clear()
+        try:
+            with patch("entirecontext.cli.project_cmds.shutil.which", return_value=None) as mock_which:
+                result = runner.invoke(app, ["enable", "--agent", "both"])
+            assert result.exit_code == 0
+            mock_which.assert_called_once_with("ec")
+        finally:
+            _ec_bin.cache_clear()
+            _git_hook_scripts.cache_clear()
+
+    @patch("entirecontext.core.project.find_git_root")
+    def test_disable_without_settings_files_creates_none(self, mock_git_root, tmp_path, monkeypatch):
+        repo = tmp_path / "repo"
+        (repo / ".git" / "hooks").mkdir(parents=True)
+        mock_git_root.return_value = str(repo)
+        monkeypatch.setenv("HOME", str(tmp_path / "fakehome"))
+
+        result = runner.invoke(app, ["disable"])
+        assert result.exit_code == 0
+        assert "No EntireContext hooks found" in result.output
+        assert not (repo / ".claude").exists()
+
+    @patch("entirecontext.core.project.find_git_root")
+    def test_disable_leaves_foreign_settings_untouched(self, mock_git_root, tmp_path, monkeypatch):
+        repo = tmp_path / "repo"
+        (repo / ".git" / "hooks").mkdir(parents=True)
+        mock_git_root.return_value = str(repo)
+        monkeypatch.setenv("HOME", str(tmp_path / "fakehome"))
+
+        settings_path = repo / ".claude" / "settings.local.json"
+        settings_path.parent.mkdir(parents=True)
+        original = json.dumps({"hooks": {"Stop": [{"command": "other-tool run"}], "SessionEnd": []}})
+        settings_path.write_text(original)
+
+        result = runner.invoke(app, ["disable"])
+        assert result.exit_code == 0
+        assert "No EntireContext hooks found" in result.output
+        assert settings_path.read_text() == original
+
 
 class TestCodexIntegration:
     @patch("entirecontext.core.project.find_git_root")
@@ -538,3 +613,29 @@ class TestCodexIntegration:
 
         result = runner.invoke(app, ["doctor", "--agent", "codex"])
         assert "codex" in result.output.lower()
+
+
+class TestStatusCodexCounts:
+    def test_codex_counts_include_sessions_without_turns(self, ec_repo, ec_db, monkeypatch):
+        from entirecontext.core.session import create_session
+        from entirecontext.core.turn import create_turn
+
+        project_id = ec_db.execute("SELECT id FROM projects LIMIT 1").fetchone()["id"]
+        create_session(ec_db, project_id, session_type="codex", session_id="cx1")
+        create_session(ec_db, project_id, session_type="codex", session_id="cx2")
+        create_session(ec_db, project_id, session_id="cl1")
+        create_turn(ec_db, "cx1", 1, user_message="a")
+        create_turn(ec_db, "cx1", 2, user_message="b")
+        create_turn(ec_db, "cl1", 1, user_message="c")
+        ec_db.commit()
+
+        monkeypatch.chdir(ec_repo)
+        result = runner.invoke(app, ["status", "--agent", "codex"])
+        assert result.exit_code == 0
+        lines = {
+            line.split("│")[1].strip(): line.split("│")[2].strip()
+            for line in result.output.splitlines()
+            if line.count("│") >= 3
+        }
+        assert lines["Codex Sessions"] == "2"
+        assert lines["Codex Turns"] == "2"
@@ -97,6 +97,33 @@ class TestResolveId:
         assert resolve_checkpoint_id(resolve_conn, "chk-") == "chk-aabbccdd"
         assert resolve_assessment_id(resolve_conn, "aaa-") == "aaa-bbb-ccc"
 
+    def test_exact_match_wins_over_longer_ids(self, resolve_conn):
+        from entirecontext.core.resolve import resolve_id
+
+        resolve_conn.execute("INSERT INTO decisions VALUES ('abc')")
+        assert resolve_id(resolve_conn, "decisions", "abc") == "abc"
+
+    def test_prefix_lookup_seeks_the_index(self, resolve_conn):
+        from entirecontext.core.resolve import prefix_range
+
+        plan = resolve_conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM decisions WHERE id >= ? AND id < ? ORDER BY id LIMIT 1",
+            prefix_range("abc"),
+        ).fetchall()
+        assert "SEARCH" in plan[0]["detail"]
+        assert prefix_range("abc") == ("abc", "abd")
+
+    def test_prefix_ending_in_max_code_point(self, resolve_conn):
+        from entirecontext.core.resolve import prefix_range, resolve_id
+
+        top = "\U0010ffff"
+        assert prefix_range("ab" + top) == ("ab" + top, "ac")
+        for decision_id in ("ab" + top + "x", top + top, "zz"):
+            resolve_conn.execute("INSERT INTO decisions (id) VALUES (?)", (decision_id,))
+        assert resolve_id(resolve_conn, "decisions", "ab" + top) == "ab" + top + "x"
+        assert resolve_id(resolve_conn, "decisions", top) == top + top
+        assert resolve_id(resolve_conn, "decisions", "") is not None
+
 
 class TestEscapeLike:
     def test_percent_escaped(self):
@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from entirecontext.cli import app
@@ -288,23 +289,6 @@ class TestFuturesTidyPrCLI:
         assert mock_gen.call_args.kwargs.get("limit") == 5
 
 
-class _FakeResponse:
-    def __init__(self, payload, status=200):
-        self._payload = payload
-        self.status = status
-
-    def read(self):
-        if isinstance(self._payload, bytes):
-            return self._payload
-        return self._payload.encode("utf-8")
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
-
-
 class TestTidyPilotDiffChunking:
     def test_each_chunk_respects_max_chars_when_grouping_files(self):
         module = _load_assess_pr_module()
@@ -341,43 +325,290 @@ class TestTidyPilotDiffChunking:
         assert all(len(chunk) <= 120 for chunk in chunks)
         assert module.DIFF_OMISSION_MARKER.strip() in chunks[-1]
 
+    def test_streamed_lines_stop_being_consumed_after_chunk_cap(self):
+        module = _load_assess_pr_module()
+        consumed = []
+
+        def lines():
+            for i in range(100):
+                for line in (f"diff --git a/file{i}.py b/file{i}.py\n", f"+{'x' * 40}\n"):
+                    consumed.append(line)
+                    yield line
+
+        chunks = module.chunk_diff_lines(lines(), 120, max_chunks=2)
+
+        assert len(chunks) == 2
+        assert module.DIFF_OMISSION_MARKER.strip() in chunks[-1]
+        assert len(consumed) < 20
+
+    def test_read_text_capped_reports_truncation(self, tmp_path):
+        module = _load_assess_pr_module()
+        path = tmp_path / "ROADMAP.md"
+        path.write_text("a" * 50, encoding="utf-8")
+
+        assert module.read_text_capped(path, 50) == ("a" * 50, False)
+        assert module.read_text_capped(path, 10) == ("a" * 10, True)
+
+
+class TestTidyPilotTrivialDiff:
+    @staticmethod
+    def _diff(path, *changes):
+        return [f"diff --git a/{path} b/{path}\n", f"--- a/{path}\n", f"+++ b/{path}\n", "@@ -1 +1 @@\n", *changes]
+
+    def test_empty_diff_is_trivial(self):
+        module = _load_assess_pr_module()
+        assert module.classify_trivial_diff([]) == "empty diff"
+
+    def test_docs_only_diff_is_trivial(self):
+        module = _load_assess_pr_module()
+        lines = self._diff("README.md", "+new docs\n") + self._diff("uv.lock", "-old = 1\n", "+new = 2\n")
+        assert module.classify_trivial_diff(lines) == "only files matching skip paths changed"
+
+    def test_comment_only_change_is_trivial(self):
+        module = _load_assess_pr_module()
+        lines = self._diff("src/app.py", " def f():\n", "+    # explain f\n", "+\n")
+        assert module.classify_trivial_diff(lines) == "comment or whitespace-only change"
+
+    def test_code_change_needs_assessment(self):
+        module = _load_assess_pr_module()
+        lines = self._diff("README.md", "+docs\n") + self._diff("src/app.py", "+    return 1\n")
+        assert module.classify_trivial_diff(lines) is None
+
+    def test_binary_only_diff_needs_assessment(self):
+        module = _load_assess_pr_module()
+        lines = [
+            "diff --git a/src/logo.png b/src/logo.png\n",
+            "index 1111111..2222222 100644\n",
+            "Binary files a/src/logo.png and b/src/logo.png differ\n",
+        ]
+        assert module.classify_trivial_diff(lines) is None
+
+    def test_rename_only_diff_needs_assessment(self):
+        module = _load_assess_pr_module()
+        lines = self._diff("README.md", "+docs\n") + [
+            "diff --git a/src/old.py b/src/new.py\n",
+            "similarity index 100%\n",
+            "rename from src/old.py\n",
+            "rename to src/new.py\n",
+        ]
+        assert module.classify_trivial_diff(lines) is None
+
+
+class TestTidyPilotArgs:
+    def test_parses_options_in_any_order(self):
+        module = _load_assess_pr_module()
+        argv = ["--repo", "o/r", "--pr-title", "Fix it", "--pr-number", "12"]
+        assert module.parse_args(argv) == (12, "Fix it", "o/r")
+        assert module.parse_args(["--pr-number", "3", "--repo", "o/r"]) == (3, "", "o/r")
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["--pr-number", "3"], ["--pr-number", "x", "--repo", "o/r"], ["--repo"], ["--repo", "o/r", "--bogus", "1"]],
+    )
+    def test_invalid_arguments_exit(self, argv):
+        module = _load_assess_pr_module()
+        with pytest.raises(SystemExit):
+            module.parse_args(argv)
+
 
 class TestTidyPilotStickyComment:
     def test_posts_comment_when_no_existing_sticky_comment(self, monkeypatch):
         module = _load_assess_pr_module()
         calls = []
 
-        def fake_urlopen(req):
-            calls.append(req)
-            if req.get_method() == "GET":
-                return _FakeResponse("[]")
-            return _FakeResponse("{}", status=201)
+        def fake_http_request(method, url, *, headers, body=None):
+            calls.append((method, url))
+            if method == "GET":
+                return 200, b"[]"
+            return 201, b"{}"
 
         monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-        with patch.object(module, "urlopen", side_effect=fake_urlopen):
+        with patch.object(module, "http_request", side_effect=fake_http_request):
             module.comment_on_pr("owner/repo", 12, f"{module.COMMENT_MARKER}\nbody")
 
         assert len(calls) == 2
-        assert calls[0].get_method() == "GET"
-        assert calls[1].get_method() == "POST"
-        assert calls[1].full_url == "https://api.github.com/repos/owner/repo/issues/12/comments"
+        assert calls[0][0] == "GET"
+        assert calls[1] == ("POST", "https://api.github.com/repos/owner/repo/issues/12/comments")
 
     def test_updates_existing_sticky_comment(self, monkeypatch):
         module = _load_assess_pr_module()
         calls = []
 
-        def fake_urlopen(req):
-            calls.append(req)
-            if req.get_method() == "GET":
-                body = json.dumps([{"id": 77, "body": f"old\n{module.COMMENT_MARKER}"}])
-                return _FakeResponse(body)
-            return _FakeResponse("{}", status=200)
+        def fake_http_request(method, url, *, headers, body=None):
+            calls.append((method, url))
+            if method == "GET":
+                return 200, json.dumps([{"id": 77, "body": f"old\n{module.COMMENT_MARKER}"}]).encode()
+            return 200, b"{}"
 
         monkeypatch.setenv("GITHUB_TOKEN", "test-token")
-        with patch.object(module, "urlopen", side_effect=fake_urlopen):
+        with patch.object(module, "http_request", side_effect=fake_http_request):
             module.comment_on_pr("owner/repo", 12, f"{module.COMMENT_MARKER}\nbody")
 
         assert len(calls) == 2
-        assert calls[0].get_method() == "GET"
-        assert calls[1].get_method() == "PATCH"
-        assert calls[1].full_url == "https://api.github.com/repos/owner/repo/issues/comments/77"
+        assert calls[0][0] == "GET"
+        assert calls[1] == ("PATCH", "https://api.github.com/repos/owner/repo/issues/comments/77")
+
+
+class _FakeHTTPResponse:
+    def __init__(self, status=200, payload=b"{}"):
+        self.status = status
+        self.reason = "OK"
+        self.headers = {}
+        self._payload = payload
+
+    def read(self):
+        return self._payload
+
+
+class TestTidyPilotHttpConnectionReuse:
+    def test_requests_to_same_host_share_one_connection(self, monkeypatch):
+        module = _load_assess_pr_module()
+        created = []
+
+        class FakeConnection:
+            def __init__(self, host):
+                self.host = host
+                self.requests = []
+                created.append(self)
+
+            def request(self, method, path, body=None, headers=None):
+                self.requests.append((method, path))
+
+            def getresponse(self):
+                return _FakeHTTPResponse()
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(module.http.client, "HTTPSConnection", FakeConnection)
+        module.http_request("GET", "https://api.github.com/repos/o/r/issues/1/comments?page=1", headers={})
+        module.http_request("POST", "https://api.github.com/repos/o/r/issues/1/comments", headers={}, body=b"{}")
+
+        assert len(created) == 1
+        assert created[0].requests == [
+            ("GET", "/repos/o/r/issues/1/comments?page=1"),
+            ("POST", "/repos/o/r/issues/1/comments"),
+        ]
+
+    def test_error_status_raises_http_error(self, monkeypatch):
+        import urllib.error
+
+        module = _load_assess_pr_module()
+
+        class FakeConnection:
+            def __init__(self, host):
+                pass
+
+            def request(self, method, path, body=None, headers=None):
+                pass
+
+            def getresponse(self):
+                return _FakeHTTPResponse(status=429)
+
+        monkeypatch.setattr(module.http.client, "HTTPSConnection", FakeConnection)
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            module.http_request("POST", "https://models.github.ai/inference/chat/completions", headers={})
+        assert exc_info.value.code == 429
+
+
+class TestTidyPilotGzipResponses:
+    def test_gzip_body_is_decompressed(self, monkeypatch):
+        import gzip
+
+        module = _load_assess_pr_module()
+        sent_headers = []
+
+        class FakeConnection:
+            def __init__(self, host):
+                pass
+
+            def request(self, method, path, body=None, headers=None):
+                sent_headers.append(headers)
+
+            def getresponse(self):
+                resp = _FakeHTTPResponse(payload=gzip.compress(b'{"ok": true}'))
+                resp.headers = {"Content-Encoding": "gzip"}
+                return resp
+
+        monkeypatch.setattr(module.http.client, "HTTPSConnection", FakeConnection)
+        monkeypatch.setattr(module, "_CONNECTIONS", {})
+        status, body = module.http_request("GET", "https://api.github.com/x", headers={"A": "b"})
+
+        assert (status, module.json_loads(body)) == (200, {"ok": True})
+        assert sent_headers[0] == {"A": "b", "Accept-Encoding": "gzip"}
+
+
+class TestTidyPilotStreaming:
+    def test_sse_deltas_are_joined_until_done(self):
+        module = _load_assess_pr_module()
+        lines = [
+            b": keep-alive\n",
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n',
+            b"\n",
+            b'data: {"choices": [{"delta": {"content": "{\\"verdict\\": "}}]}\n',
+            b'data: {"choices": [{"delta": {"content": "\\"narrow\\"}"}}]}\n',
+            b'data: {"choices": []}\n',
+            b"data: [DONE]\n",
+            b'data: {"choices": [{"delta": {"content": "ignored"}}]}\n',
+        ]
+        assert module.read_sse_content(lines) == '{"verdict": "narrow"}'
+
+    def test_stream_lines_drains_response_for_reuse(self, monkeypatch):
+        module = _load_assess_pr_module()
+
+        class FakeStreamResponse(_FakeHTTPResponse):
+            def __init__(self):
+                super().__init__(payload=b"")
+                self._lines = [b"data: a\n", b"data: [DONE]\n", b""]
+                self.drained = False
+
+            def readline(self):
+                return self._lines.pop(0)
+
+            def read(self):
+                self.drained = True
+                return b""
+
+        responses = []
+
+        class FakeConnection:
+            def __init__(self, host):
+                pass
+
+            def request(self, method, path, body=None, headers=None):
+                pass
+
+            def getresponse(self):
+                responses.append(FakeStreamResponse())
+                return responses[-1]
+
+        monkeypatch.setattr(module.http.client, "HTTPSConnection", FakeConnection)
+        lines = list(module.http_stream_lines("POST", "https://models.github.ai/x", headers={}))
+
+        assert lines == [b"data: a\n", b"data: [DONE]\n"]
+        assert responses[0].drained
+
+
+class TestTidyPilotResponseCache:
+    def test_repeat_prompt_is_served_from_cache(self, monkeypatch, tmp_path):
+        module = _load_assess_pr_module()
+        calls = []
+
+        def fake_stream(method, url, *, headers, body=None):
+            calls.append(url)
+            content = json.dumps({"verdict": "expand", "analysis": "ok"})
+            yield f"data: {json.dumps({'choices': [{'delta': {'content': content}}]})}\n".encode()
+            yield b"data: [DONE]\n"
+
+        monkeypatch.setenv("GITHUB_TOKEN", "t")
+        monkeypatch.setenv("TIDY_PILOT_BACKEND", "github")
+        monkeypatch.setenv("TIDY_PILOT_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(module, "http_stream_lines", fake_stream)
+
+        first = module.call_llm("system", "user prompt")
+        second = module.call_llm("system", "user prompt")
+
+        assert first == second == {"verdict": "expand", "analysis": "ok"}
+        assert len(calls) == 1
+        module.call_llm("system", "different prompt")
+        assert len(calls) == 2